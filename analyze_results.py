@@ -2,9 +2,92 @@
 """Analyze scraper results to calculate null/empty field percentages."""
 
 import json
+import os
+from itertools import islice
+from multiprocessing import Pool
 from pathlib import Path
 from collections import defaultdict
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Records transposed into columns at a time; bounds memory when streaming
+CHUNK_SIZE = 10000
+
+
+class FieldStat:
+    """Running total/null/empty counts for one field."""
+
+    __slots__ = ('total', 'null', 'empty')
+
+    def __init__(self):
+        self.total = 0
+        self.null = 0
+        self.empty = 0
+
+
+def load_results(filepath: Path):
+    """Load a result JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(filepath.read_bytes())
+    with open(filepath, 'r') as f:
+        return json.load(f)
+
+
+def iter_records(filepath: Path):
+    """Yield records from a result file one at a time.
+
+    With ijson installed the file is stream-parsed so memory stays flat
+    regardless of file size; otherwise the whole file is loaded.
+    """
+    if ijson is not None:
+        with open(filepath, 'rb') as f:
+            yield from ijson.items(f, 'item')
+    else:
+        yield from load_results(filepath)
+
+
+def summarize_file(filename: str):
+    """
+    Count null and empty values per field in one result file.
+
+    Returns (filename, record_count, field_stats) where field_stats maps
+    each field to its FieldStat counts. Runs in a worker process.
+    """
+    field_stats = defaultdict(FieldStat)
+    record_count = 0
+    records = iter_records(Path(filename))
+
+    while True:
+        chunk = list(islice(records, CHUNK_SIZE))
+        if not chunk:
+            break
+        record_count += len(chunk)
+
+        # Transpose the chunk into one list per field so each count below
+        # is a single pass over a column
+        columns = defaultdict(list)
+        for record in chunk:
+            for field, value in record.items():
+                columns[field].append(value)
+
+        for field, column in columns.items():
+            stats = field_stats[field]
+            stats.total += len(column)
+            stats.null += column.count(None)
+            stats.empty += sum(1 for value in column if isinstance(value, str) and not value.strip())
+
+    # Plain dict so the result can be pickled back to the parent
+    return filename, record_count, dict(field_stats)
+
+
 def analyze_results():
     """Analyze all result JSON files and calculate null percentages."""
 
@@ -23,52 +106,46 @@ def analyze_results():
     print("=" * 80)
     print()
 
-    total_stats = defaultdict(lambda: {"total": 0, "null": 0, "empty": 0})
-
-    for filename in result_files:
-        filepath = Path(filename)
-        if not filepath.exists():
-            continue
+    total_stats = defaultdict(FieldStat)
 
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+    existing_files = [filename for filename in result_files if Path(filename).exists()]
 
-        if not data:
-            print(f"⚠️  {filename}: No data")
-            continue
+    # Files are independent, so read, parse and summarize them concurrently in
+    # worker processes (one per file, capped at the CPU count).
+    # imap keeps the report in the same order as result_files.
+    processes = max(1, min(len(existing_files), os.cpu_count() or 1))
+    with Pool(processes) as pool:
+        summaries = pool.imap(summarize_file, existing_files)
 
-        print(f"\n{'─' * 80}")
-        print(f"📄 {filename}")
-        print(f"{'─' * 80}")
-        print(f"Total records: {len(data)}")
-        print()
+        for filename, record_count, field_stats in summaries:
+            if not record_count:
+                print(f"⚠️  {filename}: No data")
+                continue
 
-        # Calculate stats per field
-        field_stats = defaultdict(lambda: {"total": 0, "null": 0, "empty": 0})
+            # Fold this file's counts into the overall totals once per field
+            for field, stats in field_stats.items():
+                totals = total_stats[field]
+                totals.total += stats.total
+                totals.null += stats.null
+                totals.empty += stats.empty
 
-        for record in data:
-            for field, value in record.items():
-                field_stats[field]["total"] += 1
-                total_stats[field]["total"] += 1
-
-                if value is None:
-                    field_stats[field]["null"] += 1
-                    total_stats[field]["null"] += 1
-                elif isinstance(value, str) and value.strip() == "":
-                    field_stats[field]["empty"] += 1
-                    total_stats[field]["empty"] += 1
+            print(f"\n{'─' * 80}")
+            print(f"📄 {filename}")
+            print(f"{'─' * 80}")
+            print(f"Total records: {record_count}")
+            print()
 
-        # Print field-by-field analysis
-        print(f"{'Field':<20} {'Null %':>10} {'Empty %':>10} {'Missing %':>12} {'Total':>8}")
-        print(f"{'-' * 20} {'-' * 10} {'-' * 10} {'-' * 12} {'-' * 8}")
+            # Print field-by-field analysis
+            print(f"{'Field':<20} {'Null %':>10} {'Empty %':>10} {'Missing %':>12} {'Total':>8}")
+            print(f"{'-' * 20} {'-' * 10} {'-' * 10} {'-' * 12} {'-' * 8}")
 
-        for field in sorted(field_stats.keys()):
-            stats = field_stats[field]
-            null_pct = (stats["null"] / stats["total"] * 100) if stats["total"] > 0 else 0
-            empty_pct = (stats["empty"] / stats["total"] * 100) if stats["total"] > 0 else 0
-            missing_pct = null_pct + empty_pct
+            for field in sorted(field_stats.keys()):
+                stats = field_stats[field]
+                null_pct = (stats.null / stats.total * 100) if stats.total > 0 else 0
+                empty_pct = (stats.empty / stats.total * 100) if stats.total > 0 else 0
+                missing_pct = null_pct + empty_pct
 
-            print(f"{field:<20} {null_pct:>9.1f}% {empty_pct:>9.1f}% {missing_pct:>11.1f}% {stats['total']:>8}")
+                print(f"{field:<20} {null_pct:>9.1f}% {empty_pct:>9.1f}% {missing_pct:>11.1f}% {stats.total:>8}")
 
     # Overall summary
     print(f"\n{'=' * 80}")
@@ -84,15 +161,15 @@ def analyze_results():
 
     for field in sorted(total_stats.keys()):
         stats = total_stats[field]
-        null_pct = (stats["null"] / stats["total"] * 100) if stats["total"] > 0 else 0
-        empty_pct = (stats["empty"] / stats["total"] * 100) if stats["total"] > 0 else 0
+        null_pct = (stats.null / stats.total * 100) if stats.total > 0 else 0
+        empty_pct = (stats.empty / stats.total * 100) if stats.total > 0 else 0
         missing_pct = null_pct + empty_pct
 
-        overall_null += stats["null"]
-        overall_empty += stats["empty"]
-        overall_total += stats["total"]
+        overall_null += stats.null
+        overall_empty += stats.empty
+        overall_total += stats.total
 
-        print(f"{field:<20} {null_pct:>9.1f}% {empty_pct:>9.1f}% {missing_pct:>11.1f}% {stats['total']:>8}")
+        print(f"{field:<20} {null_pct:>9.1f}% {empty_pct:>9.1f}% {missing_pct:>11.1f}% {stats.total:>8}")
 
     print(f"{'-' * 20} {'-' * 10} {'-' * 10} {'-' * 12} {'-' * 8}")
     overall_null_pct = (overall_null / overall_total * 100) if overall_total > 0 else 0
@@ -1,10 +1,35 @@
 #!/usr/bin/env python3
 """Debug script to examine HTML structure of failing pages."""
 
+import re
+from html import unescape
+
 import requests
 from bs4 import BeautifulSoup
 from scraper.analyzer import StructureAnalyzer
 
+# href of each <a> tag in serialized HTML. bs4 quotes values with double
+# quotes, or single ones when the value contains a double quote; the
+# lookbehind keeps attributes like data-href from matching.
+HREF_RE = re.compile(r'<a\s[^>]*?(?<![\w-])href=(["\'])(.*?)\1', re.I)
+
+# One session for every debugged page so connections are kept alive and reused
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': 'Mozilla/5.0'})
+
+
+def _preview(element, n=200):
+    """Return element.get_text(strip=True)[:n] without building the whole text."""
+    parts = []
+    total = 0
+    for text in element.stripped_strings:
+        parts.append(text)
+        total += len(text)
+        if total >= n:
+            break
+    return ''.join(parts)[:n]
+
+
 def debug_page(url, title):
     """Debug a single page's structure."""
     print(f"\n{'=' * 80}")
@@ -12,7 +37,7 @@ def debug_page(url, title):
     print(f"URL: {url}")
     print(f"{'=' * 80}\n")
 
-    response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
+    response = SESSION.get(url, timeout=30)
     soup = BeautifulSoup(response.content, 'lxml')
 
     # Find repeating elements
@@ -26,19 +51,20 @@ def debug_page(url, title):
         print(f"\n[Element {i+1}]")
         print(f"Tag: {elem.name}")
         print(f"Classes: {elem.get('class', [])}")
-        print(f"Text (first 200 chars): {elem.get_text(strip=True)[:200]}")
+        print(f"Text (first 200 chars): {_preview(elem)}")
 
-        # Check for links
-        links = elem.find_all('a', href=True)
-        print(f"Links found: {len(links)}")
-        if links:
-            for link in links[:3]:
-                print(f"  - {link.get('href')} : {link.get_text(strip=True)[:50]}")
+        # Check for links with one regex pass over the element's HTML
+        hrefs = [unescape(match.group(2)) for match in HREF_RE.finditer(str(elem))]
+        print(f"Links found: {len(hrefs)}")
+        if hrefs:
+            # Only the printed links need their text, so only those go through bs4
+            for link in elem.find_all('a', href=True, limit=3):
+                print(f"  - {link.get('href')} : {_preview(link, 50)}")
 
         # Check for emails
-        emails = elem.find_all('a', href=lambda x: x and x.startswith('mailto:'))
+        emails = [h for h in hrefs if h.startswith('mailto:')]
         if emails:
-            print(f"Email links: {[e['href'] for e in emails]}")
+            print(f"Email links: {emails}")
 
         # Check for table headers
         if elem.name == 'tr':
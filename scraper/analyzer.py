@@ -1,14 +1,133 @@
 """URL and structure analyzer for detecting patterns and pagination."""
 
 import re
-from typing import List, Optional, Dict, Any, Tuple
-from urllib.parse import urlparse, parse_qs, urljoin
-from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from typing import List, Optional, Dict, Any, Tuple, NamedTuple
+from urllib.parse import urljoin, unquote_plus
+from collections import Counter, defaultdict
 
 from bs4 import BeautifulSoup, Tag
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
 from .utils import update_url_params, normalize_url, clean_text
 
+# Class keywords for directory entry containers, matched as case-insensitive
+# substrings. Plain `in` checks on the lowercased class string are several
+# times faster than searching an alternation regex, which CPython's re engine
+# retries alternative by alternative at every position.
+_PERSON_CLASS_KEYWORDS = ('person', 'member', 'profile', 'employee', 'staff', 'student', 'faculty', 'directory-item')
+_CARD_CLASS_KEYWORDS = ('card', 'entry', 'result', 'listing', 'item', 'row', 'col')
+_LIST_ITEM_CLASS_KEYWORDS = ('entry', 'result', 'listing', 'item')
+
+# Common container patterns (ordered by priority), as (tag name, class filter).
+# The class filter is None for any element, True for any element with a class
+# attribute, or a tuple of keywords any of which must occur in its classes.
+_CONTAINER_PATTERNS = (
+    # High-priority specific patterns
+    ('div', _PERSON_CLASS_KEYWORDS),
+    ('li', _PERSON_CLASS_KEYWORDS),
+    ('article', _PERSON_CLASS_KEYWORDS),
+
+    # Table rows (common for directories)
+    ('tr', None),
+
+    # Medium-priority patterns
+    ('div', _CARD_CLASS_KEYWORDS),
+    ('li', _LIST_ITEM_CLASS_KEYWORDS),
+    ('article', None),
+
+    # Generic containers that might be repeated
+    ('div', True),
+    ('li', None),
+)
+
+# Pattern indexes per tag name, so each element is only tested against the
+# patterns for its own tag
+_PATTERNS_BY_TAG: Dict[str, List[Tuple[int, Any]]] = {}
+for _index, (_tag_name, _class_filter) in enumerate(_CONTAINER_PATTERNS):
+    _PATTERNS_BY_TAG.setdefault(_tag_name, []).append((_index, _class_filter))
+
+# Tags considered by the structural similarity fallback
+_STRUCTURE_TAGS = frozenset({'div', 'li', 'article', 'section', 'tr'})
+
+# Upper bound of StructureAnalyzer._score_elements for a single element
+# (mailto 15 + tel 15 + links 15 + text 10 + image 5 + children 10 + li/tr 5)
+_MAX_ELEMENT_SCORE = 75
+
+# Page chrome whose descendants are never directory entries
+_CHROME_TAGS = frozenset({'nav', 'footer', 'header'})
+
+# Navigation markers in class names (matched as case-insensitive substrings,
+# like the container keywords above), and link texts typical of navigation
+_NAV_CLASS_KEYWORDS = ('nav', 'menu', 'header', 'footer', 'sidebar', 'breadcrumb', 'pagination')
+_NAV_TEXT = frozenset({'home', 'about', 'contact', 'login', 'sign in', 'menu', 'search', 'next', 'prev'})
+
+# Words that mark a table row as a column header row
+_HEADER_KEYWORDS = ('name', 'email', 'phone', 'title', 'position', 'department', 'role', 'contact')
+
+# Link prefixes that never point at a detail page
+_SKIP_PROTOS = ('mailto:', 'tel:', 'javascript:', '#')
+
+# Pagination patterns
+_PAGINATION_CLASS_RE = re.compile(r'paginat', re.I)
+# Pagination container tags, most trusted first
+_PAGINATION_TAGS = ['nav', 'div', 'ul']
+_NEXT_TEXT_RE = re.compile(r'next|»|›|>', re.I)
+_NEXT_CLASS_RE = re.compile(r'next', re.I)
+_LOAD_MORE_RE = re.compile(r'load\s*more|show\s*more', re.I)
+# Stand-in page value used to build a page URL template once
+_PAGE_PLACEHOLDER = '__PAGE_NUMBER__'
+_PAGE_PARAM_NAMES = frozenset({'page', 'p', 'pg', 'pagenum', 'offset', 'start', 'from'})
+
+# Contact link and detail page patterns
+_MAILTO_OR_TEL_RE = re.compile(r'mailto:|tel:', re.I)
+_DETAIL_CLASS_RE = re.compile(r'profile|bio|about|detail', re.I)
+
+
+@lru_cache(maxsize=4096)
+def _page_params(url: str) -> Dict[str, str]:
+    """
+    Pagination parameters present in the query string of url.
+
+    Maps each of the known page parameter names to its first non-blank
+    value, like parse_qs(...)[name][0] but only decoding the values it keeps.
+    Cached because pagination helpers see the same URLs repeatedly; callers
+    must treat the result as read-only.
+    """
+    query = url.partition('#')[0].partition('?')[2]
+    params = {}
+    for part in query.split('&'):
+        name, _, value = part.partition('=')
+        if value and name in _PAGE_PARAM_NAMES and name not in params:
+            # Only decode values that actually contain escapes
+            params[name] = unquote_plus(value) if '%' in value or '+' in value else value
+    return params
+
+
+class _AnchorInventory(NamedTuple):
+    """What StructureAnalyzer needs to know about the links in one element."""
+    count: int  # anchors with an href
+    has_email: bool
+    has_phone: bool
+    first_href: Optional[str]  # first href that is not mailto/tel/javascript/#
+
+
+class RepeatingNode(NamedTuple):
+    """A directory entry container found by find_repeating_elements_fast."""
+    tag: str
+    classes: Tuple[str, ...]
+    text: str
+    html: str
+
+
+# Descendants of page chrome, matching what _scan_containers leaves out
+_CHROME_DESCENDANTS_SELECTOR = 'nav *, footer *, header *, .nav *, .menu *'
+
 
 class StructureAnalyzer:
     """Analyzes page structure to detect patterns."""
@@ -59,80 +178,84 @@ class StructureAnalyzer:
         Returns:
             List of repeating elements
         """
-        # Common container patterns (ordered by priority)
-        container_patterns = [
-            # High-priority specific patterns
-            ('div', {'class': re.compile(r'(person|member|profile|employee|staff|student|faculty|directory-item)', re.I)}),
-            ('li', {'class': re.compile(r'(person|member|profile|employee|staff|student|faculty|directory-item)', re.I)}),
-            ('article', {'class': re.compile(r'(person|member|profile|employee|staff|student|faculty|directory-item)', re.I)}),
-            
-            # Table rows (common for directories)
-            ('tr', {}),
-
-            # Medium-priority patterns
-            ('div', {'class': re.compile(r'(card|entry|result|listing|item|row|col)', re.I)}),
-            ('li', {'class': re.compile(r'(entry|result|listing|item)', re.I)}),
-            ('article', {}),
-            
-            # Generic containers that might be repeated
-            ('div', {'class': True}),
-            ('li', {}),
-        ]
-
         best_candidates = []
         max_count = 0
         max_score = 0
 
+        # Per-element scores, shared by every candidate set scored below
+        score_cache: Dict[int, int] = {}
+
+        # One traversal buckets every element by the patterns it matches,
+        # leaving out anything nested in navigation, header, footer or menu blocks
+        pattern_matches, structure_candidates, row_tables = StructureAnalyzer._scan_containers(soup)
+
         # Strategy 1: Pattern matching
-        for tag_name, attrs in container_patterns:
-            raw_elements = soup.find_all(tag_name, attrs) if attrs else soup.find_all(tag_name)
-            
-            # Filter out navigation, footer, header, and menu elements
-            elements = [
+        # Sets are scored sequentially on purpose: the bounds below prune
+        # against the best score so far, and scoring is bs4 tree work that
+        # holds the GIL, so a thread pool would only add overhead.
+        for (tag_name, class_filter), raw_elements in zip(_CONTAINER_PATTERNS, pattern_matches):
+            # Nothing can beat a set that already has the maximum possible score
+            if max_score >= _MAX_ELEMENT_SCORE:
+                break
+
+            # Skip filtering when even a perfect score could not win
+            if StructureAnalyzer._weighted_score_bound(len(raw_elements)) <= max_score:
+                continue
+
+            # Filter out navigation-like elements
+            survivors = (
                 el for el in raw_elements
-                if not any(parent.name in ['nav', 'footer', 'header'] for parent in el.parents)
-                and not any('nav' in parent.get('class', []) or 'menu' in parent.get('class', []) 
-                           for parent in el.parents if hasattr(parent, 'get'))
-                and not StructureAnalyzer._is_navigation_element(el)
-            ]
+                if not StructureAnalyzer._is_navigation_element(el)
+            )
 
+            # Each candidate set is (filtered head, rest still to filter)
             candidate_sets = []
 
-            # Special handling for TRs: group by parent table
-            if tag_name == 'tr' and not attrs:
-                tables = {}
-                for tr in elements:
-                    parent = tr.find_parent('table')
+            # Special handling for TRs: group by parent table. Tables are keyed
+            # by id() because bs4 hashes and compares a Tag by serializing it,
+            # which is quadratic over the rows of a large table.
+            if tag_name == 'tr' and class_filter is None:
+                tables = defaultdict(list)
+                for tr in survivors:
+                    parent = row_tables.get(id(tr))
                     if parent:
-                        if parent not in tables:
-                            tables[parent] = []
-                        tables[parent].append(tr)
+                        tables[id(parent)].append(tr)
                 
-                candidate_sets.extend(list(tables.values()))
+                candidate_sets.extend((rows, ()) for rows in tables.values())
             else:
-                candidate_sets.append(elements)
+                # The score samples the first 5 elements and the weight stops
+                # growing at 20, so only that many need filtering up front; the
+                # rest of the set is filtered only if it wins
+                candidate_sets.append((list(islice(survivors, 20)), survivors))
 
-            for candidate_elements in candidate_sets:
-                if len(candidate_elements) >= 3:
-                    # Score elements based on content richness
-                    score = StructureAnalyzer._score_elements(candidate_elements)
-                    
-                    # Prefer high-scoring sets with good counts
-                    # We weight score more heavily than count to avoid picking up small UI elements
-                    weighted_score = score * (min(len(candidate_elements), 20) / 20.0)
-                    
-                    if weighted_score > max_score:
-                        max_score = weighted_score
-                        max_count = len(candidate_elements)
-                        best_candidates = candidate_elements
+            for candidate_elements, rest in candidate_sets:
+                if len(candidate_elements) < 3:
+                    continue
+                if StructureAnalyzer._weighted_score_bound(len(candidate_elements)) <= max_score:
+                    continue
+
+                # Score elements based on content richness
+                score = StructureAnalyzer._score_elements(candidate_elements, score_cache)
+
+                # Prefer high-scoring sets with good counts
+                # We weight score more heavily than count to avoid picking up small UI elements
+                weighted_score = score * (min(len(candidate_elements), 20) / 20.0)
+
+                if weighted_score > max_score:
+                    candidate_elements.extend(rest)
+                    max_score = weighted_score
+                    max_count = len(candidate_elements)
+                    best_candidates = candidate_elements
 
         # Strategy 2: Structural similarity (Fallback)
         if not best_candidates or max_score < 10:
-            structure_candidates = StructureAnalyzer._find_by_structure_similarity(soup)
-            if structure_candidates:
-                structure_score = StructureAnalyzer._score_elements(structure_candidates)
+            similar = StructureAnalyzer._find_by_structure_similarity(
+                soup, candidates=structure_candidates, score_cache=score_cache
+            )
+            if similar:
+                structure_score = StructureAnalyzer._score_elements(similar, score_cache)
                 if structure_score > max_score:
-                    best_candidates = structure_candidates
+                    best_candidates = similar
 
         # For table rows, exclude header rows
         if best_candidates and best_candidates[0].name == 'tr':
@@ -140,31 +263,201 @@ class StructureAnalyzer:
 
         return best_candidates
 
+    @staticmethod
+    def find_repeating_elements_fast(html: str) -> List[RepeatingNode]:
+        """
+        Quick estimate of the repeating entries of a page, parsed with selectolax.
+
+        Buckets containers by the same class patterns and chrome rules as
+        find_repeating_elements, but skips content scoring: the first
+        pattern, in priority order, with at least three elements wins (for
+        table rows, the table with the most rows). Parsing and selection run
+        in C, so this suits multi-megabyte pages where only the shape of the
+        listing is needed; the bs4 path remains the one extraction uses.
+
+        Args:
+            html: HTML content
+
+        Returns:
+            Entry containers in document order; empty if none were found
+
+        Raises:
+            ImportError: If selectolax is not installed
+        """
+        if LexborHTMLParser is None:
+            raise ImportError("find_repeating_elements_fast requires selectolax")
+
+        tree = LexborHTMLParser(html)
+        in_chrome = {node.mem_id for node in tree.css(_CHROME_DESCENDANTS_SELECTOR)}
+
+        pattern_matches = [[] for _ in _CONTAINER_PATTERNS]
+        for node in tree.css(', '.join(sorted(_PATTERNS_BY_TAG))):
+            if node.mem_id in in_chrome:
+                continue
+
+            classes = node.attributes.get('class')
+            class_str = classes.lower() if classes else ''
+            if any(keyword in class_str for keyword in _NAV_CLASS_KEYWORDS):
+                continue
+
+            for index, class_filter in _PATTERNS_BY_TAG[node.tag]:
+                if class_filter is None:
+                    pattern_matches[index].append(node)
+                elif class_filter is True:
+                    if classes is not None:
+                        pattern_matches[index].append(node)
+                elif any(keyword in class_str for keyword in class_filter):
+                    pattern_matches[index].append(node)
+
+        for (tag_name, _), nodes in zip(_CONTAINER_PATTERNS, pattern_matches):
+            if tag_name == 'tr':
+                # Group rows by their table and drop leading header rows
+                tables = defaultdict(list)
+                for row in nodes:
+                    table = row.parent
+                    while table is not None and table.tag != 'table':
+                        table = table.parent
+                    if table is not None:
+                        tables[table.mem_id].append(row)
+                nodes = max(tables.values(), key=len, default=[])
+                skip = 0
+                while skip < min(3, len(nodes)) and nodes[skip].css_first('th') is not None:
+                    skip += 1
+                nodes = nodes[skip:]
+
+            if len(nodes) >= 3:
+                return [
+                    RepeatingNode(
+                        tag=node.tag,
+                        classes=tuple((node.attributes.get('class') or '').split()),
+                        text=node.text(separator=' ', strip=True),
+                        html=node.html
+                    )
+                    for node in nodes
+                ]
+
+        return []
+
+    @staticmethod
+    def _scan_containers(soup: BeautifulSoup) -> Tuple[List[List[Tag]], List[Tag], Dict[int, Tag]]:
+        """
+        Walk the document once and bucket candidate containers.
+
+        Elements nested in page chrome (nav/footer/header elements or
+        anything with a 'nav' or 'menu' class) are left out of the pattern
+        buckets; entering a chrome element records its last descendant and
+        the walk is inside chrome until that node has been passed. Open
+        tables are tracked the same way, so each row's table is known
+        without walking its parents.
+
+        Returns:
+            Tuple of (matches per entry of _CONTAINER_PATTERNS in document
+            order, candidates for the structural similarity fallback,
+            innermost enclosing table of each tr keyed by id(tr))
+        """
+        pattern_matches = [[] for _ in _CONTAINER_PATTERNS]
+        structure_candidates = []
+        row_tables = {}
+        chrome_end = None
+        open_tables = []  # (table, last descendant) from outermost to innermost
+
+        # descendants follows the parser's document-order chain, which is much
+        # cheaper than walking children lists ourselves
+        for el in soup.descendants:
+            inside_chrome = chrome_end is not None
+            if el is chrome_end:
+                chrome_end = None
+
+            enclosing_table = open_tables[-1][0] if open_tables else None
+            while open_tables and el is open_tables[-1][1]:
+                open_tables.pop()
+
+            if el.__class__ is not Tag:
+                continue
+
+            name = el.name
+            classes = el.attrs.get('class')
+
+            if name == 'tr':
+                if enclosing_table is not None:
+                    row_tables[id(el)] = enclosing_table
+            elif name == 'table':
+                last = el._last_descendant()
+                if last is not el:
+                    open_tables.append((el, last))
+
+            if name in _STRUCTURE_TAGS:
+                structure_candidates.append(el)
+
+                patterns = _PATTERNS_BY_TAG.get(name)
+                if patterns and not inside_chrome:
+                    class_str = ' '.join(classes).lower() if classes else ''
+
+                    for index, class_filter in patterns:
+                        if class_filter is None:
+                            pattern_matches[index].append(el)
+                        elif class_filter is True:
+                            if classes is not None:
+                                pattern_matches[index].append(el)
+                        elif any(keyword in class_str for keyword in class_filter):
+                            pattern_matches[index].append(el)
+
+            if not inside_chrome and (
+                name in _CHROME_TAGS
+                or (classes is not None and ('nav' in classes or 'menu' in classes))
+            ):
+                last = el._last_descendant()
+                if last is not el:
+                    chrome_end = last
+
+        return pattern_matches, structure_candidates, row_tables
+
+    @staticmethod
+    def _weighted_score_bound(count: int) -> float:
+        """Best weighted score a candidate set of this size could reach."""
+        return _MAX_ELEMENT_SCORE * (min(count, 20) / 20.0)
+
     @staticmethod
     def _is_navigation_element(element: Tag) -> bool:
         """Check if element is likely a navigation item."""
-        # Check element's own classes
-        classes = ' '.join(element.get('class', [])).lower()
-        nav_keywords = ['nav', 'menu', 'header', 'footer', 'sidebar', 'breadcrumb', 'pagination']
-        
-        if any(keyword in classes for keyword in nav_keywords):
-            return True
+        # Check element's own classes; no keyword contains a space, so a
+        # match in the joined string never spans two class names
+        classes = element.get('class')
+        if classes:
+            class_str = ' '.join(classes).lower()
+            if any(keyword in class_str for keyword in _NAV_CLASS_KEYWORDS):
+                return True
+
+        # Both text checks below need fewer than 10 characters (every entry of
+        # _NAV_TEXT is shorter), so longer elements are settled without
+        # materializing their text
+        if StructureAnalyzer._text_length_exceeds(element, 9):
+            return False
 
         # Check if text is very short (likely navigation)
         text = element.get_text(strip=True)
-        if len(text) < 10 and element.find_all(['a']) and not element.find_all(['p', 'div']):
+        if element.find('a') and not element.find(['p', 'div']):
             return True
 
         # Check for common navigation text
-        nav_text = ['home', 'about', 'contact', 'login', 'sign in', 'menu', 'search', 'next', 'prev']
-        if text.lower() in nav_text:
+        if text.lower() in _NAV_TEXT:
             return True
 
         return False
 
     @staticmethod
-    def _score_elements(elements: List[Tag]) -> int:
-        """Score a set of elements based on content richness."""
+    def _score_elements(elements: List[Tag], cache: Optional[Dict[int, int]] = None) -> int:
+        """
+        Score a set of elements based on content richness.
+
+        Args:
+            elements: Candidate elements
+            cache: Optional per-element scores keyed by id(element), shared
+                between calls so elements in overlapping sets are scored once
+
+        Returns:
+            Average score of the sampled elements
+        """
         if not elements:
             return 0
 
@@ -173,98 +466,130 @@ class StructureAnalyzer:
         total_score = 0
 
         for el in sample:
-            score = 0
-            
-            # Has email link
-            if el.find('a', href=re.compile(r'mailto:', re.I)):
-                score += 15
-            
-            # Has phone link
-            if el.find('a', href=re.compile(r'tel:', re.I)):
-                score += 15
-                
-            # Has regular links
-            links = el.find_all('a', href=True)
-            if links:
-                score += min(len(links) * 3, 15)
-
-            # Has text content
-            text = el.get_text(strip=True)
-            if 20 < len(text) < 1000:
-                score += 10
-            elif len(text) >= 1000:
-                score += 5  # Too long might be wrong element
-            
-            # Has images
-            if el.find('img'):
-                score += 5
-
-            # Has structured content (multiple children)
-            children = [c for c in el.children if hasattr(c, 'name')]
-            if 2 <= len(children) <= 30:
-                score += 10
-                
-            # Consistency check: does it look like a list item?
-            if el.name == 'li':
-                score += 5
-            elif el.name == 'tr':
-                score += 5
+            if cache is None:
+                total_score += StructureAnalyzer._score_element(el)
+                continue
 
+            key = id(el)
+            score = cache.get(key)
+            if score is None:
+                score = cache[key] = StructureAnalyzer._score_element(el)
             total_score += score
 
         return total_score // len(sample)
 
+    @staticmethod
+    def _score_element(el: Tag) -> int:
+        """Score a single element based on content richness."""
+        score = 0
+
+        anchors = StructureAnalyzer._inventory_anchors(el)
+
+        # Has email link
+        if anchors.has_email:
+            score += 15
+
+        # Has phone link
+        if anchors.has_phone:
+            score += 15
+
+        # Has regular links
+        if anchors.count:
+            score += min(anchors.count * 3, 15)
+
+        # Has text content (only lengths up to 1000 matter)
+        text_length = StructureAnalyzer._capped_text_length(el, 1000)
+        if 20 < text_length < 1000:
+            score += 10
+        elif text_length >= 1000:
+            score += 5  # Too long might be wrong element
+
+        # Has images
+        if el.find('img'):
+            score += 5
+
+        # Has structured content (multiple children, text nodes included)
+        if 2 <= len(el.contents) <= 30:
+            score += 10
+
+        # Consistency check: does it look like a list item?
+        if el.name == 'li' or el.name == 'tr':
+            score += 5
+
+        return score
+
+    @staticmethod
+    def _inventory_anchors(el: Tag) -> _AnchorInventory:
+        """Collect link facts for an element in a single sweep over its anchors."""
+        count = 0
+        has_email = has_phone = False
+        first_href = None
+
+        for link in el.find_all('a', href=True):
+            href = link['href']
+            count += 1
+
+            lowered = href.lower()
+            if 'mailto:' in lowered:
+                has_email = True
+            if 'tel:' in lowered:
+                has_phone = True
+
+            if first_href is None and not href.startswith(_SKIP_PROTOS):
+                first_href = href
+
+        return _AnchorInventory(count, has_email, has_phone, first_href)
+
     @staticmethod
     def _filter_table_headers(rows: List[Tag]) -> List[Tag]:
         """Filter out table header rows."""
         if not rows:
             return rows
 
-        # Check first few rows for header-like properties
-        filtered_rows = []
-        for i, row in enumerate(rows[:3]):
-            is_header = False
-            
+        # Check first few rows for header-like properties; the first row that
+        # is not a header starts the data. This is the only pass over the
+        # rows, and it never looks past the third one.
+        for i, row in enumerate(islice(rows, 3)):
             # Has <th> tags instead of <td>
-            if row.find_all('th'):
-                is_header = True
-            
+            if row.find('th'):
+                continue
+
             # Check if text suggests it's a header
             text = row.get_text(strip=True).lower()
-            header_keywords = ['name', 'email', 'phone', 'title', 'position', 'department', 'role', 'contact']
-            
+
             # If row contains multiple header keywords and no links, likely a header
-            keyword_count = sum(1 for keyword in header_keywords if keyword in text)
-            if keyword_count >= 2 and not row.find_all('a', href=re.compile(r'mailto:|tel:', re.I)):
-                is_header = True
-                
-            if not is_header:
-                filtered_rows.extend(rows[i:])
-                break
-                
-        return filtered_rows if filtered_rows else rows
+            keyword_count = sum(1 for keyword in _HEADER_KEYWORDS if keyword in text)
+            if keyword_count >= 2 and not row.find('a', href=_MAILTO_OR_TEL_RE):
+                continue
+
+            # Without header rows the list is returned as is, not copied
+            return rows[i:] if i else rows
+
+        return rows
 
     @staticmethod
-    def _find_by_structure_similarity(soup: BeautifulSoup, min_count: int = 3) -> List[Tag]:
+    def _find_by_structure_similarity(
+        soup: BeautifulSoup,
+        min_count: int = 3,
+        candidates: Optional[List[Tag]] = None,
+        score_cache: Optional[Dict[int, int]] = None
+    ) -> List[Tag]:
         """Find elements with similar structure."""
-        # Get all potential containers
-        candidates = soup.find_all(['div', 'li', 'article', 'section', 'tr'])
+        # Get all potential containers, unless already collected by the caller
+        if candidates is None:
+            candidates = soup.find_all(_STRUCTURE_TAGS)
         
         # Group by tag signature (tag name + direct children tags)
-        structure_groups = {}
+        structure_groups: Dict[Tuple[str, Tuple[str, ...]], List[Tag]] = defaultdict(list)
         
         for el in candidates:
-            # Skip tiny elements
-            if len(el.get_text(strip=True)) < 10:
+            # Skip tiny elements (fewer than 10 characters of text)
+            if not StructureAnalyzer._text_length_exceeds(el, 9):
                 continue
                 
             # Create a signature based on tag name and children types
-            children_sig = tuple(sorted([child.name for child in el.children if hasattr(child, 'name') and child.name]))
-            signature = (el.name, children_sig)
-            
-            if signature not in structure_groups:
-                structure_groups[signature] = []
-            structure_groups[signature].append(el)
+            children_sig = tuple(sorted(child.name for child in el.children if child.__class__ is Tag))
+            structure_groups[(el.name, children_sig)].append(el)
 
         # Find best group
         best_group = []
@@ -272,7 +597,7 @@ class StructureAnalyzer:
         
         for signature, elements in structure_groups.items():
             if len(elements) >= min_count:
-                score = StructureAnalyzer._score_elements(elements)
+                score = StructureAnalyzer._score_elements(elements, score_cache)
                 # Weight by number of elements but cap it
                 weighted_score = score * (min(len(elements), 50) / 10.0)
                 
@@ -304,8 +629,7 @@ class StructureAnalyzer:
         }
 
         # Check URL parameters
-        parsed = urlparse(current_url)
-        query_params = parse_qs(parsed.query)
+        query_params = _page_params(current_url)
 
         # Common pagination parameters
         param_names = ['page', 'p', 'pg', 'pagenum', 'offset', 'start', 'from']
@@ -318,41 +642,51 @@ class StructureAnalyzer:
                 break
 
         # Look for pagination links
-        pagination_selectors = [
-            soup.find('nav', {'class': re.compile(r'paginat', re.I)}),
-            soup.find('div', {'class': re.compile(r'paginat', re.I)}),
-            soup.find('ul', {'class': re.compile(r'paginat', re.I)}),
-        ]
-
-        for pagination_nav in pagination_selectors:
-            if pagination_nav:
-                pagination_info['has_pagination'] = True
-
-                # Find next button/link
-                next_link = (
-                    pagination_nav.find('a', string=re.compile(r'next|»|›|>', re.I)) or
-                    pagination_nav.find('a', {'class': re.compile(r'next', re.I)}) or
-                    pagination_nav.find('a', {'rel': 'next'})
-                )
+        # One traversal covering nav, div and ul containers; a nav wins over
+        # a div, and a div over a ul, wherever they sit in the document
+        pagination_nav = min(
+            soup.find_all(_PAGINATION_TAGS, {'class': _PAGINATION_CLASS_RE}),
+            key=lambda tag: _PAGINATION_TAGS.index(tag.name),
+            default=None
+        )
+
+        if pagination_nav:
+            pagination_info['has_pagination'] = True
 
-                if next_link and next_link.get('href'):
-                    pagination_info['next_url'] = normalize_url(current_url, next_link['href'])
+            # One pass over the links finds the next button/link and the page
+            # numbers. The next link is the first one whose text looks like
+            # "next", else the first with a next class, else the first rel=next.
+            next_by_text = next_by_class = next_by_rel = None
+            page_numbers = []
+
+            for link in pagination_nav.find_all('a'):
+                if next_by_text is None:
+                    string = link.string
+                    if string is not None and _NEXT_TEXT_RE.search(string):
+                        next_by_text = link
+                if next_by_class is None:
+                    classes = link.get('class')
+                    if classes and _NEXT_CLASS_RE.search(' '.join(classes)):
+                        next_by_class = link
+                if next_by_rel is None and 'next' in link.get('rel', ()):
+                    next_by_rel = link
 
                 # Try to find total pages
-                page_links = pagination_nav.find_all('a', href=True)
-                page_numbers = []
-                for link in page_links:
+                if link.has_attr('href'):
                     text = link.get_text(strip=True)
                     if text.isdigit():
                         page_numbers.append(int(text))
 
-                if page_numbers:
-                    pagination_info['total_pages'] = max(page_numbers)
+            next_link = next_by_text or next_by_class or next_by_rel
 
-                break
+            if next_link and next_link.get('href'):
+                pagination_info['next_url'] = normalize_url(current_url, next_link['href'])
+
+            if page_numbers:
+                pagination_info['total_pages'] = max(page_numbers)
 
         # Check for "Load More" button
-        load_more = soup.find(['button', 'a'], string=re.compile(r'load\s*more|show\s*more', re.I))
+        load_more = soup.find(['button', 'a'], string=_LOAD_MORE_RE)
         if load_more:
             pagination_info['type'] = 'button'
             pagination_info['has_pagination'] = True
@@ -371,62 +705,79 @@ class StructureAnalyzer:
         Returns:
             List of URLs
         """
-        links = []
+        # Insertion-ordered dict: removes duplicates while keeping page order
+        links: Dict[str, None] = {}
 
         for element in elements:
-            # Find first link in element
-            link = element.find('a', href=True)
-            if link:
-                href = link['href']
-                # Filter out mailto:, tel:, javascript:, and # links
-                if href.startswith(('mailto:', 'tel:', 'javascript:', '#')):
-                    # Try to find a different link
-                    all_links = element.find_all('a', href=True)
-                    for alt_link in all_links:
-                        alt_href = alt_link['href']
-                        if not alt_href.startswith(('mailto:', 'tel:', 'javascript:', '#')):
-                            href = alt_href
-                            break
-
-                # Skip if still a special protocol
-                if href.startswith(('mailto:', 'tel:', 'javascript:', '#')):
-                    continue
+            # First link that is not mailto:, tel:, javascript: or #
+            href = StructureAnalyzer._inventory_anchors(element).first_href
+            if href is None:
+                continue
 
-                url = normalize_url(base_url, href)
-                # Filter out navigation links
-                if '#' not in url.split('/')[-1]:  # Allow # in path but not fragment
-                    links.append(url)
+            url = normalize_url(base_url, href)
+            # Filter out navigation links
+            if '#' not in url[url.rfind('/') + 1:]:  # Allow # in path but not fragment
+                links[url] = None
 
-        return list(set(links))  # Remove duplicates
+        return list(links)
 
     @staticmethod
-    def detect_detail_page_type(soup: BeautifulSoup) -> str:
+    def detect_detail_page_type(soup: BeautifulSoup, repeating: Optional[List[Tag]] = None) -> str:
         """
         Detect if this is a listing page or a detail page.
 
         Args:
             soup: BeautifulSoup object
+            repeating: Result of find_repeating_elements(soup), if the caller
+                already has it; computed here otherwise
 
         Returns:
             'listing' or 'detail'
         """
         # Check for repeating elements
-        repeating = StructureAnalyzer.find_repeating_elements(soup)
+        if repeating is not None and len(repeating) >= 3:
+            return 'listing'
 
-        if len(repeating) >= 3:
+        # Check for profile/detail indicators, cheapest first and stopping
+        # at the first hit
+        if not (
+            soup.find('div', {'class': _DETAIL_CLASS_RE}) or
+            soup.find('h1') or  # Detail pages usually have h1
+            StructureAnalyzer._text_length_exceeds(soup, 1000)  # More content
+        ):
             return 'listing'
 
-        # Check for profile/detail indicators
-        detail_indicators = [
-            soup.find('div', {'class': re.compile(r'profile|bio|about|detail', re.I)}),
-            soup.find('h1'),  # Detail pages usually have h1
-            len(soup.get_text(strip=True)) > 1000  # More content
-        ]
+        # Listing pages often have these indicators too (an h1 title, long
+        # text), so only now is the expensive repeating-element scan needed
+        if repeating is None:
+            repeating = StructureAnalyzer.find_repeating_elements(soup)
+
+        return 'listing' if len(repeating) >= 3 else 'detail'
+
+    @staticmethod
+    def _text_length_exceeds(element: Tag, limit: int) -> bool:
+        """
+        Check if the stripped text of element is longer than limit.
+
+        Equivalent to len(element.get_text(strip=True)) > limit, but stops
+        as soon as the limit is passed instead of building the whole text.
+        """
+        return StructureAnalyzer._capped_text_length(element, limit + 1) > limit
 
-        if any(detail_indicators):
-            return 'detail'
+    @staticmethod
+    def _capped_text_length(element: Tag, cap: int) -> int:
+        """
+        Length of element.get_text(strip=True), counted only until it reaches cap.
 
-        return 'listing'
+        The result is exact below cap; a result >= cap only means the text
+        is at least cap characters long.
+        """
+        total = 0
+        for text in element.stripped_strings:
+            total += len(text)
+            if total >= cap:
+                break
+        return total
 
 
 class PaginationHandler:
@@ -459,10 +810,17 @@ class PaginationHandler:
             else:
                 num_pages = max_pages
 
-            # Generate URLs
-            for page_num in range(2, num_pages + 1):
-                page_url = update_url_params(base_url, {param: page_num})
-                urls.append(page_url)
+            # Generate URLs: build the URL once with a placeholder page value
+            # and splice each number in, rather than re-parsing and re-encoding
+            # the whole URL per page (digits are never changed by encoding)
+            template = update_url_params(base_url, {param: _PAGE_PLACEHOLDER})
+            if template.count(_PAGE_PLACEHOLDER) == 1:
+                prefix, _, suffix = template.partition(_PAGE_PLACEHOLDER)
+                urls.extend(f'{prefix}{page_num}{suffix}' for page_num in range(2, num_pages + 1))
+            else:
+                for page_num in range(2, num_pages + 1):
+                    page_url = update_url_params(base_url, {param: page_num})
+                    urls.append(page_url)
 
         elif pagination_info['next_url']:
             # Follow next links (will need to be done iteratively)
@@ -473,15 +831,14 @@ class PaginationHandler:
     @staticmethod
     def extract_page_number_from_url(url: str) -> Optional[int]:
         """Extract current page number from URL."""
-        parsed = urlparse(url)
-        query_params = parse_qs(parsed.query)
+        query_params = _page_params(url)
 
         param_names = ['page', 'p', 'pg', 'pagenum']
 
         for param in param_names:
             if param in query_params:
                 try:
-                    return int(query_params[param][0])
+                    return int(query_params[param])
                 except:
                     pass
 
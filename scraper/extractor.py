@@ -1,11 +1,432 @@
 """Multi-strategy data extractor."""
 
 import re
-from typing import Dict, Any, List, Optional
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from bs4 import BeautifulSoup, Tag
 
 from .utils import clean_text, extract_email, extract_phone, normalize_url
 
+# Extraction works on BeautifulSoup Tags (lxml-parsed) because that is what
+# StructureAnalyzer returns and what the scraper hands back to callers. The
+# speedups here come from fewer tree walks per field (fused class patterns,
+# shared text and anchor scans) rather than from a second DOM backend.
+
+# Contact link patterns
+_MAILTO_RE = re.compile(r'mailto:', re.I)
+_TEL_RE = re.compile(r'tel:', re.I)
+_MAILTO_PREFIX_RE = re.compile(r'^mailto:', re.I)
+_TEL_PREFIX_RE = re.compile(r'^tel:', re.I)
+
+# Class patterns for field containers, in the order they are tried
+_EMAIL_CLASS_PATTERNS = tuple(re.compile(p, re.I) for p in (r'email', r'mail', r'contact'))
+_PHONE_CLASS_PATTERNS = tuple(
+    re.compile(p, re.I)
+    for p in (r'\bphone\b', r'\btel\b', r'\btelephone\b', r'\bcontact\b', r'\bcall\b', r'\bmobile\b', r'\bcell\b')
+)
+_NAME_CLASS_PATTERNS = tuple(
+    re.compile(p, re.I) for p in (r'\bname\b', r'\btitle\b', r'\bheading\b', r'\blabel\b', r'\bheader\b')
+)
+_BIO_CLASS_PATTERNS = tuple(
+    re.compile(p, re.I) for p in (r'bio', r'description', r'about', r'summary', r'content')
+)
+_LOCATION_CLASS_PATTERNS = tuple(
+    re.compile(p, re.I)
+    for p in (r'\blocation\b', r'\baddress\b', r'\bcity\b', r'\bstate\b', r'\bregion\b',
+              r'\barea\b', r'\blocale\b', r'\bplace\b', r'\boffice\b')
+)
+
+# Each group fused into one alternation, used to collect candidates in a
+# single traversal before the individual patterns are applied in order
+_EMAIL_CLASS_RE = re.compile('|'.join(p.pattern for p in _EMAIL_CLASS_PATTERNS), re.I)
+_PHONE_CLASS_RE = re.compile('|'.join(p.pattern for p in _PHONE_CLASS_PATTERNS), re.I)
+_NAME_CLASS_RE = re.compile('|'.join(p.pattern for p in _NAME_CLASS_PATTERNS), re.I)
+_BIO_CLASS_RE = re.compile('|'.join(p.pattern for p in _BIO_CLASS_PATTERNS), re.I)
+_LOCATION_CLASS_RE = re.compile('|'.join(p.pattern for p in _LOCATION_CLASS_PATTERNS), re.I)
+
+# Text patterns. These run over whole element texts, so every repeat that
+# can backtrack is bounded to keep the worst case linear in the text length.
+# The texts are raw, so whitespace bounds leave room for HTML indentation.
+_PHONE_LABEL_RE = re.compile(r'(?:phone|tel|mobile|cell|contact)\s{0,200}:?\s{0,200}([+\d\s\-\(\)\.]{1,40})', re.I)
+_BG_IMAGE_RE = re.compile(r'url\([\'"]?([^\'"\)]{1,2000})[\'"]?\)')
+_ITEMPROP_ADDRESS_RE = re.compile(r'address|location', re.I)
+_CITY_STATE_RE = re.compile(r'([A-Z][a-z]{1,40}(?:\s{1,200}[A-Z][a-z]{1,40}){0,15}),\s{0,200}([A-Z]{2})')
+_STREET_RE = re.compile(
+    r'\d{1,8}\s[\w\s]{1,200}(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Way)', re.I
+)
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Words in field descriptions that never name the field being extracted
+_KEYWORD_STOPWORDS = frozenset(['the', 'and', 'for', 'that', 'with', 'from', 'extract', 'get', 'find'])
+
+# Lowercased schema field names extracted as a person's name or title
+_NAME_FIELD_NAMES = frozenset(['name', 'title', 'position', 'role'])
+
+# Heading levels tried by _extract_name_or_title, in priority order
+_HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5')
+
+# Inline tags whose text _get_direct_text treats as the element's own
+_INLINE_TEXT_TAGS = frozenset(['span', 'b', 'i', 'strong', 'em', 'small'])
+
+# Every tag name the field extractors look up below an element. Inside
+# page_text_cache() one walk collects them all and each lookup filters it.
+_QUERY_TAGS = frozenset([
+    'a', 'address', 'b', 'blockquote', 'dd', 'div', 'li', 'p', 'span', 'strong', 'td', 'th'
+] + list(_HEADING_TAGS))
+
+# Other tag-name sets looked up with _descendant_tags
+_CELL_TAGS = frozenset(['td', 'th'])
+_LINK_TAGS = frozenset(['a'])
+_MAIN_CONTENT_CLASS_RE = re.compile(r'content|main|profile|detail', re.I)
+
+
+@lru_cache(maxsize=256)
+def _keyword_re(keyword: str) -> re.Pattern:
+    """Case-insensitive pattern for a schema keyword in class/id values."""
+    return re.compile(keyword, re.I)
+
+
+@lru_cache(maxsize=256)
+def _label_re(keyword: str) -> re.Pattern:
+    """Pattern for the text after a "keyword:" style label."""
+    return re.compile(f"{keyword}\\s*[:\\-]\\s*([^\\n<]+)", re.I)
+
+
+# Synonym groups for header matching: (header keywords, field-name keywords).
+# A header and a field in the same group match regardless of wording.
+_HEADER_SYNONYMS = (
+    (('email',), ('email',)),
+    (('phone',), ('phone',)),
+    (('address', 'location'), ('address', 'location')),
+    (('link', 'website'), ('url', 'website')),
+    (('type', 'category'), ('type', 'category')),
+)
+
+
+def _synonym_groups(text: str, side: int) -> frozenset:
+    """Indexes of the synonym groups whose keywords for `side` occur in text."""
+    return frozenset(
+        index for index, group in enumerate(_HEADER_SYNONYMS)
+        if any(keyword in text for keyword in group[side])
+    )
+
+
+@lru_cache(maxsize=128)
+def _compute_header_mapping(
+    headers: Tuple[str, ...],
+    field_names: Tuple[str, ...]
+) -> Dict[int, Tuple[str, ...]]:
+    """Score lowercased table headers against field names; see DataExtractor.map_headers_to_fields."""
+    col_to_fields = {}  # col_idx -> List[field_name]
+
+    # Lowercase each field name and find its synonym groups once, not per header
+    fields = []
+    for field_name in field_names:
+        name_lower = field_name.lower()
+        fields.append((field_name, name_lower, _synonym_groups(name_lower, 1)))
+
+    for col_idx, header_lower in enumerate(headers):
+        header_groups = _synonym_groups(header_lower, 0)
+
+        # Find all matching fields
+        for field_name, name_lower, name_groups in fields:
+            # Common synonyms
+            if not header_groups.isdisjoint(name_groups):
+                score = 90
+            # Exact match
+            elif name_lower == header_lower:
+                score = 100
+            # Header contains field name (e.g. "Employee Name" -> "name")
+            elif name_lower in header_lower:
+                score = 80
+            # Field name contains header
+            elif header_lower in name_lower:
+                score = 60
+            else:
+                score = 0
+
+            if score > 50:
+                if col_idx not in col_to_fields:
+                    col_to_fields[col_idx] = []
+                col_to_fields[col_idx].append(field_name)
+
+    # Tuples so the cached mapping cannot be mutated by a caller
+    return {col_idx: tuple(names) for col_idx, names in col_to_fields.items()}
+
+
+def _iter_class_matches(
+    element: Tag,
+    names: Tuple[str, ...],
+    patterns: Tuple[re.Pattern, ...],
+    any_pattern: re.Pattern,
+    nodes: Optional[List[Tag]] = None
+):
+    """
+    Yield, for each pattern in order, the first descendant whose class matches it.
+
+    Equivalent to calling element.find(names, {'class': pattern}) per pattern,
+    but the candidates come from one lookup filtered with the fused
+    any_pattern. A caller that already has element.find_all(names) can pass
+    it as nodes.
+    """
+    candidates = []
+    if nodes is None:
+        nodes = _find_all_tags(element, names)
+    for node in nodes:
+        classes = node.get('class')
+        if not classes:
+            continue
+        class_str = ' '.join(classes) if isinstance(classes, list) else classes
+        if any_pattern.search(class_str):
+            candidates.append((node, class_str))
+
+    for pattern in patterns:
+        for node, class_str in candidates:
+            if pattern.search(class_str):
+                yield node
+                break
+
+
+def _has_digit(text: str) -> bool:
+    """Cheap check for the ASCII digits every phone pattern requires."""
+    return any(digit in text for digit in '0123456789')
+
+
+# Cleaned text and subtree lookups of tags seen while extracting the
+# current page, keyed by id(tag). Per thread because detail pages are
+# extracted concurrently.
+_page_cache = threading.local()
+
+
+@contextmanager
+def page_text_cache():
+    """
+    Memoize each tag's cleaned text and subtree lookups for one extraction call.
+
+    Several field extractors clean the same nodes (headings, paragraphs,
+    class-matched spans) and search the same subtrees (links, blocks);
+    inside this context each is walked once. Nested uses share the
+    outermost cache.
+    """
+    if getattr(_page_cache, 'texts', None) is not None:
+        yield
+        return
+
+    _page_cache.texts = {}
+    _page_cache.queries = {}
+    try:
+        yield
+    finally:
+        _page_cache.texts = None
+        _page_cache.queries = None
+
+
+def _tag_text(tag: Tag) -> str:
+    """
+    tag.get_text(), without bs4's per-string isinstance checks.
+
+    get_text() keeps the descendant strings whose exact type is one of the
+    tag's interesting_string_types; filtering on that set inline yields the
+    same text with much less Python overhead per node.
+    """
+    types = _string_types(tag)
+    return ''.join([node for node in tag.descendants if type(node) in types])
+
+
+def _string_types(tag: Tag) -> tuple:
+    """The string classes whose text tag.get_text() includes."""
+    types = tag.interesting_string_types or Tag.MAIN_CONTENT_STRING_TYPES
+    if isinstance(types, type):
+        types = (types,)
+    return types
+
+
+def _clean_tag_text(tag: Tag) -> str:
+    """clean_text(tag.get_text()), memoized inside page_text_cache()."""
+    texts = getattr(_page_cache, 'texts', None)
+    if texts is None:
+        return clean_text(_tag_text(tag))
+
+    entry = texts.get(id(tag))
+    if entry is None:
+        # Keep the tag alive with its text so its id cannot be reused
+        entry = texts[id(tag)] = (tag, clean_text(_tag_text(tag)))
+    return entry[1]
+
+
+def _descendant_tags(element: Tag, names: frozenset) -> List[Tag]:
+    """
+    element.find_all(list(names)) as a plain walk over the descendants.
+
+    bs4's find_all builds a filter with a match rule per name on every call
+    and runs each tag through it in Python; for a name lookup a set test
+    per descendant gives the same tags in the same order several times
+    faster. Strings have a name of None, so they never match.
+    """
+    return [node for node in element.descendants if node.name in names]
+
+
+def _find_all_tags(element: Tag, names: Tuple[str, ...]) -> List[Tag]:
+    """
+    element.find_all(list(names)), memoized inside page_text_cache().
+
+    The first lookup under an element collects every _QUERY_TAGS descendant
+    in one walk; each distinct names tuple is then a filter of that list.
+    """
+    queries = getattr(_page_cache, 'queries', None)
+    if queries is None:
+        return _descendant_tags(element, frozenset(names))
+
+    entry = queries.get(id(element))
+    if entry is None:
+        # Keep the element alive with its lookups so its id cannot be reused
+        entry = queries[id(element)] = (element, _descendant_tags(element, _QUERY_TAGS), {})
+    _, nodes, by_names = entry
+
+    found = by_names.get(names)
+    if found is None:
+        found = by_names[names] = [node for node in nodes if node.name in names]
+    return found
+
+
+def _find_tag(element: Tag, names: Tuple[str, ...]) -> Optional[Tag]:
+    """element.find(list(names)), served from _find_all_tags."""
+    found = _find_all_tags(element, names)
+    return found[0] if found else None
+
+
+def _find_links(element: Tag) -> List[Tag]:
+    """element.find_all('a', href=True), memoized inside page_text_cache()."""
+    return [link for link in _find_all_tags(element, ('a',)) if link.get('href') is not None]
+
+
+def _short_clean_tag_text(tag: Tag, limit: int) -> Optional[str]:
+    """
+    _clean_tag_text(tag) if it is shorter than limit, otherwise None.
+
+    Cleaning only collapses whitespace, so the cleaned text is at least as
+    long as the non-whitespace characters seen so far. The walk stops as
+    soon as those reach limit, so an oversized candidate (a whole card
+    matched by a "title" class) is rejected without collecting its text.
+    """
+    texts = getattr(_page_cache, 'texts', None)
+    entry = texts.get(id(tag)) if texts is not None else None
+    if entry is not None:
+        text = entry[1]
+        return text if len(text) < limit else None
+
+    types = _string_types(tag)
+    parts = []
+    visible = 0
+    for node in tag.descendants:
+        if type(node) in types:
+            parts.append(node)
+            visible += sum(map(len, node.split()))
+            if visible >= limit:
+                return None
+
+    text = clean_text(''.join(parts))
+    if texts is not None:
+        # Keep the tag alive with its text so its id cannot be reused
+        texts[id(tag)] = (tag, text)
+    return text if len(text) < limit else None
+
+
+def _clean_prefix(text: str, length: int) -> str:
+    """
+    Return a string whose first `length` chars equal clean_text(text)'s.
+
+    Cleaning a prefix of the raw text yields a prefix of the cleaned text, so
+    long texts are cleaned a window at a time instead of all at once.
+    """
+    window = length * 4
+    while window < len(text):
+        cleaned = clean_text(text[:window])
+        if len(cleaned) >= length:
+            return cleaned
+        window *= 4
+    return clean_text(text)
+
+
+# Callers pass the same element text to every email- and phone-like field in
+# a schema (e.g. "phone" and "mobile_phone"), so whole-text scans are memoized
+@lru_cache(maxsize=16)
+def _text_email(text: str) -> Optional[str]:
+    """extract_email(text), memoized per text."""
+    return extract_email(text)
+
+
+@lru_cache(maxsize=16)
+def _text_phone(text: str) -> Optional[str]:
+    """extract_phone(text), memoized per text."""
+    return extract_phone(text)
+
+
+@lru_cache(maxsize=256)
+def _field_kind(field_name: str) -> str:
+    """Classify a schema field name; the result keys _FIELD_EXTRACTORS."""
+    name = field_name.lower()
+
+    # Special handling for common field types
+    if 'email' in name:
+        return 'email'
+    elif 'phone' in name:
+        return 'phone'
+    elif 'url' in name or 'link' in name:
+        return 'url'
+    elif 'image' in name or 'photo' in name:
+        return 'image'
+    elif name in _NAME_FIELD_NAMES:
+        return 'name'
+    elif 'bio' in name or 'description' in name:
+        return 'bio'
+    elif 'address' in name or 'location' in name:
+        return 'address'
+    else:
+        # Generic text extraction
+        return 'generic'
+
+
+@lru_cache(maxsize=256)
+def _significant_keywords(field_description: str, field_name: str) -> Tuple[str, ...]:
+    """Keywords _extract_generic_text looks for, from the field's description and name."""
+    # Extract keywords from description and name
+    keywords = _WORD_RE.findall(field_description.lower())
+    if field_name:
+        keywords.extend(_WORD_RE.findall(field_name.lower()))
+
+    # Keep the first occurrence of each keyword so they are tried in the
+    # order the schema describes them, the same way on every run
+    seen = set()
+    significant_keywords = []
+    for k in keywords:
+        if len(k) >= 3 and k not in _KEYWORD_STOPWORDS and k not in seen:
+            seen.add(k)
+            significant_keywords.append(k)
+    return tuple(significant_keywords)
+
+
+@lru_cache(maxsize=256)
+def _position_role(field_name: str) -> str:
+    """How _extract_from_table_row places a field by its cell's text length."""
+    name = field_name.lower()
+    if name in _NAME_FIELD_NAMES:
+        return 'name'
+    elif 'bio' in name or 'description' in name:
+        return 'bio'
+    return 'generic'
+
+
+@lru_cache(maxsize=32)
+def _url_field(field_names: Tuple[str, ...]) -> Optional[str]:
+    """The first field _extract_from_table_row fills with a cell's link, if any."""
+    return next(
+        (f for f in field_names if 'url' in f.lower() or 'link' in f.lower() or 'website' in f.lower()),
+        None
+    )
+
 
 class DataExtractor:
     """Extracts structured data from HTML elements."""
@@ -27,19 +448,23 @@ class DataExtractor:
         Returns:
             Dictionary of extracted data
         """
-        result = {}
+        return DataExtractor.compile_schema(field_schema)(element, base_url)
 
-        # Check if this is a table row - use table-aware extraction
-        if element.name == 'tr':
-            result = DataExtractor._extract_from_table_row(element, field_schema, base_url)
-        else:
-            for field_name, field_description in field_schema.items():
-                value = DataExtractor._extract_field(
-                    element, field_name, field_description, base_url
-                )
-                result[field_name] = value
+    @staticmethod
+    def compile_schema(field_schema: Dict[str, str]) -> Callable[[Tag, str], Dict[str, Any]]:
+        """
+        Build an extractor specialized to one field schema.
 
-        return result
+        Each field's extractor is resolved once up front, so extracting an
+        element only runs the per-field work. The result is cached per schema.
+
+        Args:
+            field_schema: Dictionary mapping field names to descriptions
+
+        Returns:
+            Function taking (element, base_url) and returning extracted data
+        """
+        return _compile_schema(tuple(field_schema.items()))
 
     @staticmethod
     def extract_from_table_row_with_headers(
@@ -57,70 +482,80 @@ class DataExtractor:
             base_url: Base URL
             headers: List of table headers
 
+        Returns:
+            Extracted data
+        """
+        col_to_fields = DataExtractor.map_headers_to_fields(headers, field_schema)
+        return DataExtractor.extract_from_table_row_with_headers_cached(
+            row, field_schema, base_url, col_to_fields
+        )
+
+    @staticmethod
+    def map_headers_to_fields(
+        headers: List[str],
+        field_schema: Dict[str, str]
+    ) -> Dict[int, Tuple[str, ...]]:
+        """
+        Map table columns to schema fields by header name.
+
+        The mapping only depends on the headers and the field names, so it is
+        cached and can be computed once per table rather than once per row.
+
+        Args:
+            headers: List of table headers
+            field_schema: Field schema
+
+        Returns:
+            Dictionary mapping column index to the matching field names
+        """
+        return _compute_header_mapping(
+            tuple(header.lower() for header in headers), tuple(field_schema)
+        )
+
+    @staticmethod
+    def extract_from_table_row_with_headers_cached(
+        row: Tag,
+        field_schema: Dict[str, str],
+        base_url: str,
+        col_to_fields: Dict[int, Tuple[str, ...]]
+    ) -> Dict[str, Any]:
+        """
+        Extract data from a table row using a precomputed column mapping.
+
+        Args:
+            row: Table row element
+            field_schema: Field schema
+            base_url: Base URL
+            col_to_fields: Mapping from map_headers_to_fields
+
         Returns:
             Extracted data
         """
         result = {}
-        cells = row.find_all(['td', 'th'])
+        cells = _descendant_tags(row, _CELL_TAGS)
 
         if not cells:
             return DataExtractor._extract_from_table_row(row, field_schema, base_url)
 
-        # Map headers to schema fields
-        col_to_fields = {}  # col_idx -> List[field_name]
-        
-        for col_idx, header in enumerate(headers):
-            if col_idx >= len(cells):
-                break
-                
-            header_lower = header.lower()
-            
-            # Find all matching fields
-            for field_name, field_desc in field_schema.items():
-                score = 0
-                name_lower = field_name.lower()
-                
-                # Exact match
-                if name_lower == header_lower:
-                    score = 100
-                # Header contains field name (e.g. "Employee Name" -> "name")
-                elif name_lower in header_lower:
-                    score = 80
-                # Field name contains header
-                elif header_lower in name_lower:
-                    score = 60
-                
-                # Common synonyms
-                if 'email' in header_lower and 'email' in name_lower:
-                    score = 90
-                elif 'phone' in header_lower and 'phone' in name_lower:
-                    score = 90
-                elif ('address' in header_lower or 'location' in header_lower) and ('address' in name_lower or 'location' in name_lower):
-                    score = 90
-                elif ('link' in header_lower or 'website' in header_lower) and ('url' in name_lower or 'website' in name_lower):
-                    score = 90
-                elif ('type' in header_lower or 'category' in header_lower) and ('type' in name_lower or 'category' in name_lower):
-                    score = 90
-                    
-                if score > 50:
-                    if col_idx not in col_to_fields:
-                        col_to_fields[col_idx] = []
-                    col_to_fields[col_idx].append(field_name)
-
         # Extract data
-        for col_idx, cell in enumerate(cells):
-            if col_idx in col_to_fields:
-                for field_name in col_to_fields[col_idx]:
-                    # Extract specific field from this cell
-                    value = DataExtractor._extract_field(cell, field_name, field_schema[field_name], base_url)
-                    
-                    if value:
-                        if field_name in result and result[field_name]:
-                            # Append if already exists
-                            if value not in result[field_name]: # Avoid duplicates
-                                result[field_name] += " " + value
-                        else:
-                            result[field_name] = value
+        with page_text_cache():
+            for col_idx, cell in enumerate(cells):
+                if col_idx in col_to_fields:
+                    # One text walk per cell, shared by every field mapped to it
+                    cell_text = _tag_text(cell)
+                    for field_name in col_to_fields[col_idx]:
+                        # Extract specific field from this cell
+                        value = DataExtractor._extract_field_with_text(
+                            cell, field_name, field_schema[field_name], base_url, cell_text
+                        )
+
+                        if value:
+                            if field_name in result and result[field_name]:
+                                # Append if already exists
+                                if value not in result[field_name]: # Avoid duplicates
+                                    result[field_name] += " " + value
+                            else:
+                                result[field_name] = value
 
         # Fill missing fields with None (or try fallback extraction?)
         # If we missed important fields, maybe we should try the heuristic extraction for those specific fields on unmapped cells?
@@ -152,12 +587,15 @@ class DataExtractor:
         result = {}
 
         # Get all cells
-        cells = row.find_all(['td', 'th'])
+        cells = _descendant_tags(row, _CELL_TAGS)
 
         if not cells:
             # Fallback to regular extraction
+            row_text = _tag_text(row)
             for field_name, field_description in field_schema.items():
-                value = DataExtractor._extract_field(row, field_name, field_description, base_url)
+                value = DataExtractor._extract_field_with_text(
+                    row, field_name, field_description, base_url, row_text
+                )
                 result[field_name] = value
             return result
 
@@ -166,53 +604,68 @@ class DataExtractor:
 
         field_names = list(field_schema.keys())
 
+        # Walk each cell's text once; both strategies and the final
+        # extraction reuse it
+        raw_texts = [_tag_text(cell) for cell in cells]
+        clean_texts = [clean_text(text) for text in raw_texts]
+
         # Strategy 1: Map by cell content type
         cell_assignments = {}
+        url_field = _url_field(tuple(field_names))
 
         for i, cell in enumerate(cells):
             # Check what type of data this cell contains
-            cell_text = clean_text(cell.get_text())
+            cell_text = clean_texts[i]
+            want_email = 'email' in field_names and 'email' not in cell_assignments
+            want_phone = 'phone' in field_names and 'phone' not in cell_assignments
+            want_url = url_field is not None and url_field not in cell_assignments
+            if not (want_email or want_phone or want_url):
+                continue
+
+            # One scan for the cell's links serves all three checks
+            hrefs = [
+                link['href'] for link in _descendant_tags(cell, _LINK_TAGS) if link.get('href') is not None
+            ]
 
             # Email detection
-            if 'email' in field_names and 'email' not in cell_assignments:
-                email_link = cell.find('a', href=re.compile(r'mailto:', re.I))
-                if email_link or extract_email(cell_text):
+            if want_email:
+                has_mailto = any(_MAILTO_RE.search(href) for href in hrefs)
+                if has_mailto or ('@' in cell_text and extract_email(cell_text)):
                     cell_assignments['email'] = i
                     continue
 
             # Phone detection
-            if 'phone' in field_names and 'phone' not in cell_assignments:
-                phone_link = cell.find('a', href=re.compile(r'tel:', re.I))
-                if phone_link or extract_phone(cell_text):
+            if want_phone:
+                has_tel = any(_TEL_RE.search(href) for href in hrefs)
+                if has_tel or (_has_digit(cell_text) and extract_phone(cell_text)):
                     cell_assignments['phone'] = i
                     continue
 
             # URL detection
-            url_field = next((f for f in field_names if 'url' in f.lower() or 'link' in f.lower() or 'website' in f.lower()), None)
-            if url_field and url_field not in cell_assignments:
-                link = cell.find('a', href=True)
-                if link and not link['href'].startswith(('mailto:', 'tel:', '#')):
+            if want_url:
+                if hrefs and not hrefs[0].startswith(('mailto:', 'tel:', '#')):
                     cell_assignments[url_field] = i
                     continue
 
         # Strategy 2: Assign remaining fields by position
         assigned_cells = set(cell_assignments.values())
+        field_roles = [(field_name, _position_role(field_name)) for field_name in field_names]
 
         for i, cell in enumerate(cells):
             if i in assigned_cells:
                 continue
 
-            cell_text = clean_text(cell.get_text())
+            cell_text = clean_texts[i]
             if not cell_text or len(cell_text) < 2:
                 continue
 
             # Find first unassigned field
-            for field_name in field_names:
+            for field_name, role in field_roles:
                 if field_name in cell_assignments:
                     continue
 
                 # Name/title usually comes first
-                if field_name.lower() in ['name', 'title', 'position', 'role']:
+                if role == 'name':
                     # Should be reasonable length text
                     if 2 < len(cell_text) < 200:
                         cell_assignments[field_name] = i
@@ -220,7 +673,7 @@ class DataExtractor:
                         break
 
                 # Bio/description usually longer
-                elif 'bio' in field_name.lower() or 'description' in field_name.lower():
+                elif role == 'bio':
                     if len(cell_text) > 50:
                         cell_assignments[field_name] = i
                         assigned_cells.add(i)
@@ -233,18 +686,25 @@ class DataExtractor:
                     break
 
         # Extract values based on assignments
+        row_text = None
         for field_name in field_names:
             if field_name in cell_assignments:
                 cell_index = cell_assignments[field_name]
                 if cell_index < len(cells):
                     cell = cells[cell_index]
-                    value = DataExtractor._extract_field(cell, field_name, field_schema[field_name], base_url)
+                    value = DataExtractor._extract_field_with_text(
+                        cell, field_name, field_schema[field_name], base_url, raw_texts[cell_index]
+                    )
                     result[field_name] = value
                 else:
                     result[field_name] = None
             else:
                 # Try regular extraction on the whole row
-                value = DataExtractor._extract_field(row, field_name, field_schema[field_name], base_url)
+                if row_text is None:
+                    row_text = _tag_text(row)
+                value = DataExtractor._extract_field_with_text(
+                    row, field_name, field_schema[field_name], base_url, row_text
+                )
                 result[field_name] = value
 
         return result
@@ -257,38 +717,44 @@ class DataExtractor:
         base_url: str
     ) -> Optional[str]:
         """Extract a single field from an element."""
+        return DataExtractor._extract_field_with_text(
+            element, field_name, field_description, base_url, None
+        )
 
-        # Special handling for common field types
-        if 'email' in field_name.lower():
-            return DataExtractor._extract_email_field(element)
-
-        elif 'phone' in field_name.lower():
-            return DataExtractor._extract_phone_field(element)
-
-        elif 'url' in field_name.lower() or 'link' in field_name.lower():
-            return DataExtractor._extract_url_field(element, base_url)
-
-        elif 'image' in field_name.lower() or 'photo' in field_name.lower():
-            return DataExtractor._extract_image_field(element, base_url)
-
-        elif field_name.lower() in ['name', 'title', 'position', 'role']:
-            return DataExtractor._extract_name_or_title(element)
+    @staticmethod
+    def _extract_field_with_text(
+        element: Tag,
+        field_name: str,
+        field_description: str,
+        base_url: str,
+        cached_text: Optional[str]
+    ) -> Optional[str]:
+        """
+        Extract a single field, reusing the element's already-extracted text.
 
-        elif 'bio' in field_name.lower() or 'description' in field_name.lower():
-            return DataExtractor._extract_bio(element)
+        Args:
+            element: HTML element
+            field_name: Field name
+            field_description: Field description
+            base_url: Base URL
+            cached_text: element.get_text(), or None to compute it on demand
 
-        elif 'address' in field_name.lower() or 'location' in field_name.lower():
-            return DataExtractor._extract_address(element)
+        Returns:
+            Extracted value
+        """
 
-        else:
-            # Generic text extraction
-            return DataExtractor._extract_generic_text(element, field_description, field_name)
+        extractor = _FIELD_EXTRACTORS[_field_kind(field_name)]
+        return extractor(element, field_name, field_description, base_url, cached_text)
 
     @staticmethod
-    def _extract_email_field(element: Tag) -> Optional[str]:
-        """Extract email from element."""
+    def _extract_email_field(element: Tag, text: Optional[str] = None) -> Optional[str]:
+        """Extract email from element, given its get_text() if already known."""
+        # One walk collects every link; the mailto check and the href/text
+        # checks below both read from it
+        links = _find_links(element)
+
         # Look for mailto links (recursive)
-        mailto = element.find('a', href=re.compile(r'^mailto:', re.I))
+        mailto = next((link for link in links if _MAILTO_PREFIX_RE.match(link['href'])), None)
         if mailto:
             email = mailto['href'].replace('mailto:', '').split('?')[0].strip()
             if email and '@' in email:
@@ -301,38 +767,50 @@ class DataExtractor:
                 if email and '@' in email:
                     return email
 
+        # The text is only needed past the link and attribute checks
+        if text is None:
+            text = _tag_text(element)
+
+        # Every text-based match below needs an '@', so without one in the
+        # element's text only the href check can succeed
+        has_at = '@' in text
+
         # Look in nested elements with email-related classes
-        for pattern in [r'email', r'mail', r'contact']:
-            email_el = element.find(['span', 'div', 'p', 'td'], {'class': re.compile(pattern, re.I)})
-            if email_el:
-                email = extract_email(email_el.get_text())
-                if email:
-                    return email
+        if has_at:
+            for email_el in _iter_class_matches(
+                element, ('span', 'div', 'p', 'td'), _EMAIL_CLASS_PATTERNS, _EMAIL_CLASS_RE
+            ):
+                if email_el:
+                    email = extract_email(_tag_text(email_el))
+                    if email:
+                        return email
 
         # Look in all links (sometimes email is in href without mailto:)
-        links = element.find_all('a', href=True)
         for link in links:
             href = link.get('href', '')
             if '@' in href and '.' in href and not href.startswith(('http:', 'https:', 'tel:', 'javascript:')):
                 return href.strip()
             # Check link text
-            text = link.get_text(strip=True)
-            if extract_email(text):
-                return extract_email(text)
+            if has_at:
+                link_text = link.get_text(strip=True)
+                if '@' in link_text:
+                    email = extract_email(link_text)
+                    if email:
+                        return email
 
         # Look in text content (recursive but limited depth to avoid performance hit)
-        text = element.get_text()
-        email = extract_email(text)
-        if email:
-            return email
+        if has_at:
+            email = _text_email(text)
+            if email:
+                return email
 
         return None
 
     @staticmethod
-    def _extract_phone_field(element: Tag) -> Optional[str]:
-        """Extract phone from element."""
+    def _extract_phone_field(element: Tag, text: Optional[str] = None) -> Optional[str]:
+        """Extract phone from element, given its get_text() if already known."""
         # Look for tel links
-        tel = element.find('a', href=re.compile(r'^tel:', re.I))
+        tel = next((link for link in _find_links(element) if _TEL_PREFIX_RE.search(link['href'])), None)
         if tel:
             phone = tel['href'].replace('tel:', '').replace('+1', '').strip()
             if phone:
@@ -345,24 +823,32 @@ class DataExtractor:
                 if phone:
                     return phone
 
+        # The text is only needed past the link and attribute checks
+        if text is None:
+            text = _tag_text(element)
+
+        # Text-based matches all need a digit; skip them when there is none
+        if not _has_digit(text):
+            return None
+
         # Look in nested elements with phone-related classes
-        for pattern in [r'\bphone\b', r'\btel\b', r'\btelephone\b', r'\bcontact\b', r'\bcall\b', r'\bmobile\b', r'\bcell\b']:
-            phone_el = element.find(['span', 'div', 'p', 'td', 'a'], {'class': re.compile(pattern, re.I)})
+        for phone_el in _iter_class_matches(
+            element, ('span', 'div', 'p', 'td', 'a'), _PHONE_CLASS_PATTERNS, _PHONE_CLASS_RE
+        ):
             if phone_el:
-                phone = extract_phone(phone_el.get_text())
+                phone = extract_phone(_tag_text(phone_el))
                 if phone:
                     return phone
 
         # Look for text near "Phone:" label
-        label_match = re.search(r'(?:phone|tel|mobile|cell|contact)\s*:?\s*([+\d\s\-\(\)\.]+)', element.get_text(), re.I)
+        label_match = _PHONE_LABEL_RE.search(text)
         if label_match:
             potential_phone = label_match.group(1).strip()
             if extract_phone(potential_phone):
                 return potential_phone
 
         # Look in all text content
-        text = element.get_text()
-        phone = extract_phone(text)
+        phone = _text_phone(text)
         if phone:
             return phone
 
@@ -372,9 +858,9 @@ class DataExtractor:
     def _extract_url_field(element: Tag, base_url: str) -> Optional[str]:
         """Extract URL from element."""
         # Find first link
-        link = element.find('a', href=True)
-        if link:
-            return normalize_url(base_url, link['href'])
+        links = _find_links(element)
+        if links:
+            return normalize_url(base_url, links[0]['href'])
 
         return None
 
@@ -389,7 +875,7 @@ class DataExtractor:
         # Look for background image in style
         style = element.get('style', '')
         if 'background-image' in style:
-            match = re.search(r'url\([\'"]?([^\'"\)]+)[\'"]?\)', style)
+            match = _BG_IMAGE_RE.search(style)
             if match:
                 return normalize_url(base_url, match.group(1))
 
@@ -398,36 +884,40 @@ class DataExtractor:
     @staticmethod
     def _extract_name_or_title(element: Tag) -> Optional[str]:
         """Extract name or title."""
-        # Try headings first
-        for tag in ['h1', 'h2', 'h3', 'h4', 'h5']:
-            heading = element.find(tag)
+        # Try headings first, highest level first. One walk collects them
+        # all; the first heading of each level is then tried in order.
+        first_headings = {}
+        for heading in _find_all_tags(element, _HEADING_TAGS):
+            first_headings.setdefault(heading.name, heading)
+        for tag in _HEADING_TAGS:
+            heading = first_headings.get(tag)
             if heading:
-                text = clean_text(heading.get_text())
-                if text and 2 < len(text) < 200:
+                text = _short_clean_tag_text(heading, 200)
+                if text and len(text) > 2:
                     return text
 
         # Try elements with name/title classes
-        for pattern in [r'\bname\b', r'\btitle\b', r'\bheading\b', r'\blabel\b', r'\bheader\b']:
-            named = element.find(['div', 'span', 'p', 'td', 'th', 'strong', 'b'], {'class': re.compile(pattern, re.I)})
+        for named in _iter_class_matches(
+            element, ('div', 'span', 'p', 'td', 'th', 'strong', 'b'), _NAME_CLASS_PATTERNS, _NAME_CLASS_RE
+        ):
             if named:
-                text = clean_text(named.get_text())
-                if text and 2 < len(text) < 200:
+                text = _short_clean_tag_text(named, 200)
+                if text and len(text) > 2:
                     return text
 
         # Try strong/bold text (but not if it's just a label)
-        strong = element.find(['strong', 'b'])
+        strong = _find_tag(element, ('strong', 'b'))
         if strong:
-            text = clean_text(strong.get_text())
-            if text and 2 < len(text) < 200 and not text.endswith(':'):
+            text = _short_clean_tag_text(strong, 200)
+            if text and len(text) > 2 and not text.endswith(':'):
                 return text
 
         # Try first link text (but not mailto/tel links)
-        links = element.find_all('a', href=True)
-        for link in links:
+        for link in _find_links(element):
             href = link.get('href', '')
             if not href.startswith(('mailto:', 'tel:', 'javascript:', '#')):
-                text = clean_text(link.get_text())
-                if text and 2 < len(text) < 200:
+                text = _short_clean_tag_text(link, 200)
+                if text and len(text) > 2:
                     return text
 
         # Try data attributes
@@ -452,160 +942,233 @@ class DataExtractor:
         if not element:
             return None
 
-        # Get all text, but try to find the most prominent/first text
-        texts = []
-
+        # Return the first substantial text; later children are never read
         for child in element.children:
             if isinstance(child, str):
                 text = clean_text(child)
-                if text:
-                    texts.append(text)
-            elif hasattr(child, 'get_text'):
+            elif child.name in _INLINE_TEXT_TAGS:
                 # If child is a small inline element (span, b, i), treat as text
-                if child.name in ['span', 'b', 'i', 'strong', 'em', 'small']:
-                    text = clean_text(child.get_text())
-                    if text:
-                        texts.append(text)
+                text = _clean_tag_text(child)
+            else:
+                continue
 
-        if texts:
-            # Return longest or first substantial text
-            substantial = [t for t in texts if len(t) > 2]
-            if substantial:
-                return substantial[0]
+            if len(text) > 2:
+                return text
 
         return None
 
     @staticmethod
-    def _extract_bio(element: Tag) -> Optional[str]:
-        """Extract biography or description."""
+    def _extract_bio(element: Tag, text: Optional[str] = None) -> Optional[str]:
+        """Extract biography or description, given the element's text if already known."""
+        # One walk serves both the class-matched candidates and the paragraphs
+        blocks = _find_all_tags(element, ('div', 'p', 'span'))
+
         # Look for bio/description elements
-        for pattern in [r'bio', r'description', r'about', r'summary', r'content']:
-            bio_el = element.find(['div', 'p', 'span'], {'class': re.compile(pattern, re.I)})
+        for bio_el in _iter_class_matches(
+            element, ('div', 'p', 'span'), _BIO_CLASS_PATTERNS, _BIO_CLASS_RE, blocks
+        ):
             if bio_el:
-                text = clean_text(bio_el.get_text())
-                if text and len(text) > 50:
-                    return text
+                bio_text = _clean_tag_text(bio_el)
+                if bio_text and len(bio_text) > 50:
+                    return bio_text
 
         # Get all paragraph text
-        paragraphs = element.find_all('p')
+        paragraphs = [block for block in blocks if block.name == 'p']
         if paragraphs:
-            bio_text = ' '.join([clean_text(p.get_text()) for p in paragraphs])
+            bio_text = ' '.join(_clean_tag_text(p) for p in paragraphs)
             if bio_text and len(bio_text) > 50:
                 return bio_text
 
         # Fallback to all text if it's long enough
-        all_text = clean_text(element.get_text())
+        if text is None:
+            text = _tag_text(element)
+        all_text = _clean_prefix(text, 1000)
         if len(all_text) > 100:
             return all_text[:1000]  # Limit length
 
         return None
 
     @staticmethod
-    def _extract_address(element: Tag) -> Optional[str]:
-        """Extract address or location."""
+    def _extract_address(element: Tag, text: Optional[str] = None) -> Optional[str]:
+        """Extract address or location, given the element's text if already known."""
         # Look for address elements
-        address = element.find('address')
+        address = _find_tag(element, ('address',))
         if address:
-            text = clean_text(address.get_text())
-            if text:
-                return text
+            value = _clean_tag_text(address)
+            if value:
+                return value
 
         # Look for data attributes
         for attr in ['data-address', 'data-location', 'data-city']:
             if element.get(attr):
-                text = clean_text(element[attr])
-                if text:
-                    return text
+                value = clean_text(element[attr])
+                if value:
+                    return value
 
         # Look for location classes (more comprehensive patterns)
-        for pattern in [r'\blocation\b', r'\baddress\b', r'\bcity\b', r'\bstate\b', r'\bregion\b',
-                       r'\barea\b', r'\blocale\b', r'\bplace\b', r'\boffice\b']:
-            loc = element.find(['div', 'span', 'p', 'td'], {'class': re.compile(pattern, re.I)})
+        for loc in _iter_class_matches(
+            element, ('div', 'span', 'p', 'td'), _LOCATION_CLASS_PATTERNS, _LOCATION_CLASS_RE
+        ):
             if loc:
-                text = clean_text(loc.get_text())
-                if text and len(text) > 3:
-                    return text
+                value = _clean_tag_text(loc)
+                if value and len(value) > 3:
+                    return value
 
         # Look for itemprop address (schema.org markup)
-        schema_addr = element.find(['div', 'span'], {'itemprop': re.compile(r'address|location', re.I)})
-        if schema_addr:
-            text = clean_text(schema_addr.get_text())
-            if text:
-                return text
+        for schema_addr in _find_all_tags(element, ('div', 'span')):
+            itemprop = schema_addr.get('itemprop')
+            if itemprop and _ITEMPROP_ADDRESS_RE.search(itemprop):
+                value = _clean_tag_text(schema_addr)
+                if value:
+                    return value
+                break
 
         # Look for common address patterns in text
-        text = element.get_text()
-        # Look for city, state patterns
-        city_state_pattern = r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2})'
-        match = re.search(city_state_pattern, text)
-        if match:
-            return match.group(0)
-
-        # Look for street address patterns
-        street_pattern = r'\d+\s+[\w\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Way)'
-        match = re.search(street_pattern, text, re.I)
-        if match:
-            # Try to get more context
-            return match.group(0)
+        if text is None:
+            text = _tag_text(element)
+        # Look for city, state patterns (they always contain a comma)
+        if ',' in text:
+            match = _CITY_STATE_RE.search(text)
+            if match:
+                return match.group(0)
+
+        # Look for street address patterns (they always start with a number;
+        # \d also matches non-ASCII digits, so only ASCII text can be ruled out)
+        if _has_digit(text) or not text.isascii():
+            match = _STREET_RE.search(text)
+            if match:
+                # Try to get more context
+                return match.group(0)
 
         return None
 
     @staticmethod
-    def _extract_generic_text(element: Tag, field_description: str, field_name: str = "") -> Optional[str]:
-        """Generic text extraction based on keywords."""
-        # Extract keywords from description and name
-        keywords = re.findall(r'\b\w+\b', field_description.lower())
-        if field_name:
-            keywords.extend(re.findall(r'\b\w+\b', field_name.lower()))
-            
-        significant_keywords = [k for k in keywords if len(k) >= 3 and k not in
-                               ['the', 'and', 'for', 'that', 'with', 'from', 'extract', 'get', 'find']]
-        
-        # Remove duplicates
-        significant_keywords = list(set(significant_keywords))
+    def _extract_generic_text(
+        element: Tag,
+        field_description: str,
+        field_name: str = "",
+        text: Optional[str] = None
+    ) -> Optional[str]:
+        """Generic text extraction based on keywords, given the element's text if already known."""
+        significant_keywords = _significant_keywords(field_description, field_name)
+
+        # One pass over the candidate tags records the first element whose
+        # class or id matches each keyword. The alternation of all keywords
+        # rules out most elements before any per-keyword pattern runs.
+        class_matches = {}
+        id_matches = {}
+        has_label = False
+        if significant_keywords:
+            alternation = '|'.join(re.escape(k) for k in significant_keywords)
+            any_keyword = _keyword_re(alternation)
+            for node in _find_all_tags(element, ('div', 'span', 'p', 'td', 'dd', 'li')):
+                classes = node.get('class')
+                if classes:
+                    class_str = ' '.join(classes) if isinstance(classes, list) else classes
+                    if any_keyword.search(class_str):
+                        for keyword in significant_keywords:
+                            if keyword not in class_matches and _keyword_re(keyword).search(class_str):
+                                class_matches[keyword] = node
+                node_id = node.get('id')
+                if node_id and any_keyword.search(node_id):
+                    for keyword in significant_keywords:
+                        if keyword not in id_matches and _keyword_re(keyword).search(node_id):
+                            id_matches[keyword] = node
+
+            # Per-keyword label searches only run if some label is present.
+            # Every label needs a ':' or '-', which rules out most texts
+            # before the alternation scan.
+            if text is None:
+                text = _tag_text(element)
+            has_label = (
+                (':' in text or '-' in text)
+                and _label_re(f'(?:{alternation})').search(text) is not None
+            )
 
         # Try to find elements matching keywords
         for keyword in significant_keywords:
             # Look for class/id matching keyword
-            found = element.find(['div', 'span', 'p', 'td', 'dd', 'li'], {'class': re.compile(keyword, re.I)})
-            if not found:
-                found = element.find(['div', 'span', 'p', 'td', 'dd', 'li'], {'id': re.compile(keyword, re.I)})
+            found = class_matches.get(keyword)
+            if found is None:
+                found = id_matches.get(keyword)
 
             if found:
-                text = clean_text(found.get_text())
-                if text and len(text) > 2:
-                    return text
+                found_text = _clean_tag_text(found)
+                if found_text and len(found_text) > 2:
+                    return found_text
 
             # Look for data attributes
             data_attr = f'data-{keyword}'
             if element.get(data_attr):
-                text = clean_text(element[data_attr])
-                if text:
-                    return text
+                attr_text = clean_text(element[data_attr])
+                if attr_text:
+                    return attr_text
                     
             # Look for text near label (e.g. "Department: Math")
-            label_pattern = re.compile(f"{keyword}\\s*[:\\-]\\s*([^\\n<]+)", re.I)
-            text_content = element.get_text()
-            match = label_pattern.search(text_content)
-            if match:
-                return match.group(1).strip()
+            if has_label:
+                match = _label_re(keyword).search(text)
+                if match:
+                    return match.group(1).strip()
 
         # Try common semantic HTML
         for tag in ['dd', 'blockquote', 'p', 'span']:
-            el = element.find(tag)
+            el = _find_tag(element, (tag,))
             if el:
-                text = clean_text(el.get_text())
-                if text and len(text) > 2:
-                    return text
+                el_text = _clean_tag_text(el)
+                if el_text and len(el_text) > 2:
+                    return el_text
 
         # Fallback to all text, but clean it
-        all_text = clean_text(element.get_text())
+        all_text = clean_text(_tag_text(element) if text is None else text)
         if all_text and len(all_text) > 2:
             return all_text[:500]
 
         return None
 
 
+# Field extractors by _field_kind, all called as
+# (element, field_name, field_description, base_url, cached_text)
+_FIELD_EXTRACTORS = {
+    'email': lambda element, name, desc, base_url, text: DataExtractor._extract_email_field(element, text),
+    'phone': lambda element, name, desc, base_url, text: DataExtractor._extract_phone_field(element, text),
+    'url': lambda element, name, desc, base_url, text: DataExtractor._extract_url_field(element, base_url),
+    'image': lambda element, name, desc, base_url, text: DataExtractor._extract_image_field(element, base_url),
+    'name': lambda element, name, desc, base_url, text: DataExtractor._extract_name_or_title(element),
+    'bio': lambda element, name, desc, base_url, text: DataExtractor._extract_bio(element, text),
+    'address': lambda element, name, desc, base_url, text: DataExtractor._extract_address(element, text),
+    'generic': lambda element, name, desc, base_url, text: DataExtractor._extract_generic_text(element, desc, name, text),
+}
+
+
+@lru_cache(maxsize=32)
+def _compile_schema(schema_items: Tuple[Tuple[str, str], ...]) -> Callable[[Tag, str], Dict[str, Any]]:
+    """Build the extractor for DataExtractor.compile_schema."""
+    field_schema = dict(schema_items)
+    fields = [
+        (field_name, field_description, _FIELD_EXTRACTORS[_field_kind(field_name)])
+        for field_name, field_description in schema_items
+    ]
+    # A schema of only link, image and name fields never reads the text
+    needs_text = any(_field_kind(field_name) not in ('url', 'image', 'name') for field_name in field_schema)
+
+    def extract(element: Tag, base_url: str) -> Dict[str, Any]:
+        result = {}
+
+        with page_text_cache():
+            # Check if this is a table row - use table-aware extraction
+            if element.name == 'tr':
+                result = DataExtractor._extract_from_table_row(element, field_schema, base_url)
+            else:
+                # Walk the element's text once and share it across all fields
+                text = _tag_text(element) if needs_text else None
+                for field_name, field_description, extractor in fields:
+                    result[field_name] = extractor(element, field_name, field_description, base_url, text)
+
+        return result
+
+    return extract
+
+
 class DetailPageExtractor:
     """Extracts data from detail pages."""
 
@@ -626,22 +1189,53 @@ class DetailPageExtractor:
         Returns:
             Extracted data
         """
-        result = {}
+        with page_text_cache():
+            return DetailPageExtractor._extract_from_page(soup, field_schema, base_url)
 
-        # Find main content area
-        main_content = (
-            soup.find('main') or
-            soup.find('article') or
-            soup.find('div', {'class': re.compile(r'content|main|profile|detail', re.I)}) or
-            soup.find('body')
-        )
+    @staticmethod
+    def _find_main_content(soup: BeautifulSoup) -> Tag:
+        """
+        Find the main content area: <main>, then <article>, then a content div, then <body>.
+
+        One walk records the first candidate of each kind, stopping early at
+        a <main> since nothing outranks it. Falls back to the whole soup.
+        """
+        article = content_div = body = None
+        for node in soup.descendants:
+            name = node.name
+            if name == 'main':
+                return node
+            elif name == 'article':
+                if article is None:
+                    article = node
+            elif name == 'div':
+                if content_div is None:
+                    classes = node.get('class')
+                    if classes:
+                        class_str = ' '.join(classes) if isinstance(classes, list) else classes
+                        if _MAIN_CONTENT_CLASS_RE.search(class_str):
+                            content_div = node
+            elif name == 'body':
+                if body is None:
+                    body = node
+
+        return article or content_div or body or soup
+
+    @staticmethod
+    def _extract_from_page(
+        soup: BeautifulSoup,
+        field_schema: Dict[str, str],
+        base_url: str
+    ) -> Dict[str, Any]:
+        """Extract data from a detail page; see extract_from_page."""
+        result = {}
 
-        if not main_content:
-            main_content = soup
+        main_content = DetailPageExtractor._find_main_content(soup)
 
+        text = _tag_text(main_content)
         for field_name, field_description in field_schema.items():
-            value = DataExtractor._extract_field(
-                main_content, field_name, field_description, base_url
+            value = DataExtractor._extract_field_with_text(
+                main_content, field_name, field_description, base_url, text
             )
             result[field_name] = value
 
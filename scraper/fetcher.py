@@ -1,17 +1,77 @@
 """Content fetcher supporting both static and dynamic pages."""
 
 import asyncio
+import collections
+import concurrent.futures
+import itertools
+import os
+import re
 import time
-import random
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 from enum import Enum
+from urllib.parse import urlsplit
 
+import aiohttp
 import requests
 from bs4 import BeautifulSoup
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .utils import get_url_hash
+
+# Script sources that mark a page as a client-rendered single-page app
+_SPA_SCRIPT_RE = re.compile(r'react|vue|angular', re.I)
+
+# Raw-HTML prefilters for the AUTO checks on id="root"/"app" and SPA script
+# sources. Each matches every page its check could flag, so a miss means
+# the tree lookup can be skipped.
+_ROOT_ID_MARKER_RE = re.compile(r'id\s*=\s*["\']?(?:root|app)\b', re.I)
+_SPA_SCRIPT_MARKER_RE = re.compile(
+    r'<script\b(?:[^>"\']|"[^"]*"|\'[^\']*\')*?(?:"[^"]*?|\'[^\']*?)?(?:react|vue|angular)',
+    re.I
+)
+
+# Resources a rendered page can skip: they add no text or links for the
+# extractor, but downloading them delays networkidle. Stylesheets still load because
+# infinite-scroll and lazy-load triggers depend on layout.
+_BLOCKED_RESOURCE_TYPES = frozenset(['image', 'media', 'font'])
+
+
+async def _block_heavy_resources(route):
+    """Playwright route handler that aborts _BLOCKED_RESOURCE_TYPES requests."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Statuses a static fetch is retried on, as for the requests session
+_RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+
+class _RateLimiter:
+    """
+    Spaces out awaiting callers on one schedule.
+
+    Each caller names its own rate, so requests paced differently (listing
+    and detail pages) still queue behind each other on the same host.
+    """
+
+    def __init__(self):
+        self._next_slot = 0.0
+
+    async def acquire(self, rate: float):
+        """Wait for the next free slot, then hold it for 1/rate seconds."""
+        now = asyncio.get_running_loop().time()
+        # Claim the slot before sleeping so concurrent callers queue up
+        # behind each other instead of all waking at once
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + 1.0 / rate
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
 
 class FetchStrategy(Enum):
     """Fetching strategy."""
@@ -31,37 +91,237 @@ class ContentFetcher:
         "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     ]
 
-    def __init__(self, timeout: int = 30, user_agent: Optional[str] = None):
+    # Headers sent with every static request besides the User-Agent
+    BASE_HEADERS = {
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+    }
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        user_agent: Optional[str] = None,
+        pool_size: int = 10,
+        cache_dir: Optional[str] = None,
+        cache_ttl: int = 3600,
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize the fetcher.
 
         Args:
             timeout: Request timeout in seconds
             user_agent: Custom user agent string
+            pool_size: Keep-alive connections kept per host; should be at least
+                the number of threads fetching through this fetcher
+            cache_dir: Directory to cache fetched pages in; None disables caching
+            cache_ttl: Seconds a cached page is served before it is refetched
+            session: Session to fetch static pages with, so several fetchers
+                can share its keep-alive connections; it is used as given and
+                left open by close(). None creates one with retries.
         """
         self.timeout = timeout
         self.user_agent = user_agent
+        self.pool_size = pool_size
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        # Rotate through the user agents in order; next() on a cycle is atomic,
+        # so fetch threads can share it
+        self._user_agents = itertools.cycle(self.USER_AGENTS)
         
-        self.session = requests.Session()
-        
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
+        self._owns_session = session is None
+        if session is not None:
+            self.session = session
+        else:
+            self.session = requests.Session()
+
+            # Configure retry strategy
+            retry_strategy = Retry(
+                total=3,
+                backoff_factor=1,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["HEAD", "GET", "OPTIONS"]
+            )
+            # Size the pool for concurrent detail-page fetches; a smaller pool
+            # discards connections and pays a new TCP/TLS handshake per request
+            adapter = HTTPAdapter(
+                max_retries=retry_strategy,
+                pool_connections=pool_size,
+                pool_maxsize=pool_size
+            )
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
+        # Playwright objects are bound to the event loop that created them, so
+        # dynamic fetches all run on one background loop that owns a single
+        # browser for the fetcher's lifetime (both started on first use)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._playwright = None
+        self._browser = None
+        self._browser_lock: Optional[asyncio.Lock] = None
+        # aiohttp session for concurrent static fetches, also on that loop
+        self._aio_session: Optional[aiohttp.ClientSession] = None
+        # Host -> rate limiter shared by every iterator fetching from it;
+        # only touched on that loop
+        self._rate_limiters: Dict[str, _RateLimiter] = {}
+
+    def _next_user_agent(self) -> str:
+        """Get the custom user agent, or the next one in the rotation."""
+        return self.user_agent or next(self._user_agents)
 
     def _get_headers(self) -> Dict[str, str]:
         """Get headers with rotated user agent."""
-        return {
-            "User-Agent": self.user_agent or random.choice(self.USER_AGENTS),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-        }
+        headers = {"User-Agent": self._next_user_agent()}
+        headers.update(self.BASE_HEADERS)
+        return headers
+
+    def _submit(self, coro) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine on the fetcher's background event loop.
+
+        Safe to call from several threads at once; starts the loop on first use.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Future for the coroutine's result
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name="ContentFetcherLoop", daemon=True
+                )
+                self._loop_thread.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def _run(self, coro):
+        """
+        Run a coroutine on the fetcher's background event loop.
+
+        Safe to call from several threads at once; blocks until the coroutine
+        finishes.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            The coroutine's result
+        """
+        return self._submit(coro).result()
+
+    def _on_own_loop(self) -> bool:
+        """Whether the running event loop is the fetcher's background loop."""
+        return self._loop is not None and asyncio.get_running_loop() is self._loop
+
+    async def _get_aio_session(self) -> aiohttp.ClientSession:
+        """Get the fetcher's aiohttp session, opening it on first use."""
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit_per_host=self.pool_size)
+            )
+        return self._aio_session
+
+    async def _new_context(self):
+        """
+        Open a browser context on the shared browser, launching it if needed.
+
+        Only called on the fetcher's background loop, which owns the browser.
+
+        Contexts are cheap compared to a Chromium launch, so each fetch still
+        gets its own (fresh cookies and a rotated user agent).
+
+        Returns:
+            Playwright BrowserContext; the caller closes it
+        """
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+
+        context = await self._browser.new_context(
+            user_agent=self._next_user_agent(),
+            viewport={'width': 1920, 'height': 1080}
+        )
+        await context.route("**/*", _block_heavy_resources)
+        return context
+
+    @staticmethod
+    def _decode_response(response: requests.Response) -> str:
+        """
+        Decode a response body the way response.text does, but cheaper.
+
+        response.text runs charset detection over the whole body whenever the
+        headers declare no encoding. Bytes that decode as strict UTF-8 are
+        taken as UTF-8 instead (what detection reports for them), so
+        detection only runs on the rare non-UTF-8 page.
+
+        Args:
+            response: Completed requests response
+
+        Returns:
+            Decoded HTML content
+        """
+        content = response.content
+        encoding = response.encoding
+        if encoding is None:
+            try:
+                return content.decode('utf-8')
+            except UnicodeDecodeError:
+                encoding = response.apparent_encoding
+        try:
+            return str(content, encoding, errors='replace')
+        except (LookupError, TypeError):
+            return str(content, errors='replace')
+
+    def _cache_path(self, kind: str, key: str) -> str:
+        """Path of the cache file for a fetch of the given kind and key."""
+        return os.path.join(self.cache_dir, f"{kind}-{get_url_hash(key)}.html")
+
+    def _read_cache(self, kind: str, key: str) -> Optional[str]:
+        """
+        Get cached content if caching is enabled and the entry is still fresh.
+
+        Args:
+            kind: Fetch kind ("static" or "dynamic"); rendered and raw HTML differ
+            key: URL (plus anything else that changes the content)
+
+        Returns:
+            Cached HTML content or None
+        """
+        if not self.cache_dir:
+            return None
+        path = self._cache_path(kind, key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.cache_ttl:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_cache(self, kind: str, key: str, content: str):
+        """Store fetched content if caching is enabled."""
+        if not self.cache_dir:
+            return
+        path = self._cache_path(kind, key)
+        # Write then rename so a concurrent reader never sees a partial file
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Could not cache {key}: {e}")
 
     def fetch_static(self, url: str) -> Optional[str]:
         """
@@ -73,6 +333,10 @@ class ContentFetcher:
         Returns:
             HTML content or None if failed
         """
+        cached = self._read_cache("static", url)
+        if cached is not None:
+            return cached
+
         try:
             response = self.session.get(
                 url, 
@@ -80,15 +344,87 @@ class ContentFetcher:
                 headers=self._get_headers()
             )
             response.raise_for_status()
-            return response.text
+            content = self._decode_response(response)
         except Exception as e:
             print(f"Static fetch failed for {url}: {e}")
             return None
 
+        self._write_cache("static", url, content)
+        return content
+
+    async def fetch_static_async(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        retries: int = 3
+    ) -> Optional[str]:
+        """
+        Fetch content with a static HTTP request on an aiohttp session.
+
+        Connection errors, timeouts and retryable statuses are retried with
+        exponential backoff, like the requests session's retry adapter.
+
+        Args:
+            session: Open aiohttp session to issue the request on
+            url: URL to fetch
+            retries: Number of retries after the first attempt
+
+        Returns:
+            HTML content or None if failed
+        """
+        cached = self._read_cache("static", url)
+        if cached is not None:
+            return cached
+
+        for attempt in range(retries + 1):
+            try:
+                async with session.get(url, headers=self._get_headers()) as response:
+                    response.raise_for_status()
+                    content = await response.text()
+                break
+            except Exception as e:
+                retryable = (
+                    isinstance(e, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+                    or (isinstance(e, aiohttp.ClientResponseError) and e.status in _RETRY_STATUSES)
+                )
+                if not retryable or attempt == retries:
+                    print(f"Static fetch failed for {url}: {e}")
+                    return None
+                await asyncio.sleep(2 ** attempt)  # Exponential backoff
+
+        self._write_cache("static", url, content)
+        return content
+
+    def fetch_many(
+        self,
+        urls: List[str],
+        concurrency: int = 20,
+        rate: Optional[float] = None
+    ) -> List[Optional[str]]:
+        """
+        Fetch many URLs statically with up to `concurrency` requests in flight.
+
+        Request latency overlaps instead of adding up, which is what bounds a
+        batch of page downloads. Failed URLs come back as None.
+
+        Args:
+            urls: URLs to fetch
+            concurrency: Maximum simultaneous requests
+            rate: Maximum requests started per second to each host, counted
+                together with other fetches on this fetcher; None for no limit
+
+        Returns:
+            HTML content (or None) for each URL, in the same order as urls
+        """
+        return self._run(self._gather_limited(urls, FetchStrategy.STATIC, concurrency, rate))
+
     async def fetch_dynamic(self, url: str, wait_selector: Optional[str] = None, retries: int = 3) -> Optional[str]:
         """
         Fetch content using Playwright for JavaScript-rendered pages.
 
+        May be awaited from any event loop: the shared browser belongs to the
+        fetcher's background loop, so other callers are handed over to it.
+
         Args:
             url: URL to fetch
             wait_selector: CSS selector to wait for before extracting content
@@ -97,14 +433,18 @@ class ContentFetcher:
         Returns:
             HTML content or None if failed
         """
+        if not self._on_own_loop():
+            return await asyncio.wrap_future(self._submit(self.fetch_dynamic(url, wait_selector, retries)))
+
+        cache_key = f"{url} {wait_selector}" if wait_selector else url
+        cached = self._read_cache("dynamic", cache_key)
+        if cached is not None:
+            return cached
+
         for attempt in range(retries):
             try:
-                async with async_playwright() as p:
-                    browser = await p.chromium.launch(headless=True)
-                    context = await browser.new_context(
-                        user_agent=self.user_agent or random.choice(self.USER_AGENTS),
-                        viewport={'width': 1920, 'height': 1080}
-                    )
+                context = await self._new_context()
+                try:
                     page = await context.new_page()
 
                     await page.goto(url, wait_until="networkidle", timeout=self.timeout * 1000)
@@ -120,9 +460,10 @@ class ContentFetcher:
                     await page.wait_for_timeout(2000)
 
                     content = await page.content()
-                    await browser.close()
-
+                    self._write_cache("dynamic", cache_key, content)
                     return content
+                finally:
+                    await context.close()
 
             except Exception as e:
                 print(f"Dynamic fetch failed for {url} (attempt {attempt + 1}/{retries}): {e}")
@@ -132,10 +473,35 @@ class ContentFetcher:
                     return None
         return None
 
+    def fetch_dynamic_many(
+        self,
+        urls: List[str],
+        concurrency: int = 8,
+        rate: Optional[float] = None
+    ) -> List[Optional[str]]:
+        """
+        Render many URLs with up to `concurrency` pages open at once.
+
+        All pages share the fetcher's browser, so page loads and network-idle
+        waits overlap instead of running back to back.
+
+        Args:
+            urls: URLs to fetch
+            concurrency: Maximum pages rendering simultaneously
+            rate: Maximum requests started per second to each host; None for
+                no limit
+
+        Returns:
+            HTML content (or None) for each URL, in the same order as urls
+        """
+        return self._run(self._gather_limited(urls, FetchStrategy.DYNAMIC, concurrency, rate))
+
     async def fetch_with_scroll(self, url: str, scroll_count: int = 3) -> Optional[str]:
         """
         Fetch content with scrolling for infinite scroll pages.
 
+        Like fetch_dynamic, may be awaited from any event loop.
+
         Args:
             url: URL to fetch
             scroll_count: Number of times to scroll
@@ -143,13 +509,12 @@ class ContentFetcher:
         Returns:
             HTML content or None if failed
         """
+        if not self._on_own_loop():
+            return await asyncio.wrap_future(self._submit(self.fetch_with_scroll(url, scroll_count)))
+
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(
-                    user_agent=self.user_agent or random.choice(self.USER_AGENTS),
-                    viewport={'width': 1920, 'height': 1080}
-                )
+            context = await self._new_context()
+            try:
                 page = await context.new_page()
 
                 await page.goto(url, wait_until="networkidle", timeout=self.timeout * 1000)
@@ -159,31 +524,62 @@ class ContentFetcher:
                     await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
                     await page.wait_for_timeout(1000)
 
-                content = await page.content()
-                await browser.close()
-
-                return content
+                return await page.content()
+            finally:
+                await context.close()
 
         except Exception as e:
             print(f"Scroll fetch failed for {url}: {e}")
             return None
 
-    def fetch(self, url: str, strategy: FetchStrategy = FetchStrategy.AUTO) -> Optional[str]:
+    @staticmethod
+    def _looks_dynamic(content: str, soup: BeautifulSoup) -> bool:
         """
-        Fetch content using the specified strategy.
+        Check whether a statically fetched page seems to need JavaScript rendering.
+
+        The indicators are checked cheapest first and the first hit decides.
+
+        Args:
+            content: Raw HTML
+            soup: Parsed content
+
+        Returns:
+            True if the page has a SPA mount point, SPA framework scripts or
+            under 500 characters of text
+        """
+        # Minimal content: the text can never be longer than the raw HTML
+        if len(content) < 500:
+            return True
+
+        # React/Vue mount points
+        if _ROOT_ID_MARKER_RE.search(content) and (soup.find(id='root') or soup.find(id='app')):
+            return True
+
+        # SPA framework scripts
+        if _SPA_SCRIPT_MARKER_RE.search(content) and soup.find('script', src=_SPA_SCRIPT_RE):
+            return True
+
+        return len(soup.get_text(strip=True)) < 500
+
+    def _fetch(self, url: str, strategy: FetchStrategy) -> Tuple[Optional[str], Optional[BeautifulSoup]]:
+        """
+        Fetch content, returning the parsed tree too when one was built.
+
+        AUTO detection has to parse the static HTML; handing that tree back
+        lets get_soup skip parsing the same document a second time.
 
         Args:
             url: URL to fetch
             strategy: Fetching strategy to use
 
         Returns:
-            HTML content or None if failed
+            Tuple of (HTML content or None, BeautifulSoup of that content or None)
         """
         if strategy == FetchStrategy.STATIC:
-            return self.fetch_static(url)
+            return self.fetch_static(url), None
 
         elif strategy == FetchStrategy.DYNAMIC:
-            return asyncio.run(self.fetch_dynamic(url))
+            return self._run(self.fetch_dynamic(url)), None
 
         elif strategy == FetchStrategy.AUTO:
             # Try static first (faster)
@@ -193,20 +589,31 @@ class ContentFetcher:
                 # Check if page seems to have dynamic content
                 soup = BeautifulSoup(content, 'lxml')
 
-                # Indicators of dynamic content
-                has_react = soup.find(id='root') or soup.find(id='app')
-                has_spa_markers = bool(soup.find_all('script', src=lambda x: x and ('react' in x.lower() or 'vue' in x.lower() or 'angular' in x.lower())))
-                has_minimal_content = len(soup.get_text(strip=True)) < 500
-
                 # If likely dynamic, try dynamic fetch
-                if has_react or has_spa_markers or has_minimal_content:
+                if self._looks_dynamic(content, soup):
                     print(f"Detected dynamic content, switching to Playwright for {url}")
-                    dynamic_content = asyncio.run(self.fetch_dynamic(url))
-                    return dynamic_content if dynamic_content else content
+                    dynamic_content = self._run(self.fetch_dynamic(url))
+                    if dynamic_content:
+                        return dynamic_content, None
 
-            return content
+                return content, soup
 
-        return None
+            return content, None
+
+        return None, None
+
+    def fetch(self, url: str, strategy: FetchStrategy = FetchStrategy.AUTO) -> Optional[str]:
+        """
+        Fetch content using the specified strategy.
+
+        Args:
+            url: URL to fetch
+            strategy: Fetching strategy to use
+
+        Returns:
+            HTML content or None if failed
+        """
+        return self._fetch(url, strategy)[0]
 
     def get_soup(self, url: str, strategy: FetchStrategy = FetchStrategy.AUTO) -> Optional[BeautifulSoup]:
         """
@@ -219,11 +626,215 @@ class ContentFetcher:
         Returns:
             BeautifulSoup object or None if failed
         """
-        content = self.fetch(url, strategy)
+        content, soup = self._fetch(url, strategy)
+        if soup is not None:
+            return soup
         if content:
             return BeautifulSoup(content, 'lxml')
         return None
 
+    async def _fetch_limited(
+        self,
+        url: str,
+        strategy: FetchStrategy,
+        semaphore: asyncio.Semaphore,
+        rate: Optional[float]
+    ) -> Optional[str]:
+        """Fetch one URL for iter_soups, within its concurrency and its host's rate limit."""
+        kind = "dynamic" if strategy == FetchStrategy.DYNAMIC else "static"
+        # Cache hits cost the site nothing, so they skip the limits
+        cached = self._read_cache(kind, url)
+        if cached is not None:
+            return cached
+
+        async with semaphore:
+            if rate:
+                host = urlsplit(url).netloc
+                await self._rate_limiters.setdefault(host, _RateLimiter()).acquire(rate)
+            if strategy == FetchStrategy.DYNAMIC:
+                return await self.fetch_dynamic(url)
+            return await self.fetch_static_async(await self._get_aio_session(), url)
+
+    async def _gather_limited(
+        self,
+        urls: List[str],
+        strategy: FetchStrategy,
+        concurrency: int,
+        rate: Optional[float]
+    ) -> List[Optional[str]]:
+        """Fetch URLs through _fetch_limited, returning contents in input order."""
+        semaphore = asyncio.Semaphore(concurrency)
+        return await asyncio.gather(
+            *(self._fetch_limited(url, strategy, semaphore, rate) for url in urls)
+        )
+
+    def iter_soups(
+        self,
+        urls: List[str],
+        strategy: FetchStrategy = FetchStrategy.AUTO,
+        concurrency: int = 5,
+        rate: Optional[float] = None
+    ) -> Iterator[Tuple[str, Optional[BeautifulSoup]]]:
+        """
+        Fetch many URLs concurrently and parse each as it arrives.
+
+        The downloads all run on the background event loop, so the caller
+        can parse and extract finished pages while the rest are in flight.
+        AUTO fetches statically and re-renders pages that look dynamic.
+
+        Args:
+            urls: URLs to fetch
+            strategy: Fetching strategy to use
+            concurrency: Maximum simultaneous requests
+            rate: Maximum requests started per second to each host, counted
+                together with other iterators on this fetcher; None for no limit
+
+        Yields:
+            (url, BeautifulSoup or None if failed), in completion order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        # Future -> (url, static soup); the soup is set only for AUTO
+        # re-renders, as the fallback if rendering fails
+        futures = {
+            self._submit(self._fetch_limited(url, strategy, semaphore, rate)): (url, None)
+            for url in urls
+        }
+        pending = set(futures)
+
+        try:
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    url, static_soup = futures.pop(future)
+                    content = future.result()
+
+                    if static_soup is not None:
+                        yield url, BeautifulSoup(content, 'lxml') if content else static_soup
+                        continue
+
+                    if not content:
+                        yield url, None
+                        continue
+
+                    soup = BeautifulSoup(content, 'lxml')
+                    if strategy == FetchStrategy.AUTO and self._looks_dynamic(content, soup):
+                        print(f"Detected dynamic content, switching to Playwright for {url}")
+                        # Queue the render like any other fetch rather than
+                        # waiting for it here, so other pages keep flowing
+                        render = self._submit(
+                            self._fetch_limited(url, FetchStrategy.DYNAMIC, semaphore, rate)
+                        )
+                        futures[render] = (url, soup)
+                        pending.add(render)
+                        continue
+
+                    yield url, soup
+        finally:
+            # Stop fetches the caller no longer wants
+            for future in futures:
+                future.cancel()
+
+    def iter_soups_in_order(
+        self,
+        urls: List[str],
+        strategy: FetchStrategy = FetchStrategy.AUTO,
+        prefetch: int = 2,
+        rate: Optional[float] = None
+    ) -> Iterator[Tuple[str, Optional[BeautifulSoup]]]:
+        """
+        Fetch URLs a few ahead of the caller and yield them in input order.
+
+        Meant for pagination: page N+1 and N+2 download while the caller
+        extracts page N, and a caller that stops early (an empty page)
+        wastes at most `prefetch` requests.
+
+        Args:
+            urls: URLs to fetch
+            strategy: Fetching strategy to use
+            prefetch: How many URLs to fetch ahead of the one being yielded
+            rate: Maximum requests started per second to each host, counted
+                together with other iterators on this fetcher; None for no limit
+
+        Yields:
+            (url, BeautifulSoup or None if failed), in the order of urls
+        """
+        semaphore = asyncio.Semaphore(prefetch + 1)
+
+        remaining = iter(urls)
+        window = collections.deque()
+
+        def fill():
+            # The page being waited on plus `prefetch` ahead of it
+            while len(window) <= prefetch:
+                url = next(remaining, None)
+                if url is None:
+                    return
+                window.append((url, self._submit(self._fetch_limited(url, strategy, semaphore, rate))))
+
+        try:
+            while True:
+                fill()
+                if not window:
+                    break
+                url, future = window.popleft()
+                content = future.result()
+
+                if not content:
+                    yield url, None
+                    continue
+
+                soup = BeautifulSoup(content, 'lxml')
+                if strategy == FetchStrategy.AUTO and self._looks_dynamic(content, soup):
+                    print(f"Detected dynamic content, switching to Playwright for {url}")
+                    rendered = self._submit(
+                        self._fetch_limited(url, FetchStrategy.DYNAMIC, semaphore, rate)
+                    ).result()
+                    if rendered:
+                        soup = BeautifulSoup(rendered, 'lxml')
+
+                yield url, soup
+        finally:
+            # Stop fetches the caller no longer wants
+            for _, future in window:
+                future.cancel()
+
+    async def aclose(self):
+        """Close the aiohttp session and the shared browser, and stop Playwright."""
+        # Finish off fetches still on the loop, e.g. abandoned prefetches, so
+        # none of them opens a new session while this one is closing
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self._aio_session is not None:
+            await self._aio_session.close()
+            self._aio_session = None
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                print(f"Error closing browser: {e}")
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+        self._browser_lock = None
+        self._rate_limiters.clear()
+
     def close(self):
-        """Close the session."""
-        self.session.close()
+        """Close the session (unless shared), the browser and the background event loop."""
+        if self._owns_session:
+            self.session.close()
+
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(self.aclose(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
@@ -1,27 +1,313 @@
 """LLM-based data extractor for complex or unstructured content."""
 
+import asyncio
+import hashlib
 import json
 import os
-from typing import Dict, Any, List, Optional
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
-from bs4 import BeautifulSoup
+from lxml import etree
 import openai
+import orjson
+
+
+# Tags whose content is left out of the text sent to the LLM
+_PAGE_DROP_TAGS = frozenset(['script', 'style', 'nav', 'footer', 'header'])
+_ELEMENT_DROP_TAGS = frozenset(['script', 'style'])
+
+# bs4's get_text() never returns the strings inside these tags, since it
+# gives them their own string types; skip them too so the output matches
+_NON_TEXT_TAGS = frozenset(['script', 'style', 'template', 'rt', 'rp'])
+
+# Characters of markup handed to the parser at a time
+_FEED_CHUNK_SIZE = 16384
+
+# Rough characters per token for English text, used to size batches
+# without a tokenizer
+_CHARS_PER_TOKEN = 4
+
+# Least page text smart_extract sends, however few fields are missing
+_MIN_SMART_TEXT_LENGTH = 2000
+
+# Responses kept in memory, so duplicate content within a run skips the API
+# even when no cache_dir is set
+_MEMORY_CACHE_SIZE = 4096
+
+
+class _TextCollector:
+    """
+    lxml parser target that collects stripped text as the HTML streams in.
+
+    No tree is built: each run of character data between two markup
+    events becomes one piece of text, exactly like a bs4 string, and
+    content inside skipped tags is dropped as it arrives.
+    """
+
+    def __init__(self, skip_tags: frozenset):
+        self.skip_tags = skip_tags
+        self.skip_depth = 0
+        self.parts = []
+        self.length = 0
+        self._buffer = []
+
+    def _flush(self):
+        if self._buffer:
+            text = ''.join(self._buffer).strip()
+            self._buffer = []
+            if text:
+                self.parts.append(text)
+                self.length += len(text)
+
+    def start(self, tag, attrib):
+        self._flush()
+        if tag in self.skip_tags:
+            self.skip_depth += 1
+
+    def end(self, tag):
+        self._flush()
+        if tag in self.skip_tags:
+            self.skip_depth -= 1
+
+    def data(self, data):
+        if not self.skip_depth:
+            self._buffer.append(data)
+
+    def comment(self, text):
+        self._flush()
+
+    def close(self):
+        self._flush()
+
+
+def _html_to_text(
+    html: str,
+    drop_tags: frozenset,
+    separator: str,
+    max_length: Optional[int] = None
+) -> str:
+    """
+    Get the stripped text of an HTML document, leaving out some tags.
+
+    Equivalent to decomposing drop_tags from a BeautifulSoup(html, 'lxml')
+    tree and calling get_text(separator, strip=True). The markup is fed
+    to lxml's parser in chunks with a streaming target, so no DOM is held
+    in memory, and parsing stops once max_length characters are collected.
+
+    Args:
+        html: HTML content
+        drop_tags: Tags whose content (but not trailing text) is skipped
+        separator: String to join the text pieces with
+        max_length: Stop once the text is longer than this; the result
+            is then a prefix of the full text that is still longer, so
+            callers truncating to max_length get the same answer
+
+    Returns:
+        Cleaned text
+    """
+    if not html:
+        return ""
+
+    collector = _TextCollector(_NON_TEXT_TAGS | drop_tags)
+    parser = etree.HTMLParser(target=collector)
+
+    for start in range(0, len(html), _FEED_CHUNK_SIZE):
+        parser.feed(html[start:start + _FEED_CHUNK_SIZE])
+        if max_length is not None and (
+            collector.length + len(separator) * (len(collector.parts) - 1) > max_length
+        ):
+            break
+    parser.close()
+
+    return separator.join(collector.parts)
+
+
+def _schema_json(field_schema: Dict[str, str]) -> str:
+    """Canonical JSON for a schema, used in cache keys."""
+    return orjson.dumps(field_schema, option=orjson.OPT_SORT_KEYS).decode()
+
+
+@lru_cache(maxsize=64)
+def _schema_description(schema_items: Tuple[Tuple[str, str], ...]) -> str:
+    """
+    Indented JSON of a schema for prompts; cached since a scrape job sends
+    the same schema with every request.
+
+    Args:
+        schema_items: The schema's (field, description) pairs, in order
+
+    Returns:
+        JSON text
+    """
+    return orjson.dumps(dict(schema_items), option=orjson.OPT_INDENT_2).decode()
+
+
+# The fixed part of each prompt, ahead of the page text. {schema} is the
+# only placeholder.
+_SINGLE_PROMPT_HEADER = """Extract the following fields from the text at the end of this message.
+
+Field Schema:
+{schema}
+
+Return the extracted data as a JSON object with the field names as keys. If a field cannot be found, set its value to null.
+
+Text:
+"""
+
+_BATCH_PROMPT_HEADER = """Extract the following fields from each entry at the end of this message.
+
+Field Schema:
+{schema}
+
+Return the extracted data as a JSON object with a "results" key containing an array of objects, one for each entry.
+If a field cannot be found in an entry, set its value to null.
+
+Example format:
+{{
+  "results": [
+    {{"field1": "value1", "field2": "value2"}},
+    {{"field1": "value1", "field2": "value2"}}
+  ]
+}}
+
+Entries:
+"""
+
+
+@lru_cache(maxsize=64)
+def _prompt_header(template: str, schema_items: Tuple[Tuple[str, str], ...]) -> str:
+    """
+    Fill in a prompt header's schema; cached so each request only appends
+    its own text.
+
+    Args:
+        template: _SINGLE_PROMPT_HEADER or _BATCH_PROMPT_HEADER
+        schema_items: The schema's (field, description) pairs, in order
+
+    Returns:
+        Prompt text up to where the page text goes
+    """
+    return template.format(schema=_schema_description(schema_items))
+
+
+@lru_cache(maxsize=64)
+def _schema_digest(schema_items: Tuple[Tuple[str, str], ...]) -> str:
+    """MD5 of a schema's canonical JSON, cached like the prompt headers."""
+    return hashlib.md5(_schema_json(dict(schema_items)).encode()).hexdigest()
+
+
+class _JSONObjectStream:
+    """
+    Pulls top-level key/value pairs out of a JSON object as its text arrives.
+
+    A pair is returned once its value is followed by the comma or brace
+    that ends it, so numbers cut off mid-token are never reported early.
+    Text that doesn't parse yet is simply kept for the next chunk; the
+    final parse of the whole text is what validates it.
+    """
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self):
+        self.text = ""
+        self._pos = 0
+        self._started = False
+
+    def _skip_space(self, i: int) -> int:
+        text = self.text
+        while i < len(text) and text[i] in ' \t\n\r':
+            i += 1
+        return i
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Add a chunk of the response text.
+
+        Args:
+            chunk: Next piece of the JSON text
+
+        Returns:
+            Pairs completed by this chunk, in order
+        """
+        self.text += chunk
+        text = self.text
+        pairs = []
+
+        while True:
+            i = self._skip_space(self._pos)
+            if i >= len(text):
+                break
+            if not self._started:
+                if text[i] != '{':
+                    break
+                self._started = True
+                self._pos = i + 1
+                continue
+            if text[i] == ',':
+                self._pos = i + 1
+                continue
+            if text[i] == '}':
+                break
+
+            try:
+                key, end = self._decoder.raw_decode(text, i)
+            except json.JSONDecodeError:
+                break
+            colon = self._skip_space(end)
+            if colon >= len(text) or text[colon] != ':':
+                break
+            start = self._skip_space(colon + 1)
+            if start >= len(text):
+                break
+            try:
+                value, end = self._decoder.raw_decode(text, start)
+            except json.JSONDecodeError:
+                break
+            after = self._skip_space(end)
+            if after >= len(text) or text[after] not in ',}':
+                break
+
+            pairs.append((key, value))
+            self._pos = end
+
+        return pairs
 
 
 class LLMExtractor:
     """Uses LLM to extract structured data from HTML."""
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o-mini"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gpt-4o-mini",
+        cache_dir: Optional[str] = None,
+        min_missing_ratio: float = 0.5
+    ):
         """
         Initialize LLM extractor.
 
         Args:
             api_key: OpenAI API key (defaults to env variable)
             model: Model to use
+            cache_dir: Directory to cache LLM responses in, so identical
+                requests are answered without an API call; None disables caching
+            min_missing_ratio: Share of fields that must be missing before
+                the LLM is asked to fill them in; 0 asks whenever any is missing
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.model = model
+        self.min_missing_ratio = min_missing_ratio
         self.client = openai.OpenAI(api_key=self.api_key) if self.api_key else None
+        self.cache_dir = cache_dir
+        # Serialized responses by cache key, least recently used first
+        self._memory_cache = OrderedDict()
+        self._memory_lock = threading.Lock()
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
 
     def extract_from_html(
         self,
@@ -43,15 +329,42 @@ class LLMExtractor:
         if not self.client:
             return {field: None for field in field_schema.keys()}
 
-        # Clean and truncate HTML
-        soup = BeautifulSoup(html, 'lxml')
+        try:
+            return dict(self.extract_from_html_stream(html, field_schema, max_length))
+
+        except Exception as e:
+            print(f"LLM extraction failed: {e}")
+            return {field: None for field in field_schema.keys()}
+
+    def extract_from_html_stream(
+        self,
+        html: str,
+        field_schema: Dict[str, str],
+        max_length: int = 8000
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Extract data from HTML using LLM, yielding fields as they arrive.
+
+        The response is streamed, so the first fields are available as soon
+        as the model has written them rather than after the whole reply.
 
-        # Remove script and style tags
-        for tag in soup(['script', 'style', 'nav', 'footer', 'header']):
-            tag.decompose()
+        Args:
+            html: HTML content
+            field_schema: Field schema
+            max_length: Maximum HTML length to process
+
+        Yields:
+            (field, value) pairs; each field once
+
+        Raises:
+            Exception: If the client is missing, the request fails or the
+                reply is not a JSON object
+        """
+        if not self.client:
+            raise ValueError("No OpenAI API key configured")
 
-        # Get text representation
-        text = soup.get_text(separator='\n', strip=True)
+        # Get text representation without scripts, styles and page chrome
+        text = _html_to_text(html, _PAGE_DROP_TAGS, '\n', max_length)
 
         # Truncate if too long
         if len(text) > max_length:
@@ -60,37 +373,65 @@ class LLMExtractor:
         # Build prompt
         prompt = self._build_extraction_prompt(text, field_schema)
 
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a data extraction assistant. Extract structured data from the provided text and return it as valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0,
-                response_format={"type": "json_object"}
-            )
-
-            result = json.loads(response.choices[0].message.content)
-            return result
-
-        except Exception as e:
-            print(f"LLM extraction failed: {e}")
-            return {field: None for field in field_schema.keys()}
+        cache_key = self._response_cache_key("single", field_schema, prompt)
+        cached = self._read_response_cache(cache_key, dict)
+        if cached is not None:
+            yield from cached.items()
+            return
+
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": "You are a data extraction assistant. Extract structured data from the provided text and return it as valid JSON."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0,
+            response_format={"type": "json_object"},
+            stream=True,
+            extra_body={"prompt_cache_key": self._schema_cache_key(field_schema)}
+        )
+
+        parser = _JSONObjectStream()
+        seen = set()
+        for chunk in stream:
+            if not chunk.choices or not chunk.choices[0].delta.content:
+                continue
+            for field, value in parser.feed(chunk.choices[0].delta.content):
+                seen.add(field)
+                yield field, value
+
+        result = orjson.loads(parser.text)
+        if not isinstance(result, dict):
+            raise ValueError("LLM reply is not a JSON object")
+
+        # The last pair is only complete once the closing brace arrives
+        for field, value in result.items():
+            if field not in seen:
+                yield field, value
+
+        self._write_response_cache(cache_key, result)
 
     def extract_from_elements(
         self,
         elements: List[str],
         field_schema: Dict[str, str],
-        batch_size: int = 5
+        batch_size: Optional[int] = None,
+        max_inflight: int = 5,
+        max_batch_tokens: int = 6000
     ) -> List[Dict[str, Any]]:
         """
         Extract data from multiple HTML elements in batches.
 
+        Batches are sent concurrently; see aextract_from_elements. This
+        wrapper must not be called from inside a running event loop.
+
         Args:
             elements: List of HTML strings
             field_schema: Field schema
-            batch_size: Number of elements to process at once
+            batch_size: Maximum number of elements per request; None for
+                no limit beyond max_batch_tokens
+            max_inflight: Maximum number of batch requests in flight
+            max_batch_tokens: Approximate input-token budget per request
 
         Returns:
             List of extracted data dictionaries
@@ -98,16 +439,104 @@ class LLMExtractor:
         if not self.client:
             return [{field: None for field in field_schema.keys()} for _ in elements]
 
-        results = []
+        return asyncio.run(
+            self.aextract_from_elements(
+                elements, field_schema, batch_size, max_inflight, max_batch_tokens
+            )
+        )
+
+    async def aextract_from_elements(
+        self,
+        elements: List[str],
+        field_schema: Dict[str, str],
+        batch_size: Optional[int] = None,
+        max_inflight: int = 5,
+        max_batch_tokens: int = 6000
+    ) -> List[Dict[str, Any]]:
+        """
+        Async version of extract_from_elements.
 
-        # Process in batches
-        for i in range(0, len(elements), batch_size):
-            batch = elements[i:i + batch_size]
-            batch_results = self._extract_batch(batch, field_schema)
-            results.extend(batch_results)
+        Each batch is an independent network round-trip, so all of them are
+        issued at once (bounded by max_inflight) instead of one after another.
+
+        Args:
+            elements: List of HTML strings
+            field_schema: Field schema
+            batch_size: Maximum number of elements per request; None for
+                no limit beyond max_batch_tokens
+            max_inflight: Maximum number of batch requests in flight
+            max_batch_tokens: Approximate input-token budget per request
+
+        Returns:
+            List of extracted data dictionaries, in input order
+        """
+        if not self.client:
+            return [{field: None for field in field_schema.keys()} for _ in elements]
+
+        texts = [self._clean_element(html) for html in elements]
+        batches = self._pack_batches(texts, field_schema, max_batch_tokens, batch_size)
+        semaphore = asyncio.Semaphore(max_inflight)
+
+        # The async client's connection pool is bound to the running loop,
+        # so open one per call rather than keeping it on the instance
+        async with openai.AsyncOpenAI(api_key=self.api_key) as aclient:
+            async def run(batch):
+                async with semaphore:
+                    return await self._aextract_batch(aclient, batch, field_schema)
+
+            batch_results = await asyncio.gather(*(run(batch) for batch in batches))
+
+        results = []
+        for batch, batch_result in zip(batches, batch_results):
+            # Keep entries aligned with their elements even when the model
+            # returns too few or too many for a batch
+            results.extend(batch_result[:len(batch)])
+            results.extend({field: None for field in field_schema.keys()} for _ in range(len(batch) - len(batch_result)))
 
         return results
 
+    def _pack_batches(
+        self,
+        texts: List[str],
+        field_schema: Dict[str, str],
+        max_tokens: int,
+        max_items: Optional[int] = None
+    ) -> List[List[str]]:
+        """
+        Greedily group cleaned texts into batches that fit a token budget.
+
+        Small entries share a request instead of each batch holding a fixed
+        count, so the fixed prompt overhead is paid fewer times. An entry
+        that alone exceeds the budget still gets a batch of its own.
+
+        Args:
+            texts: Cleaned element texts, in order
+            field_schema: Field schema (its prompt overhead counts against the budget)
+            max_tokens: Approximate input-token budget per batch
+            max_items: Maximum number of texts per batch; None for no limit
+
+        Returns:
+            Consecutive groups of texts
+        """
+        overhead = len(self._build_batch_extraction_prompt([], field_schema)) // _CHARS_PER_TOKEN
+
+        batches = []
+        batch = []
+        batch_tokens = overhead
+        for i, text in enumerate(texts, 1):
+            # Each entry also carries a "--- Entry N ---" header
+            tokens = (len(text) + 20) // _CHARS_PER_TOKEN + 1
+            if batch and (batch_tokens + tokens > max_tokens or len(batch) == max_items):
+                batches.append(batch)
+                batch = []
+                batch_tokens = overhead
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+
+        return batches
+
     def _extract_batch(
         self,
         elements: List[str],
@@ -115,104 +544,245 @@ class LLMExtractor:
     ) -> List[Dict[str, Any]]:
         """Extract data from a batch of elements."""
 
-        # Clean elements
-        cleaned = []
-        for html in elements:
-            soup = BeautifulSoup(html, 'lxml')
-            for tag in soup(['script', 'style']):
-                tag.decompose()
-            text = soup.get_text(separator=' ', strip=True)
-            cleaned.append(text[:1000])  # Limit each element
+        messages = self._build_batch_messages(
+            [self._clean_element(html) for html in elements], field_schema
+        )
 
-        # Build prompt
-        prompt = self._build_batch_extraction_prompt(cleaned, field_schema)
+        cache_key = self._response_cache_key("batch", field_schema, messages[-1]["content"])
+        cached = self._read_response_cache(cache_key, list)
+        if cached is not None:
+            return cached
 
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a data extraction assistant. Extract structured data from multiple entries and return as a JSON array."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=messages,
                 temperature=0,
-                response_format={"type": "json_object"}
+                response_format={"type": "json_object"},
+                extra_body={"prompt_cache_key": self._schema_cache_key(field_schema)}
             )
 
-            result = json.loads(response.choices[0].message.content)
-
-            # Handle different response formats
-            if 'results' in result:
-                return result['results']
-            elif 'data' in result:
-                return result['data']
-            elif isinstance(result, list):
-                return result
-            else:
-                return [result]
+            results = self._parse_batch_response(response)
+            self._write_response_cache(cache_key, results)
+            return results
 
         except Exception as e:
             print(f"Batch LLM extraction failed: {e}")
             return [{field: None for field in field_schema.keys()} for _ in elements]
 
-    def _build_extraction_prompt(
+    async def _aextract_batch(
         self,
-        text: str,
+        aclient,
+        texts: List[str],
         field_schema: Dict[str, str]
-    ) -> str:
-        """Build prompt for single extraction."""
+    ) -> List[Dict[str, Any]]:
+        """Extract data from a batch of cleaned element texts with the async client."""
 
-        schema_desc = json.dumps(field_schema, indent=2)
+        messages = self._build_batch_messages(texts, field_schema)
 
-        prompt = f"""Extract the following fields from the text below:
+        cache_key = self._response_cache_key("batch", field_schema, messages[-1]["content"])
+        cached = self._read_response_cache(cache_key, list)
+        if cached is not None:
+            return cached
 
-Field Schema:
-{schema_desc}
+        try:
+            response = await aclient.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=0,
+                response_format={"type": "json_object"},
+                extra_body={"prompt_cache_key": self._schema_cache_key(field_schema)}
+            )
 
-Text:
-{text}
+            results = self._parse_batch_response(response)
+            self._write_response_cache(cache_key, results)
+            return results
 
-Return the extracted data as a JSON object with the field names as keys. If a field cannot be found, set its value to null.
-"""
-        return prompt
+        except Exception as e:
+            print(f"Batch LLM extraction failed: {e}")
+            return [{field: None for field in field_schema.keys()} for _ in texts]
 
-    def _build_batch_extraction_prompt(
+    @staticmethod
+    def _clean_element(html: str) -> str:
+        """Get an element's text for a batch prompt, limited to 1000 characters."""
+        return _html_to_text(html, _ELEMENT_DROP_TAGS, ' ', 1000)[:1000]
+
+    def _build_batch_messages(
         self,
         texts: List[str],
         field_schema: Dict[str, str]
+    ) -> List[Dict[str, str]]:
+        """Build the chat messages for a batch of cleaned element texts."""
+
+        # Build prompt
+        prompt = self._build_batch_extraction_prompt(texts, field_schema)
+
+        return [
+            {"role": "system", "content": "You are a data extraction assistant. Extract structured data from multiple entries and return as a JSON array."},
+            {"role": "user", "content": prompt}
+        ]
+
+    @staticmethod
+    def _parse_batch_response(response) -> List[Dict[str, Any]]:
+        """Pull the list of entries out of a batch completion."""
+
+        result = orjson.loads(response.choices[0].message.content)
+
+        # Handle different response formats
+        if 'results' in result:
+            return result['results']
+        elif 'data' in result:
+            return result['data']
+        elif isinstance(result, list):
+            return result
+        else:
+            return [result]
+
+    def _response_cache_key(
+        self,
+        kind: str,
+        field_schema: Dict[str, str],
+        prompt: str
     ) -> str:
-        """Build prompt for batch extraction."""
+        """
+        Content hash identifying an LLM request.
 
-        schema_desc = json.dumps(field_schema, indent=2)
+        Args:
+            kind: Request kind ("single" or "batch"); their responses differ in shape
+            field_schema: Field schema
+            prompt: Full user prompt, which embeds the cleaned text
 
-        entries_text = ""
-        for i, text in enumerate(texts, 1):
-            entries_text += f"\n--- Entry {i} ---\n{text}\n"
+        Returns:
+            Hex sha256 digest
+        """
+        digest = hashlib.sha256()
+        for part in (kind, self.model, _schema_json(field_schema), prompt):
+            data = part.encode('utf-8')
+            # Length-prefix each part so different splits can't collide
+            digest.update(len(data).to_bytes(8, 'big'))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def _response_cache_path(self, key: str) -> str:
+        """Path of the cache file for a response key."""
+        return os.path.join(self.cache_dir, f"llm-{key}.json")
+
+    def _read_response_cache(self, key: str, expected_type: type) -> Optional[Any]:
+        """
+        Get a cached LLM response, from memory or else from disk.
 
-        prompt = f"""Extract the following fields from each entry below:
+        Args:
+            key: Response cache key
+            expected_type: Type the cached result must have to be usable
 
-Field Schema:
-{schema_desc}
+        Returns:
+            Cached result or None
+        """
+        with self._memory_lock:
+            data = self._memory_cache.get(key)
+            if data is not None:
+                self._memory_cache.move_to_end(key)
+        if data is not None:
+            # Stored serialized, so callers can't alter each other's copy
+            result = orjson.loads(data)
+            if isinstance(result, expected_type):
+                return result
 
-{entries_text}
+        if not self.cache_dir:
+            return None
+        path = self._response_cache_path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = orjson.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+        result = entry.get('result') if isinstance(entry, dict) else None
+        if not isinstance(result, expected_type):
+            # Unusable entry; drop it so it gets replaced
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        self._remember_response(key, result)
+        return result
 
-Return the extracted data as a JSON object with a "results" key containing an array of objects, one for each entry.
-If a field cannot be found in an entry, set its value to null.
+    def _remember_response(self, key: str, result: Any):
+        """Keep a parsed LLM response in the in-memory LRU cache."""
+        data = orjson.dumps(result)
+        with self._memory_lock:
+            self._memory_cache[key] = data
+            self._memory_cache.move_to_end(key)
+            if len(self._memory_cache) > _MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+
+    def _write_response_cache(self, key: str, result: Any):
+        """Store a parsed LLM response in memory and, if enabled, on disk."""
+        self._remember_response(key, result)
+        if not self.cache_dir:
+            return
+        path = self._response_cache_path(key)
+        entry = {
+            "model": self.model,
+            "created": datetime.now(timezone.utc).isoformat(),
+            "result": result
+        }
+        # Write then rename so a concurrent reader never sees a partial file
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(entry))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Could not cache LLM response: {e}")
 
-Example format:
-{{
-  "results": [
-    {{"field1": "value1", "field2": "value2"}},
-    {{"field1": "value1", "field2": "value2"}}
-  ]
-}}
-"""
-        return prompt
+    @staticmethod
+    def _schema_cache_key(field_schema: Dict[str, str]) -> str:
+        """Key that routes requests sharing a schema to the same prompt cache."""
+        return _schema_digest(tuple(field_schema.items()))
+
+    # The prompts below keep everything that is fixed for a scrape job (the
+    # instructions and the schema) at the start and the page text at the
+    # end, so consecutive requests share a prefix the API can cache.
+
+    def _build_extraction_prompt(
+        self,
+        text: str,
+        field_schema: Dict[str, str]
+    ) -> str:
+        """Build prompt for single extraction."""
+        return _prompt_header(_SINGLE_PROMPT_HEADER, tuple(field_schema.items())) + f"{text}\n"
+
+    def _build_batch_extraction_prompt(
+        self,
+        texts: List[str],
+        field_schema: Dict[str, str]
+    ) -> str:
+        """Build prompt for batch extraction."""
+
+        entries_text = "".join(f"\n--- Entry {i} ---\n{text}\n" for i, text in enumerate(texts, 1))
+        return _prompt_header(_BATCH_PROMPT_HEADER, tuple(field_schema.items())) + entries_text
+
+    def is_incomplete(self, data: Dict[str, Any]) -> bool:
+        """
+        Check whether extracted data is missing enough fields to call the LLM.
+
+        Args:
+            data: Extracted data
+
+        Returns:
+            True if more than min_missing_ratio of the fields are empty
+        """
+        missing = sum(1 for v in data.values() if not v)
+        return missing > 0 and missing > len(data) * self.min_missing_ratio
 
     def smart_extract(
         self,
         html: str,
         field_schema: Dict[str, str],
-        fallback_data: Optional[Dict[str, Any]] = None
+        fallback_data: Optional[Dict[str, Any]] = None,
+        max_length: int = 8000
     ) -> Dict[str, Any]:
         """
         Smart extraction that only uses LLM for missing fields.
@@ -221,12 +791,13 @@ Example format:
             html: HTML content
             field_schema: Field schema
             fallback_data: Data already extracted by other methods
+            max_length: Maximum text length to send when every field is missing
 
         Returns:
             Complete extracted data
         """
         if not fallback_data:
-            return self.extract_from_html(html, field_schema)
+            return self.extract_from_html(html, field_schema, max_length)
 
         # Find missing fields
         missing_fields = {
@@ -234,11 +805,18 @@ Example format:
             if not fallback_data.get(k)
         }
 
-        if not missing_fields:
+        # Mostly complete already; not worth a round-trip
+        if not missing_fields or len(missing_fields) <= len(field_schema) * self.min_missing_ratio:
             return fallback_data
 
+        # Fewer fields to find need less of the page
+        max_length = max(
+            _MIN_SMART_TEXT_LENGTH,
+            max_length * len(missing_fields) // len(field_schema)
+        )
+
         # Extract only missing fields
-        llm_data = self.extract_from_html(html, missing_fields)
+        llm_data = self.extract_from_html(html, missing_fields, max_length)
 
         # Merge results
         result = {**fallback_data}
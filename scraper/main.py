@@ -1,9 +1,8 @@
 """Main directory scraper orchestrator."""
 
-import time
 import os
 from typing import Dict, Any, List, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import requests
 from tqdm import tqdm
 
 from .fetcher import ContentFetcher, FetchStrategy
@@ -24,24 +23,54 @@ class DirectoryScraper:
         timeout: int = 30,
         max_pages: int = 100,
         verbose: bool = True,
-        debug: bool = False
+        debug: bool = False,
+        cache_dir: Optional[str] = None,
+        cache_ttl: int = 3600,
+        rate_limit: Optional[float] = 2.0,
+        listing_rate_limit: Optional[float] = 1.0,
+        llm_batch_size: Optional[int] = None,
+        session: Optional[requests.Session] = None
     ):
         """
         Initialize the scraper.
 
         Args:
-            use_llm: Whether to use LLM for extraction
+            use_llm: Whether scrape() uses the LLM for extraction unless
+                told otherwise per call
             llm_api_key: OpenAI API key
             max_workers: Maximum concurrent workers
             timeout: Request timeout
             max_pages: Maximum pages to scrape
             verbose: Print progress
             debug: Save debug information (HTML of failed pages)
+            cache_dir: Directory to cache fetched pages (and LLM responses)
+                in, so re-runs skip the network; None disables caching
+            cache_ttl: Seconds a cached page is reused before it is refetched
+            rate_limit: Maximum detail-page requests started per second;
+                None for no limit
+            listing_rate_limit: Maximum listing-page requests started per
+                second; None for no limit. Both limits draw on one schedule
+                per host, so listing and detail requests to a site are spaced
+                out together rather than each at its full rate.
+            llm_batch_size: Most listing entries completed per LLM request;
+                None packs batches by prompt size alone
+            session: requests session to share with other scrapers, keeping
+                its connections warm between them; left open by close()
         """
-        self.fetcher = ContentFetcher(timeout=timeout)
-        self.llm_extractor = LLMExtractor(api_key=llm_api_key) if use_llm else None
+        # Detail pages share the fetcher across max_workers threads
+        self.fetcher = ContentFetcher(
+            timeout=timeout, pool_size=max(10, max_workers), cache_dir=cache_dir,
+            cache_ttl=cache_ttl, session=session
+        )
+        self.use_llm = use_llm
+        self.llm_api_key = llm_api_key
+        self.cache_dir = cache_dir
+        self.llm_extractor = LLMExtractor(api_key=llm_api_key, cache_dir=cache_dir) if use_llm else None
         self.max_workers = max_workers
         self.max_pages = max_pages
+        self.rate_limit = rate_limit
+        self.listing_rate_limit = listing_rate_limit
+        self.llm_batch_size = llm_batch_size
         self.verbose = verbose
         self.debug = debug
         
@@ -52,7 +81,8 @@ class DirectoryScraper:
         self,
         url: str,
         field_schema: Dict[str, str],
-        fetch_strategy: FetchStrategy = FetchStrategy.AUTO
+        fetch_strategy: FetchStrategy = FetchStrategy.AUTO,
+        use_llm: Optional[bool] = None
     ) -> List[Dict[str, Any]]:
         """
         Scrape a directory URL and extract structured data.
@@ -61,10 +91,16 @@ class DirectoryScraper:
             url: Directory URL to scrape
             field_schema: Dictionary mapping field names to descriptions
             fetch_strategy: Fetching strategy
+            use_llm: Whether to use the LLM for this scrape; None keeps the
+                constructor's setting
 
         Returns:
             List of extracted data dictionaries
         """
+        if use_llm is None:
+            use_llm = self.use_llm
+        llm = self._get_llm_extractor() if use_llm else None
+
         if self.verbose:
             print(f"\n{'='*60}")
             print(f"Scraping: {url}")
@@ -76,26 +112,35 @@ class DirectoryScraper:
             print(f"Failed to fetch {url}")
             return []
 
-        # Analyze page type
-        page_type = StructureAnalyzer.detect_detail_page_type(soup)
+        # Analyze page type, keeping the repeating elements for the first listing page
+        repeating = StructureAnalyzer.find_repeating_elements(soup)
+        page_type = StructureAnalyzer.detect_detail_page_type(soup, repeating)
 
         if self.verbose:
             print(f"Page type detected: {page_type}")
 
         if page_type == 'detail':
             # Single detail page
-            return [self._extract_from_detail_page(soup, field_schema, url)]
+            return [self._extract_from_detail_page(soup, field_schema, url, llm)]
 
         else:
             # Listing page - scrape all pages and entries
-            return self._scrape_listing_pages(url, field_schema, soup, fetch_strategy)
+            return self._scrape_listing_pages(url, field_schema, soup, fetch_strategy, repeating, llm)
+
+    def _get_llm_extractor(self) -> LLMExtractor:
+        """Return the LLM extractor, creating it on first use."""
+        if self.llm_extractor is None:
+            self.llm_extractor = LLMExtractor(api_key=self.llm_api_key, cache_dir=self.cache_dir)
+        return self.llm_extractor
 
     def _scrape_listing_pages(
         self,
         base_url: str,
         field_schema: Dict[str, str],
         initial_soup,
-        fetch_strategy: FetchStrategy
+        fetch_strategy: FetchStrategy,
+        initial_elements: Optional[List] = None,
+        llm: Optional[LLMExtractor] = None
     ) -> List[Dict[str, Any]]:
         """Scrape all pages from a listing directory."""
 
@@ -116,45 +161,57 @@ class DirectoryScraper:
         if self.verbose:
             print(f"Pages to scrape: {len(page_urls)}")
 
-        # Scrape each page
-        for page_num, page_url in enumerate(page_urls, 1):
-            if self.verbose:
-                print(f"\nScraping page {page_num}/{len(page_urls)}: {page_url}")
-
-            # Use cached soup for first page
-            if page_url == base_url and initial_soup:
-                soup = initial_soup
-            else:
-                soup = self.fetcher.get_soup(page_url, strategy=fetch_strategy)
+        # Later pages download a couple ahead while the current one is
+        # extracted, paced by the listing rate limit; the first page is already here
+        reuse_initial = initial_soup is not None
+        fetched = self.fetcher.iter_soups_in_order(
+            [page_url for page_url in page_urls if not (reuse_initial and page_url == base_url)],
+            fetch_strategy,
+            rate=self.listing_rate_limit
+        )
 
-                if not soup:
-                    print(f"Failed to fetch page {page_num}")
-                    continue
-
-                # Be respectful - rate limit
-                time.sleep(1)
-
-            # Extract from this page
-            page_results = self._extract_from_listing_page(
-                soup, field_schema, page_url, fetch_strategy
-            )
+        # Scrape each page
+        try:
+            for page_num, page_url in enumerate(page_urls, 1):
+                if self.verbose:
+                    print(f"\nScraping page {page_num}/{len(page_urls)}: {page_url}")
+
+                # Use cached soup (and its repeating elements) for first page
+                elements = None
+                if reuse_initial and page_url == base_url:
+                    soup = initial_soup
+                    elements = initial_elements
+                else:
+                    _, soup = next(fetched)
+
+                    if not soup:
+                        print(f"Failed to fetch page {page_num}")
+                        continue
+
+                # Extract from this page
+                page_results = self._extract_from_listing_page(
+                    soup, field_schema, page_url, fetch_strategy, elements, llm
+                )
             
-            if not page_results and self.debug:
-                # Save HTML for debugging
-                filename = f"debug_output/failed_page_{page_num}.html"
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(str(soup))
-                print(f"DEBUG: Saved failed page HTML to {filename}")
+                if not page_results and self.debug:
+                    # Save HTML for debugging
+                    filename = f"debug_output/failed_page_{page_num}.html"
+                    with open(filename, 'w', encoding='utf-8') as f:
+                        f.write(str(soup))
+                    print(f"DEBUG: Saved failed page HTML to {filename}")
 
-            all_results.extend(page_results)
+                all_results.extend(page_results)
 
-            if self.verbose:
-                print(f"Extracted {len(page_results)} entries from page {page_num}")
+                if self.verbose:
+                    print(f"Extracted {len(page_results)} entries from page {page_num}")
 
-            # Check if we should stop (no more results)
-            if not page_results and page_num > 1:
-                print("No more results found, stopping pagination")
-                break
+                # Check if we should stop (no more results)
+                if not page_results and page_num > 1:
+                    print("No more results found, stopping pagination")
+                    break
+        finally:
+            # Cancel prefetches left over when pagination stops early
+            fetched.close()
 
         return all_results
 
@@ -163,12 +220,15 @@ class DirectoryScraper:
         soup,
         field_schema: Dict[str, str],
         page_url: str,
-        fetch_strategy: FetchStrategy
+        fetch_strategy: FetchStrategy,
+        elements: Optional[List] = None,
+        llm: Optional[LLMExtractor] = None
     ) -> List[Dict[str, Any]]:
         """Extract data from a single listing page."""
 
-        # Find repeating elements
-        elements = StructureAnalyzer.find_repeating_elements(soup)
+        # Find repeating elements unless the caller already has them
+        if elements is None:
+            elements = StructureAnalyzer.find_repeating_elements(soup)
 
         if not elements:
             if self.verbose:
@@ -184,7 +244,7 @@ class DirectoryScraper:
             if headers:
                 if self.verbose:
                     print(f"Found table headers: {headers}. Preferring table extraction.")
-                return self._extract_from_elements(elements, field_schema, page_url)
+                return self._extract_from_elements(elements, field_schema, page_url, llm)
 
         # Check if elements contain links to detail pages
         links = StructureAnalyzer.extract_links_from_elements(elements, page_url)
@@ -194,20 +254,21 @@ class DirectoryScraper:
             if self.verbose:
                 print(f"Found {len(links)} detail page links")
 
-            return self._scrape_detail_pages(links, field_schema, fetch_strategy)
+            return self._scrape_detail_pages(links, field_schema, fetch_strategy, llm)
 
         else:
             # Extract directly from listing elements
             if self.verbose:
                 print("Extracting directly from listing elements")
 
-            return self._extract_from_elements(elements, field_schema, page_url)
+            return self._extract_from_elements(elements, field_schema, page_url, llm)
 
     def _extract_from_elements(
         self,
         elements,
         field_schema: Dict[str, str],
-        base_url: str
+        base_url: str,
+        llm: Optional[LLMExtractor] = None
     ) -> List[Dict[str, Any]]:
         """Extract data directly from listing elements."""
 
@@ -220,93 +281,121 @@ class DirectoryScraper:
             if self.verbose and headers:
                 print(f"Found table headers: {headers}")
 
+        # The header mapping and the schema's field extractors are the same
+        # for every row, so resolve them once
+        col_to_fields = DataExtractor.map_headers_to_fields(headers, field_schema) if headers else None
+        extract = DataExtractor.compile_schema(field_schema)
+
+        # Entries the LLM should complete, as (index in results, element)
+        incomplete = []
+
+        # Rows are extracted sequentially on purpose. Extraction is pure-Python
+        # BeautifulSoup work that holds the GIL, so a thread pool only adds
+        # overhead, and Tags are too costly to pickle for worker processes.
+        # Concurrency is spent where it pays off: fetching detail pages.
         for element in elements:
             if headers:
-                data = DataExtractor.extract_from_table_row_with_headers(element, field_schema, base_url, headers)
+                data = DataExtractor.extract_from_table_row_with_headers_cached(
+                    element, field_schema, base_url, col_to_fields
+                )
             else:
-                data = DataExtractor.extract_from_element(element, field_schema, base_url)
+                data = extract(element, base_url)
 
             # Filter out empty results
             if not any(data.values()):
                 continue
 
             # Use LLM if enabled and data is incomplete
-            if self.llm_extractor:
-                missing_fields = sum(1 for v in data.values() if not v)
-                if missing_fields > len(data) * 0.3:  # More than 30% missing
-                    html = str(element)
-                    data = self.llm_extractor.smart_extract(html, field_schema, data)
+            if llm and llm.is_incomplete(data):
+                incomplete.append((len(results), element))
 
             results.append(data)
 
+        if incomplete:
+            self._complete_with_llm(results, incomplete, field_schema, llm)
+
         return results
 
+    def _complete_with_llm(
+        self,
+        results: List[Dict[str, Any]],
+        incomplete: List,
+        field_schema: Dict[str, str],
+        llm: LLMExtractor
+    ):
+        """
+        Fill in missing fields of several entries with batched LLM calls.
+
+        One request covers a batch of entries instead of one request each.
+
+        Args:
+            results: Extracted entries; updated in place
+            incomplete: (index in results, element) pairs to complete
+            field_schema: Field schema
+            llm: LLM extractor to complete them with
+        """
+        # Ask only for fields some entry is missing
+        missing_schema = {
+            field: desc for field, desc in field_schema.items()
+            if any(not results[i].get(field) for i, _ in incomplete)
+        }
+
+        llm_results = llm.extract_from_elements(
+            [str(element) for _, element in incomplete], missing_schema,
+            batch_size=self.llm_batch_size
+        )
+
+        # Merge, keeping values the extractor already found
+        for (i, _), llm_data in zip(incomplete, llm_results):
+            if not isinstance(llm_data, dict):
+                continue
+            data = results[i]
+            for field, value in llm_data.items():
+                if field in missing_schema and value and not data.get(field):
+                    data[field] = value
+
     def _scrape_detail_pages(
         self,
         urls: List[str],
         field_schema: Dict[str, str],
-        fetch_strategy: FetchStrategy
+        fetch_strategy: FetchStrategy,
+        llm: Optional[LLMExtractor] = None
     ) -> List[Dict[str, Any]]:
         """Scrape multiple detail pages concurrently."""
 
         results = []
 
-        # Use ThreadPoolExecutor for concurrent scraping
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(
-                    self._scrape_single_detail_page,
-                    url,
-                    field_schema,
-                    fetch_strategy
-                ): url
-                for url in urls
-            }
-
-            # Process completed futures with progress bar
-            if self.verbose:
-                pbar = tqdm(total=len(futures), desc="Scraping detail pages")
+        # Pages download concurrently on the fetcher's event loop, paced by
+        # the rate limit, while finished ones are extracted here
+        pages = self.fetcher.iter_soups(
+            urls, fetch_strategy, concurrency=self.max_workers, rate=self.rate_limit
+        )
 
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    if result:
-                        results.append(result)
-                except Exception as e:
-                    url = futures[future]
-                    print(f"Error scraping {url}: {e}")
-
-                if self.verbose:
-                    pbar.update(1)
+        # Process pages with progress bar
+        if self.verbose:
+            pbar = tqdm(total=len(urls), desc="Scraping detail pages")
 
-                # Rate limiting
-                time.sleep(0.5)
+        for url, soup in pages:
+            try:
+                if soup:
+                    results.append(self._extract_from_detail_page(soup, field_schema, url, llm))
+            except Exception as e:
+                print(f"Error scraping {url}: {e}")
 
             if self.verbose:
-                pbar.close()
-
-        return results
+                pbar.update(1)
 
-    def _scrape_single_detail_page(
-        self,
-        url: str,
-        field_schema: Dict[str, str],
-        fetch_strategy: FetchStrategy
-    ) -> Optional[Dict[str, Any]]:
-        """Scrape a single detail page."""
-
-        soup = self.fetcher.get_soup(url, strategy=fetch_strategy)
-
-        if not soup:
-            return None
+        if self.verbose:
+            pbar.close()
 
-        return self._extract_from_detail_page(soup, field_schema, url)
+        return results
 
     def _extract_from_detail_page(
         self,
         soup,
         field_schema: Dict[str, str],
-        url: str
+        url: str,
+        llm: Optional[LLMExtractor] = None
     ) -> Dict[str, Any]:
         """Extract data from a detail page."""
 
@@ -318,11 +407,9 @@ class DirectoryScraper:
             data[url_field] = url
 
         # Use LLM if enabled and data is incomplete
-        if self.llm_extractor:
-            missing_fields = sum(1 for v in data.values() if not v)
-            if missing_fields > len(data) * 0.3:  # More than 30% missing
-                html = str(soup)
-                data = self.llm_extractor.smart_extract(html, field_schema, data)
+        if llm and llm.is_incomplete(data):
+            html = str(soup)
+            data = llm.smart_extract(html, field_schema, data)
 
         return data
 
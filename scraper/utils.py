@@ -1,10 +1,34 @@
 """Utility functions for the scraper."""
 
+import json
+import os
 import re
-from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin, urlparse, parse_qs, urlencode, urlunparse
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qs, urlencode, SplitResult
 import hashlib
 
+# The text helpers below stay plain Python: nearly all of their time is
+# spent inside compiled re searches and str.split/join, so compiling the
+# thin wrappers (mypyc/Cython) would save little and add a build step.
+
+# More comprehensive email pattern
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9][A-Za-z0-9._%+-]*@[A-Za-z0-9][A-Za-z0-9.-]*\.[A-Za-z]{2,}\b')
+
+# Phone patterns, tried in order (US-centric but flexible). A bare
+# 1234567890 needs no pattern of its own: the first one already matches
+# any standalone ten-digit run, so a separate scan could never succeed.
+_PHONE_PATTERNS = (
+    # (123) 456-7890 or 123-456-7890 or 123.456.7890 or 1234567890
+    re.compile(r'\b(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b'),
+    # +1 123 456 7890
+    re.compile(r'\b\+?1?\s*\(?([0-9]{3})\)?\s*([0-9]{3})\s*([0-9]{4})\b'),
+)
+
+# Common pagination parameters, in priority order
+_PAGINATION_PARAMS = ('page', 'p', 'pg', 'pagenum', 'offset', 'start')
+
 
 def normalize_url(base_url: str, url: str) -> str:
     """Normalize and join URLs."""
@@ -17,21 +41,17 @@ def clean_text(text: str) -> str:
     """Clean and normalize text."""
     if not text:
         return ""
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    # Remove special characters
-    text = text.strip()
-    return text
+    # Collapse whitespace runs and strip the ends. str.split() splits on
+    # exactly the characters re's \s matches, without the regex overhead.
+    return ' '.join(text.split())
 
 
 def extract_email(text: str) -> Optional[str]:
     """Extract email address from text."""
-    if not text:
+    if not text or '@' not in text:
         return None
 
-    # More comprehensive email pattern
-    email_pattern = r'\b[A-Za-z0-9][A-Za-z0-9._%+-]*@[A-Za-z0-9][A-Za-z0-9.-]*\.[A-Za-z]{2,}\b'
-    match = re.search(email_pattern, text)
+    match = _EMAIL_RE.search(text)
 
     if match:
         email = match.group(0)
@@ -44,21 +64,12 @@ def extract_email(text: str) -> Optional[str]:
 
 def extract_phone(text: str) -> Optional[str]:
     """Extract phone number from text."""
-    if not text:
+    # Every pattern needs ASCII digits; most text has none
+    if not text or not any(digit in text for digit in '0123456789'):
         return None
 
-    # Try multiple phone patterns (US-centric but flexible)
-    patterns = [
-        # (123) 456-7890 or 123-456-7890 or 123.456.7890
-        r'\b(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b',
-        # 1234567890
-        r'\b([0-9]{10})\b',
-        # +1 123 456 7890
-        r'\b\+?1?\s*\(?([0-9]{3})\)?\s*([0-9]{3})\s*([0-9]{4})\b'
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text)
+    for pattern in _PHONE_PATTERNS:
+        match = pattern.search(text)
         if match:
             phone = match.group(0)
             # Normalize: remove common separators but keep the digits
@@ -69,12 +80,26 @@ def extract_phone(text: str) -> Optional[str]:
 
 def get_url_hash(url: str) -> str:
     """Generate a hash for a URL."""
-    return hashlib.md5(url.encode()).hexdigest()
+    # BLAKE2b cut to 128 bits keeps MD5's 32-character hex key but is the
+    # quicker of the two on short inputs
+    return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=1024)
+def _split_url(url: str) -> SplitResult:
+    """
+    Split a URL into its components.
+
+    Cached because pagination helpers see the same few URLs over and over.
+    urlsplit is enough here: nothing needs the ;params path component that
+    urlparse would also split off.
+    """
+    return urlsplit(url)
 
 
 def update_url_params(url: str, params: Dict[str, Any]) -> str:
     """Update URL parameters."""
-    parsed = urlparse(url)
+    parsed = _split_url(url)
     query_params = parse_qs(parsed.query)
 
     # Update with new params
@@ -83,19 +108,14 @@ def update_url_params(url: str, params: Dict[str, Any]) -> str:
 
     # Rebuild URL
     new_query = urlencode(query_params, doseq=True)
-    new_parsed = parsed._replace(query=new_query)
-    return urlunparse(new_parsed)
+    return urlunsplit(parsed._replace(query=new_query))
 
 
 def detect_pagination_pattern(url: str) -> Optional[str]:
     """Detect pagination parameter in URL."""
-    parsed = urlparse(url)
-    query_params = parse_qs(parsed.query)
+    query_params = parse_qs(_split_url(url).query)
 
-    # Common pagination parameters
-    pagination_params = ['page', 'p', 'pg', 'pagenum', 'offset', 'start']
-
-    for param in pagination_params:
+    for param in _PAGINATION_PARAMS:
         if param in query_params:
             return param
 
@@ -105,12 +125,32 @@ def detect_pagination_pattern(url: str) -> Optional[str]:
 def is_valid_url(url: str) -> bool:
     """Check if URL is valid."""
     try:
-        result = urlparse(url)
+        result = _split_url(url)
         return all([result.scheme, result.netloc])
     except:
         return False
 
 
-def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
-    """Split list into chunks."""
-    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
+def chunk_list(lst: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """Split an iterable into chunks, yielding one chunk at a time."""
+    it = iter(lst)
+    while chunk := list(islice(it, chunk_size)):
+        yield chunk
+
+
+def write_json(path: str, obj: Any):
+    """
+    Write obj as indented JSON, replacing path atomically.
+
+    json.dump writes the encoder's output piece by piece, so a large result
+    set is never held as one serialized string next to the objects.
+
+    Args:
+        path: Output file path
+        obj: JSON-serializable object
+    """
+    # Write then rename so an interrupted run never leaves a partial file
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, indent=2)
+    os.replace(tmp_path, path)
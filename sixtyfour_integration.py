@@ -1,13 +1,72 @@
 """Integration with Sixtyfour API for lead enrichment."""
 
+import asyncio
+import hashlib
 import os
 import json
-import requests
+import random
+import httpx
+import orjson
 from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
+from tenacity import (
+    AsyncRetrying,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 load_dotenv()
 
+# Records written to the checkpoint file between fsyncs
+CHECKPOINT_SYNC_EVERY = 100
+
+# Fixed so a rerun samples, and resumes, the same records
+SAMPLE_SEED = 64
+
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+MAX_ATTEMPTS = 5
+
+_backoff = wait_exponential_jitter(initial=1, max=30)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Whether a failed request is worth another attempt."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRY_STATUSES
+    return isinstance(exc, httpx.TransportError)
+
+
+def _retry_wait(retry_state) -> float:
+    """Wait as long as the server's Retry-After asks, else back off exponentially."""
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, httpx.HTTPStatusError):
+        retry_after = exc.response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(int(retry_after), 60)
+    return _backoff(retry_state)
+
+
+def _log_retry(retry_state):
+    """Report a retry instead of failing silently."""
+    exc = retry_state.outcome.exception()
+    reason = f"HTTP {exc.response.status_code}" if isinstance(exc, httpx.HTTPStatusError) else exc
+    print(
+        f"Sixtyfour request failed ({reason}), retrying in "
+        f"{retry_state.next_action.sleep:.1f}s (attempt {retry_state.attempt_number}/{MAX_ATTEMPTS})"
+    )
+
+
+_RETRY_POLICY = dict(
+    stop=stop_after_attempt(MAX_ATTEMPTS),
+    wait=_retry_wait,
+    retry=retry_if_exception(_is_retryable),
+    before_sleep=_log_retry,
+    reraise=True
+)
+
 
 class SixtyfourClient:
     """Client for Sixtyfour API."""
@@ -34,6 +93,14 @@ class SixtyfourClient:
             "Content-Type": "application/json"
         }
 
+        # One pooled client, so consecutive leads reuse the TLS connection.
+        # HTTP/2 would need the optional h2 package, so plain keep-alive it is.
+        self._session = httpx.Client(
+            headers=self.headers,
+            timeout=30,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        )
+
     def enrich_lead(
         self,
         lead_data: Dict[str, Any],
@@ -42,13 +109,67 @@ class SixtyfourClient:
         """
         Enrich a single lead.
 
+        Rate limiting and transient errors are retried with backoff, honoring
+        Retry-After; a lead that still fails comes back unchanged.
+
+        Args:
+            lead_data: Lead data to enrich
+            enrich_fields: Specific fields to enrich (optional)
+
+        Returns:
+            Enriched lead data
+        """
+        payload = self._build_payload(lead_data, enrich_fields)
+
+        try:
+            for attempt in Retrying(**_RETRY_POLICY):
+                with attempt:
+                    response = self._session.post(self.api_url, json=payload)
+                    response.raise_for_status()
+
+            return orjson.loads(response.content)
+
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"Error enriching lead: {e}")
+            return lead_data
+
+    async def aenrich_lead(
+        self,
+        client: httpx.AsyncClient,
+        lead_data: Dict[str, Any],
+        enrich_fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Async version of enrich_lead.
+
         Args:
+            client: Async client to send the request with
             lead_data: Lead data to enrich
             enrich_fields: Specific fields to enrich (optional)
 
         Returns:
             Enriched lead data
         """
+        payload = self._build_payload(lead_data, enrich_fields)
+
+        try:
+            async for attempt in AsyncRetrying(**_RETRY_POLICY):
+                with attempt:
+                    response = await client.post(self.api_url, json=payload)
+                    response.raise_for_status()
+
+            return orjson.loads(response.content)
+
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"Error enriching lead: {e}")
+            return lead_data
+
+    @staticmethod
+    def _build_payload(
+        lead_data: Dict[str, Any],
+        enrich_fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Build the request body for one lead."""
         payload = {
             "lead": lead_data
         }
@@ -56,50 +177,167 @@ class SixtyfourClient:
         if enrich_fields:
             payload["enrich_fields"] = enrich_fields
 
-        try:
-            response = requests.post(
-                self.api_url,
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
+        return payload
 
-            response.raise_for_status()
-            return response.json()
+    def enrich_leads_batch(
+        self,
+        leads: List[Dict[str, Any]],
+        enrich_fields: Optional[List[str]] = None,
+        batch_size: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Enrich multiple leads concurrently.
 
-        except requests.exceptions.RequestException as e:
-            print(f"Error enriching lead: {e}")
-            return lead_data
+        Must not be called from inside a running event loop; use
+        aenrich_leads_batch there instead.
 
-    def enrich_leads_batch(
+        Args:
+            leads: List of lead data
+            enrich_fields: Fields to enrich
+            batch_size: Maximum number of requests in flight at once
+
+        Returns:
+            List of enriched leads, in input order
+        """
+        return asyncio.run(self.aenrich_leads_batch(leads, enrich_fields, batch_size))
+
+    async def aenrich_leads_batch(
         self,
         leads: List[Dict[str, Any]],
         enrich_fields: Optional[List[str]] = None,
         batch_size: int = 10
     ) -> List[Dict[str, Any]]:
         """
-        Enrich multiple leads in batches.
+        Enrich multiple leads with up to batch_size requests in flight.
 
         Args:
             leads: List of lead data
             enrich_fields: Fields to enrich
-            batch_size: Batch size
+            batch_size: Maximum number of requests in flight at once
 
         Returns:
-            List of enriched leads
+            List of enriched leads, in input order
+        """
+        print(f"Enriching {len(leads)} leads ({batch_size} at a time)...")
+
+        semaphore = asyncio.Semaphore(batch_size)
+        limits = httpx.Limits(max_connections=batch_size, max_keepalive_connections=batch_size)
+
+        async with httpx.AsyncClient(headers=self.headers, timeout=30, limits=limits) as client:
+            async def enrich(lead):
+                async with semaphore:
+                    return await self.aenrich_lead(client, lead, enrich_fields)
+
+            return list(await asyncio.gather(*(enrich(lead) for lead in leads)))
+
+    async def aiter_enriched(
+        self,
+        leads: List[Dict[str, Any]],
+        enrich_fields: Optional[List[str]] = None,
+        batch_size: int = 10
+    ):
         """
-        enriched = []
+        Enrich leads concurrently, yielding each as soon as it is done.
+
+        Args:
+            leads: List of lead data
+            enrich_fields: Fields to enrich
+            batch_size: Maximum number of requests in flight at once
 
-        for i in range(0, len(leads), batch_size):
-            batch = leads[i:i + batch_size]
+        Yields:
+            (lead, enriched lead) pairs in completion order; a lead that
+            failed to enrich comes back as itself
+        """
+        semaphore = asyncio.Semaphore(batch_size)
+        limits = httpx.Limits(max_connections=batch_size, max_keepalive_connections=batch_size)
 
-            print(f"Enriching batch {i//batch_size + 1} ({len(batch)} leads)...")
+        async with httpx.AsyncClient(headers=self.headers, timeout=30, limits=limits) as client:
+            async def enrich(lead):
+                async with semaphore:
+                    return lead, await self.aenrich_lead(client, lead, enrich_fields)
 
-            for lead in batch:
-                enriched_lead = self.enrich_lead(lead, enrich_fields)
-                enriched.append(enriched_lead)
+            for finished in asyncio.as_completed([enrich(lead) for lead in leads]):
+                yield await finished
 
-        return enriched
+    def close(self):
+        """Close the pooled HTTP connections."""
+        self._session.close()
+
+
+def _lead_key(lead: Dict[str, Any], enrich_fields: Optional[List[str]]) -> str:
+    """
+    Stable identity of an enrichment job, for resuming from a checkpoint.
+
+    The requested fields are part of it, so a rerun asking for other fields
+    does not pick up records enriched for the old ones.
+
+    Args:
+        lead: Input lead
+        enrich_fields: Fields to enrich (None for the API's defaults)
+
+    Returns:
+        Hex digest
+    """
+    fields = sorted(enrich_fields) if enrich_fields is not None else None
+    job = {"lead": lead, "fields": fields}
+    return hashlib.md5(orjson.dumps(job, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def _read_checkpoint(path: str):
+    """
+    Iterate over the entries of a JSONL checkpoint file.
+
+    A line cut short by a crash is skipped.
+
+    Args:
+        path: Checkpoint file path
+
+    Yields:
+        Checkpoint entries ({"key", "ok", "record"} dicts)
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb') as f:
+        for line in f:
+            try:
+                yield orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+
+
+async def _enrich_to_checkpoint(
+    client: SixtyfourClient,
+    leads: List[Dict[str, Any]],
+    enrich_fields: Optional[List[str]],
+    checkpoint_file: str
+):
+    """
+    Enrich leads, appending each result to the checkpoint as it arrives.
+
+    Args:
+        client: Sixtyfour client
+        leads: Leads still to enrich
+        enrich_fields: Fields to enrich
+        checkpoint_file: JSONL file to append to
+    """
+    with open(checkpoint_file, 'ab+') as f:
+        # Start on a fresh line if a crash cut the last record short
+        if f.tell():
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+        written = 0
+        async for lead, enriched in client.aiter_enriched(leads, enrich_fields):
+            # A failed lead comes back unchanged; record it so the output is
+            # complete, but as not done so a rerun retries it
+            ok = enriched is not lead
+            f.write(orjson.dumps({"key": _lead_key(lead, enrich_fields), "ok": ok, "record": enriched}) + b"\n")
+            f.flush()
+            written += 1
+            if written % CHECKPOINT_SYNC_EVERY == 0:
+                os.fsync(f.fileno())
+        os.fsync(f.fileno())
 
 
 def enrich_scraped_data(
@@ -113,43 +351,73 @@ def enrich_scraped_data(
 
     Args:
         input_file: Path to input JSON file with scraped data
-        output_file: Path to output JSON file for enriched data
+        output_file: Path to output JSON file for enriched data; progress is
+            checkpointed next to it as JSONL, so a rerun resumes where it stopped
         enrich_fields: Fields to enrich
         sample_size: Number of records to enrich (None for all)
     """
     # Load scraped data
     print(f"Loading data from {input_file}...")
-    with open(input_file, 'r') as f:
-        data = json.load(f)
+    with open(input_file, 'rb') as f:
+        data = orjson.loads(f.read())
 
     # Sample if requested
     if sample_size and len(data) > sample_size:
         print(f"Sampling {sample_size} records from {len(data)} total...")
-        import random
-        data = random.sample(data, sample_size)
+        data = random.Random(SAMPLE_SEED).sample(data, sample_size)
 
-    print(f"Enriching {len(data)} records...")
+    keys = [_lead_key(lead, enrich_fields) for lead in data]
+
+    # Resume: leads enriched by an earlier run are already in the checkpoint.
+    # Identical leads share a key and are enriched once.
+    checkpoint_file = os.path.splitext(output_file)[0] + ".jsonl"
+    done = {entry["key"] for entry in _read_checkpoint(checkpoint_file) if entry.get("ok")}
+    pending = list({key: lead for key, lead in zip(keys, data) if key not in done}.values())
+    resumed = sum(key in done for key in keys)
+    if resumed:
+        print(f"Resuming from {checkpoint_file}: {resumed} records already enriched")
+
+    print(f"Enriching {len(pending)} records...")
 
     # Initialize client
     client = SixtyfourClient()
 
-    # Enrich
-    enriched_data = client.enrich_leads_batch(data, enrich_fields)
-
-    # Save results
+    # Enrich, checkpointing each record as it completes
+    try:
+        asyncio.run(_enrich_to_checkpoint(client, pending, enrich_fields, checkpoint_file))
+    finally:
+        client.close()
+
+    # The checkpoint may also hold leads from other inputs; keep only this
+    # input's, preferring a successful enrichment over a failed attempt
+    wanted = set(keys)
+    records = {}
+    ok_keys = set()
+    for entry in _read_checkpoint(checkpoint_file):
+        key = entry["key"]
+        if key in wanted and key not in ok_keys:
+            records[key] = entry["record"]
+            if entry.get("ok"):
+                ok_keys.add(key)
+
+    # Save results: one record per input lead, in input order
     print(f"Saving enriched data to {output_file}...")
-    with open(output_file, 'w') as f:
-        json.dump(enriched_data, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(b"[")
+        for i, (key, lead) in enumerate(zip(keys, data)):
+            f.write(b",\n" if i else b"\n")
+            f.write(orjson.dumps(records.get(key, lead), option=orjson.OPT_INDENT_2))
+        f.write(b"\n]\n" if data else b"]\n")
 
-    print(f"Done! Enriched {len(enriched_data)} records")
+    print(f"Done! Enriched {sum(key in ok_keys for key in keys)} of {len(data)} records")
 
     # Print summary
     print("\n" + "="*60)
     print("Enrichment Summary")
     print("="*60)
 
-    if enriched_data:
-        sample = enriched_data[0]
+    if data:
+        sample = records.get(keys[0], data[0])
         print("\nSample enriched record:")
         print(json.dumps(sample, indent=2))
 
@@ -1,66 +1,243 @@
 """Test scraper on all example directories from the specification."""
 
+import functools
+import io
 import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, NamedTuple
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from scraper import DirectoryScraper
+from scraper.utils import write_json
 
+# Output goes through a queue drained by one listener thread (started when
+# run as a script), so test threads never block on stdout
+_LOG_QUEUE = queue.Queue(-1)
+logger = logging.getLogger('directory_tests')
+logger.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
+logger.setLevel(logging.INFO)
+logger.propagate = False
 
-def test_directory(name, url, field_schema, max_pages=1):
-    """Test scraping a single directory."""
-    print(f"\n{'='*70}")
-    print(f"Testing: {name}")
-    print(f"URL: {url}")
-    print(f"{'='*70}")
+# One session for every test, so connections to a host stay open from one
+# test to the next instead of each scraper opening its own
+SHARED_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["HEAD", "GET", "OPTIONS"]
+    )
+)
+SHARED_SESSION.mount("http://", _adapter)
+SHARED_SESSION.mount("https://", _adapter)
+
+
+class HostRateLimiter:
+    """Token bucket per host: tests on one host are spaced out, others start at once."""
+
+    def __init__(self, rate: float = 1.0, burst: int = 2):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Tokens added per second for each host
+            burst: Most tokens a host can save up
+        """
+        self.rate = rate
+        self.burst = burst
+        self._buckets = {}  # netloc -> (tokens, last refill time)
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str):
+        """Block until the URL's host has a token, then take it."""
+        host = urlsplit(url).netloc
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens, last = self._buckets.get(host, (self.burst, now))
+                tokens = min(self.burst, tokens + (now - last) * self.rate)
+                if tokens >= 1:
+                    self._buckets[host] = (tokens - 1, now)
+                    return
+                self._buckets[host] = (tokens, now)
+                wait = (1 - tokens) / self.rate
+            time.sleep(wait)
+
+
+LIMITER = HostRateLimiter()
+
+
+def test_directory(name, url, field_schema, max_pages=1, verbose=False):
+    """
+    Test scraping a single directory.
+
+    Tests run in parallel threads, so the report is buffered and logged
+    as one record at the end instead of interleaving with other tests.
+
+    Returns:
+        Tuple of (name, success, elapsed seconds, results)
+    """
+    out = io.StringIO()
+    log = functools.partial(print, file=out)
+
+    log(f"\n{'='*70}")
+    log(f"Testing: {name}")
+    log(f"URL: {url}")
+    log(f"{'='*70}")
 
     scraper = DirectoryScraper(
         use_llm=True,  # Set to True to enable LLM fallback
         max_workers=5,
         max_pages=max_pages,
-        verbose=True
+        verbose=verbose,
+        session=SHARED_SESSION
     )
 
     start_time = time.time()
+    results = []
 
     try:
+        # Tests sharing a host wait their turn; the rest start right away
+        LIMITER.acquire(url)
         results = scraper.scrape(url, field_schema)
         elapsed = time.time() - start_time
 
-        print(f"\n{'='*70}")
-        print(f"✓ SUCCESS: {name}")
-        print(f"{'='*70}")
-        print(f"Results:  {len(results)} entries")
-        print(f"Time:     {elapsed:.2f} seconds")
-        print(f"Speed:    {len(results)/elapsed:.2f} entries/second")
+        log(f"\n{'='*70}")
+        log(f"✓ SUCCESS: {name}")
+        log(f"{'='*70}")
+        log(f"Results:  {len(results)} entries")
+        log(f"Time:     {elapsed:.2f} seconds")
+        log(f"Speed:    {len(results)/elapsed:.2f} entries/second")
 
         if results:
-            print(f"\nSample entry:")
-            print(json.dumps(results[0], indent=2))
+            log(f"\nSample entry:")
+            log(json.dumps(results[0], indent=2))
 
         # Save results
         filename = f"{name.lower().replace(' ', '_')}_results.json"
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
-        print(f"\nResults saved to: {filename}")
+        write_json(filename, results)
+        log(f"\nResults saved to: {filename}")
 
-        return True
+        return name, True, elapsed, results
 
     except Exception as e:
         elapsed = time.time() - start_time
-        print(f"\n{'='*70}")
-        print(f"✗ FAILED: {name}")
-        print(f"{'='*70}")
-        print(f"Error:    {e}")
-        print(f"Time:     {elapsed:.2f} seconds")
-        return False
+        log(f"\n{'='*70}")
+        log(f"✗ FAILED: {name}")
+        log(f"{'='*70}")
+        log(f"Error:    {e}")
+        log(f"Time:     {elapsed:.2f} seconds")
+        return name, False, elapsed, results
 
     finally:
         scraper.close()
+        logger.info(out.getvalue().rstrip('\n'))
+
+
+class DirectoryTestCase(NamedTuple):
+    """One directory the suite scrapes."""
+    name: str
+    url: str
+    schema: Dict[str, str]
+    max_pages: int
+
+
+TEST_CASES = [
+    DirectoryTestCase(
+        name="Berkeley Math Students",
+        url="https://math.berkeley.edu/people/graduate-students",
+        schema={
+            "name": "name of the student",
+            "email": "email address",
+            "page_url": "profile page URL"
+        },
+        max_pages=1
+    ),
+    DirectoryTestCase(
+        name="Stanford Engineering",
+        url="https://profiles.stanford.edu/browse/school-of-engineering?p=1&ps=100",
+        schema={
+            "name": "name of the person",
+            "email": "email address",
+            "page_url": "profile page URL",
+            "bio": "biography or research interests"
+        },
+        max_pages=2
+    ),
+    DirectoryTestCase(
+        name="San Diego Psychologists",
+        url="https://sdpsych.org/Find-a-Psychologist",
+        schema={
+            "name": "psychologist name",
+            "phone": "phone number",
+            "email": "email address",
+            "specialty": "area of specialty",
+            "location": "office location"
+        },
+        max_pages=1
+    ),
+    DirectoryTestCase(
+        name="Houston Psychology",
+        url="https://psychologyhouston.org/directory.php",
+        schema={
+            "name": "psychologist name",
+            "phone": "phone number",
+            "email": "email address",
+            "website": "website URL"
+        },
+        max_pages=1
+    ),
+    DirectoryTestCase(
+        name="Y Combinator Companies",
+        url="https://www.ycombinator.com/companies/",
+        schema={
+            "name": "company name",
+            "description": "company description",
+            "website": "company website",
+            "batch": "YC batch (e.g., S21, W22)"
+        },
+        max_pages=1
+    ),
+    DirectoryTestCase(
+        name="Pennsylvania Health Services",
+        url="https://sais.health.pa.gov/commonpoc/content/publicweb/nhinformation2.asp?COUNTY=Allegheny",
+        schema={
+            "name": "facility name",
+            "address": "facility address",
+            "phone": "phone number",
+            "type": "facility type"
+        },
+        max_pages=1
+    ),
+    DirectoryTestCase(
+        name="Bay Area Psychology",
+        url="https://community.bapapsych.org/search/newsearch.asp?bst=&cdlGroupID=&txt_country=&txt_statelist=&txt_state=&ERR_LS_20250827_222102_27698=txt_state%7CLocation%7C20%7C0%7C%7C0",
+        schema={
+            "name": "psychologist name",
+            "phone": "phone number",
+            "email": "email address",
+            "specialty": "specialty area"
+        },
+        max_pages=1
+    )
+]
 
 
 def main():
     """Test all example directories."""
 
-    print("""
+    logger.info("""
 ╔══════════════════════════════════════════════════════════════════╗
 ║      GENERALIZED DIRECTORY SCRAPER - COMPREHENSIVE TEST          ║
 ╚══════════════════════════════════════════════════════════════════╝
@@ -68,136 +245,71 @@ def main():
 Testing scraper on 7 different directory formats...
     """)
 
-    test_cases = [
-        {
-            "name": "Berkeley Math Students",
-            "url": "https://math.berkeley.edu/people/graduate-students",
-            "schema": {
-                "name": "name of the student",
-                "email": "email address",
-                "page_url": "profile page URL"
-            },
-            "max_pages": 1
-        },
-        {
-            "name": "Stanford Engineering",
-            "url": "https://profiles.stanford.edu/browse/school-of-engineering?p=1&ps=100",
-            "schema": {
-                "name": "name of the person",
-                "email": "email address",
-                "page_url": "profile page URL",
-                "bio": "biography or research interests"
-            },
-            "max_pages": 2
-        },
-        {
-            "name": "San Diego Psychologists",
-            "url": "https://sdpsych.org/Find-a-Psychologist",
-            "schema": {
-                "name": "psychologist name",
-                "phone": "phone number",
-                "email": "email address",
-                "specialty": "area of specialty",
-                "location": "office location"
-            },
-            "max_pages": 1
-        },
-        {
-            "name": "Houston Psychology",
-            "url": "https://psychologyhouston.org/directory.php",
-            "schema": {
-                "name": "psychologist name",
-                "phone": "phone number",
-                "email": "email address",
-                "website": "website URL"
-            },
-            "max_pages": 1
-        },
-        {
-            "name": "Y Combinator Companies",
-            "url": "https://www.ycombinator.com/companies/",
-            "schema": {
-                "name": "company name",
-                "description": "company description",
-                "website": "company website",
-                "batch": "YC batch (e.g., S21, W22)"
-            },
-            "max_pages": 1
-        },
-        {
-            "name": "Pennsylvania Health Services",
-            "url": "https://sais.health.pa.gov/commonpoc/content/publicweb/nhinformation2.asp?COUNTY=Allegheny",
-            "schema": {
-                "name": "facility name",
-                "address": "facility address",
-                "phone": "phone number",
-                "type": "facility type"
-            },
-            "max_pages": 1
-        },
-        {
-            "name": "Bay Area Psychology",
-            "url": "https://community.bapapsych.org/search/newsearch.asp?bst=&cdlGroupID=&txt_country=&txt_statelist=&txt_state=&ERR_LS_20250827_222102_27698=txt_state%7CLocation%7C20%7C0%7C%7C0",
-            "schema": {
-                "name": "psychologist name",
-                "phone": "phone number",
-                "email": "email address",
-                "specialty": "specialty area"
-            },
-            "max_pages": 1
-        }
-    ]
-
     results_summary = []
 
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"\n\n[{i}/{len(test_cases)}] Starting test...")
+    # Tests run side by side; LIMITER spaces out starts on the same host and
+    # the scraper rate-limits its own requests to each site
+    with ThreadPoolExecutor(max_workers=len(TEST_CASES)) as executor:
+        futures = {
+            executor.submit(
+                test_directory,
+                name=test_case.name,
+                url=test_case.url,
+                field_schema=test_case.schema,
+                max_pages=test_case.max_pages
+            ): test_case
+            for test_case in TEST_CASES
+        }
+
+        for i, future in enumerate(as_completed(futures), 1):
+            test_case = futures[future]
+            _, success, elapsed, _ = future.result()
 
-        success = test_directory(
-            name=test_case["name"],
-            url=test_case["url"],
-            field_schema=test_case["schema"],
-            max_pages=test_case["max_pages"]
-        )
+            logger.info(f"\n[{i}/{len(TEST_CASES)}] Finished {test_case.name} in {elapsed:.2f}s")
 
-        results_summary.append({
-            "name": test_case["name"],
-            "url": test_case["url"],
-            "success": success
-        })
+            results_summary.append({
+                "name": test_case.name,
+                "url": test_case.url,
+                "success": success
+            })
 
-        # Be nice to servers - wait between tests
-        if i < len(test_cases):
-            print("\n\nWaiting 3 seconds before next test...")
-            time.sleep(3)
+    # Report in the order the tests are listed
+    order = [test_case.name for test_case in TEST_CASES]
+    results_summary.sort(key=lambda r: order.index(r["name"]))
 
     # Print summary
-    print("\n\n")
-    print("╔══════════════════════════════════════════════════════════════════╗")
-    print("║                      TEST SUMMARY                                ║")
-    print("╚══════════════════════════════════════════════════════════════════╝")
+    logger.info("\n\n")
+    logger.info("╔══════════════════════════════════════════════════════════════════╗")
+    logger.info("║                      TEST SUMMARY                                ║")
+    logger.info("╚══════════════════════════════════════════════════════════════════╝")
 
     successful = sum(1 for r in results_summary if r["success"])
     total = len(results_summary)
 
-    print(f"\nTotal Tests:     {total}")
-    print(f"Successful:      {successful}")
-    print(f"Failed:          {total - successful}")
-    print(f"Success Rate:    {successful/total*100:.1f}%")
+    logger.info(f"\nTotal Tests:     {total}")
+    logger.info(f"Successful:      {successful}")
+    logger.info(f"Failed:          {total - successful}")
+    logger.info(f"Success Rate:    {successful/total*100:.1f}%")
 
-    print("\n\nDetailed Results:")
-    print("-" * 70)
+    logger.info("\n\nDetailed Results:")
+    logger.info("-" * 70)
     for r in results_summary:
         status = "✓ PASS" if r["success"] else "✗ FAIL"
-        print(f"{status}  {r['name']}")
+        logger.info(f"{status}  {r['name']}")
 
-    print("\n\n" + "="*70)
+    logger.info("\n\n" + "="*70)
     if successful == total:
-        print("🎉 ALL TESTS PASSED!")
+        logger.info("🎉 ALL TESTS PASSED!")
     else:
-        print(f"⚠️  {total - successful} test(s) failed. Check errors above.")
-    print("="*70)
+        logger.info(f"⚠️  {total - successful} test(s) failed. Check errors above.")
+    logger.info("="*70)
 
 
 if __name__ == "__main__":
-    main()
+    listener = logging.handlers.QueueListener(_LOG_QUEUE, logging.StreamHandler(sys.stdout))
+    listener.start()
+    try:
+        main()
+    finally:
+        listener.stop()
+        SHARED_SESSION.close()
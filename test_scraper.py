@@ -1,7 +1,14 @@
 """Quick test script for the directory scraper."""
 
 import json
+import os
 from scraper import DirectoryScraper
+from scraper.utils import write_json
+
+# Set SCRAPER_TEST_CACHE_DIR to keep fetched pages for a day, so re-runs
+# while working on the analyzer skip the network
+CACHE_DIR = os.environ.get('SCRAPER_TEST_CACHE_DIR')
+CACHE_TTL = 86400
 
 
 def test_berkeley_math():
@@ -22,7 +29,9 @@ def test_berkeley_math():
         use_llm=False,
         max_workers=3,
         max_pages=1,  # Just test one page
-        verbose=True
+        verbose=True,
+        cache_dir=CACHE_DIR,
+        cache_ttl=CACHE_TTL
     )
 
     try:
@@ -37,8 +46,7 @@ def test_berkeley_math():
                 print(json.dumps(result, indent=2))
 
             # Save test results
-            with open("test_results.json", 'w') as f:
-                json.dump(results, f, indent=2)
+            write_json("test_results.json", results)
 
             print(f"\nTest results saved to test_results.json")
             return True
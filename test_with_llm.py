@@ -3,11 +3,21 @@
 
 import os
 import json
+import time
 from scraper import DirectoryScraper
+from scraper.utils import write_json
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Set SCRAPER_TEST_CACHE_DIR to keep fetched pages (and LLM replies) for a
+# day, so re-runs while working on extraction skip the network
+CACHE_DIR = os.environ.get('SCRAPER_TEST_CACHE_DIR')
+CACHE_TTL = 86400
+
+# Listing entries sent to the LLM per request
+LLM_BATCH_SIZE = 32
+
 # Test cases - focusing on ones that had high null rates
 TEST_CASES = [
     {
@@ -36,19 +46,99 @@ TEST_CASES = [
 
 def calculate_null_percentage(results, field_names):
     """Calculate percentage of null/empty fields."""
-    if not results:
+    total_fields = len(results) * len(field_names)
+    if total_fields == 0:
         return 100.0
 
-    total_fields = len(results) * len(field_names)
-    null_count = 0
+    # One pass over every cell, looking each value up once
+    null_count = sum(
+        1
+        for record in results
+        for field in field_names
+        if (value := record.get(field)) is None or (isinstance(value, str) and not value.strip())
+    )
+
+    return null_count / total_fields * 100
+
+def _run_once(scraper, use_llm, test_case):
+    """
+    Scrape one test case, with or without the LLM.
+
+    Returns:
+        Tuple of (results, null percentage, elapsed seconds, error message or None)
+    """
+    scraper.max_pages = test_case['max_pages']
+    start_time = time.time()
+
+    try:
+        results = scraper.scrape(test_case['url'], test_case['fields'], use_llm=use_llm)
+        return results, calculate_null_percentage(results, list(test_case['fields'].keys())), time.time() - start_time, None
+
+    except Exception as e:
+        return [], 100.0, time.time() - start_time, str(e)
+
+def _print_run(results, null_pct, elapsed, error):
+    """Print the outcome of one scrape."""
+    if error:
+        print(f"   ❌ Error: {error}")
+        return
+
+    print(f"   Records: {len(results)}")
+    print(f"   Null/Empty: {null_pct:.1f}%")
+    print(f"   Time: {elapsed:.2f}s ({len(results)/elapsed:.2f} records/second)")
+
+    # Show sample
+    if results:
+        print(f"   Sample: {json.dumps(results[0], indent=2)}")
 
-    for record in results:
-        for field in field_names:
-            value = record.get(field)
-            if value is None or (isinstance(value, str) and value.strip() == ""):
-                null_count += 1
+def _compare(scraper, test_case):
+    """Scrape one test case with and without the LLM and report the difference."""
+    print(f"\n{'─' * 80}")
+    print(f"Test: {test_case['name']}")
+    print(f"URL: {test_case['url']}")
+    print(f"{'─' * 80}\n")
+
+    # The runs share the scraper, so they take turns
+    results_no_llm, null_pct_no_llm, elapsed_no_llm, error_no_llm = _run_once(scraper, False, test_case)
+    results_with_llm, null_pct_with_llm, elapsed_with_llm, error_with_llm = _run_once(scraper, True, test_case)
+
+    print("🔹 WITHOUT LLM:")
+    _print_run(results_no_llm, null_pct_no_llm, elapsed_no_llm, error_no_llm)
+    print()
+    print("🔸 WITH LLM:")
+    _print_run(results_with_llm, null_pct_with_llm, elapsed_with_llm, error_with_llm)
+
+    # Comparison
+    print()
+    print("📊 COMPARISON:")
+    print(f"   Without LLM: {null_pct_no_llm:.1f}% null/empty")
+    print(f"   With LLM:    {null_pct_with_llm:.1f}% null/empty")
+
+    improvement = null_pct_no_llm - null_pct_with_llm
+    if improvement > 0:
+        print(f"   ✅ IMPROVEMENT: {improvement:.1f} percentage points better with LLM")
+    elif improvement < 0:
+        print(f"   ⚠️  REGRESSION: {abs(improvement):.1f} percentage points worse with LLM")
+    else:
+        print(f"   ➖ No change")
+
+    # Save results
+    output_file = f"{test_case['name'].lower().replace(' ', '_')}_llm_comparison.json"
+    write_json(output_file, {
+        'test_name': test_case['name'],
+        'without_llm': {
+            'records': len(results_no_llm),
+            'null_percentage': null_pct_no_llm,
+            'sample': results_no_llm[:3] if results_no_llm else []
+        },
+        'with_llm': {
+            'records': len(results_with_llm),
+            'null_percentage': null_pct_with_llm,
+            'sample': results_with_llm[:3] if results_with_llm else []
+        }
+    })
 
-    return (null_count / total_fields * 100) if total_fields > 0 else 100.0
+    print(f"   💾 Results saved to: {output_file}")
 
 def run_comparison():
     """Run scraper with and without LLM and compare."""
@@ -63,107 +153,21 @@ def run_comparison():
         print("❌ No OPENAI_API_KEY found in .env file")
         return
 
-    for test_case in TEST_CASES:
-        print(f"\n{'─' * 80}")
-        print(f"Test: {test_case['name']}")
-        print(f"URL: {test_case['url']}")
-        print(f"{'─' * 80}\n")
-
-        # Test WITHOUT LLM
-        print("🔹 Running WITHOUT LLM...")
-        scraper_no_llm = DirectoryScraper(
-            use_llm=False,
-            max_pages=test_case['max_pages'],
-            verbose=False
-        )
-
-        try:
-            results_no_llm = scraper_no_llm.scrape(
-                test_case['url'],
-                test_case['fields']
-            )
-            null_pct_no_llm = calculate_null_percentage(results_no_llm, list(test_case['fields'].keys()))
-
-            print(f"   Records: {len(results_no_llm)}")
-            print(f"   Null/Empty: {null_pct_no_llm:.1f}%")
-
-            # Show sample
-            if results_no_llm:
-                print(f"   Sample: {json.dumps(results_no_llm[0], indent=2)}")
-
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-            results_no_llm = []
-            null_pct_no_llm = 100.0
-
-        finally:
-            scraper_no_llm.close()
-
-        print()
-
-        # Test WITH LLM
-        print("🔸 Running WITH LLM...")
-        scraper_with_llm = DirectoryScraper(
-            use_llm=True,
-            llm_api_key=api_key,
-            max_pages=test_case['max_pages'],
-            verbose=False
-        )
-
-        try:
-            results_with_llm = scraper_with_llm.scrape(
-                test_case['url'],
-                test_case['fields']
-            )
-            null_pct_with_llm = calculate_null_percentage(results_with_llm, list(test_case['fields'].keys()))
-
-            print(f"   Records: {len(results_with_llm)}")
-            print(f"   Null/Empty: {null_pct_with_llm:.1f}%")
-
-            # Show sample
-            if results_with_llm:
-                print(f"   Sample: {json.dumps(results_with_llm[0], indent=2)}")
-
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-            results_with_llm = []
-            null_pct_with_llm = 100.0
-
-        finally:
-            scraper_with_llm.close()
-
-        # Comparison
-        print()
-        print("📊 COMPARISON:")
-        print(f"   Without LLM: {null_pct_no_llm:.1f}% null/empty")
-        print(f"   With LLM:    {null_pct_with_llm:.1f}% null/empty")
-
-        improvement = null_pct_no_llm - null_pct_with_llm
-        if improvement > 0:
-            print(f"   ✅ IMPROVEMENT: {improvement:.1f} percentage points better with LLM")
-        elif improvement < 0:
-            print(f"   ⚠️  REGRESSION: {abs(improvement):.1f} percentage points worse with LLM")
-        else:
-            print(f"   ➖ No change")
-
-        # Save results
-        output_file = f"{test_case['name'].lower().replace(' ', '_')}_llm_comparison.json"
-        with open(output_file, 'w') as f:
-            json.dump({
-                'test_name': test_case['name'],
-                'without_llm': {
-                    'records': len(results_no_llm),
-                    'null_percentage': null_pct_no_llm,
-                    'sample': results_no_llm[:3] if results_no_llm else []
-                },
-                'with_llm': {
-                    'records': len(results_with_llm),
-                    'null_percentage': null_pct_with_llm,
-                    'sample': results_with_llm[:3] if results_with_llm else []
-                }
-            }, f, indent=2)
-
-        print(f"   💾 Results saved to: {output_file}")
+    # One scraper serves every run, so its connections and LLM client are
+    # set up once and reused
+    scraper = DirectoryScraper(
+        llm_api_key=api_key,
+        verbose=False,
+        llm_batch_size=LLM_BATCH_SIZE,
+        cache_dir=CACHE_DIR,
+        cache_ttl=CACHE_TTL
+    )
+
+    try:
+        for test_case in TEST_CASES:
+            _compare(scraper, test_case)
+    finally:
+        scraper.close()
 
     print(f"\n{'=' * 80}")
     print("COMPARISON COMPLETE")
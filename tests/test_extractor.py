@@ -0,0 +1,22 @@
+import unittest
+from bs4 import BeautifulSoup
+from scraper.extractor import DataExtractor
+
+class TestExtractor(unittest.TestCase):
+    def test_address_split_across_indented_lines(self):
+        html = """
+        <div class="listing">
+            <h3>Jane Doe</h3>
+            <p>
+                based in
+                Palo Alto,
+                CA 94301
+            </p>
+        </div>
+        """
+        element = BeautifulSoup(html, 'lxml').find('div')
+        address = DataExtractor._extract_address(element)
+        self.assertEqual(' '.join(address.split()), 'Palo Alto, CA')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import asyncio
+import json
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from scraper.llm_extractor import LLMExtractor
+
+
+class FakeCompletions:
+    def __init__(self):
+        self.inflight = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        self.inflight += 1
+        self.peak = max(self.peak, self.inflight)
+        await asyncio.sleep(0.01)
+        self.inflight -= 1
+        prompt = kwargs['messages'][-1]['content']
+        names = [line.split('name=')[1] for line in prompt.splitlines() if 'name=' in line]
+        content = json.dumps({"results": [{"name": n} for n in names]})
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class FakeAsyncOpenAI:
+    completions = None
+
+    def __init__(self, **kwargs):
+        self.chat = SimpleNamespace(completions=FakeAsyncOpenAI.completions)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class TestLLMExtractor(unittest.TestCase):
+    def test_batches_run_concurrently_and_keep_order(self):
+        FakeAsyncOpenAI.completions = FakeCompletions()
+        extractor = LLMExtractor(api_key="test-key")
+        elements = [f"<div>name={i}</div>" for i in range(12)]
+
+        with patch('openai.AsyncOpenAI', FakeAsyncOpenAI):
+            results = extractor.extract_from_elements(elements, {"name": "Name"}, batch_size=2, max_inflight=3)
+
+        self.assertEqual([r["name"] for r in results], [str(i) for i in range(12)])
+        self.assertEqual(FakeAsyncOpenAI.completions.peak, 3)
+
+    def test_repeated_batches_served_from_cache(self):
+        FakeAsyncOpenAI.completions = FakeCompletions()
+        elements = [f"<div>name={i}</div>" for i in range(4)]
+
+        with tempfile.TemporaryDirectory() as cache_dir, patch('openai.AsyncOpenAI', FakeAsyncOpenAI):
+            extractor = LLMExtractor(api_key="test-key", cache_dir=cache_dir)
+            first = extractor.extract_from_elements(elements, {"name": "Name"}, batch_size=2)
+            second = extractor.extract_from_elements(elements, {"name": "Name"}, batch_size=2)
+
+        self.assertEqual(first, second)
+        self.assertEqual(FakeAsyncOpenAI.completions.calls, 2)
+
+    def test_streamed_fields_arrive_before_reply_ends(self):
+        reply = json.dumps({"name": "Jane Doe", "email": "jane@example.com", "phone": None})
+        chunks = [reply[i:i + 7] for i in range(0, len(reply), 7)]
+        sent = []
+
+        def stream(**kwargs):
+            for piece in chunks:
+                sent.append(piece)
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))])
+
+        extractor = LLMExtractor(api_key="test-key")
+        extractor.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=stream)))
+
+        fields = extractor.extract_from_html_stream("<p>Jane Doe</p>", {"name": "Name", "email": "Email", "phone": "Phone"})
+        self.assertEqual(next(fields), ("name", "Jane Doe"))
+        self.assertLess(len(sent), len(chunks))
+        self.assertEqual(dict(fields), {"email": "jane@example.com", "phone": None})
+
+        extractor.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=stream)))
+        self.assertEqual(extractor.extract_from_html("<p>Jane Doe</p>", {"name": "Name"}), json.loads(reply))
+
+    def test_duplicate_pages_reuse_response_in_memory(self):
+        calls = []
+
+        def stream(**kwargs):
+            calls.append(kwargs)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content='{"name": "Jane Doe"}'))])
+
+        extractor = LLMExtractor(api_key="test-key")
+        extractor.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=stream)))
+
+        first = extractor.extract_from_html("<div><p>Jane Doe</p></div>", {"name": "Name"})
+        first["name"] = "changed"
+        # Same text in different markup cleans to the same prompt
+        second = extractor.extract_from_html("<p>Jane Doe</p>", {"name": "Name"})
+
+        self.assertEqual(second, {"name": "Jane Doe"})
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,19 @@
+import asyncio
+import tempfile
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+import aiohttp
 import requests
+import urllib3
 from scraper.fetcher import ContentFetcher, FetchStrategy
 
 class TestResilience(unittest.TestCase):
     def setUp(self):
         self.fetcher = ContentFetcher()
+        # Retries back off for seconds; the tests only need the control flow
+        sleep_patch = patch('urllib3.util.retry.Retry.sleep', return_value=None)
+        sleep_patch.start()
+        self.addCleanup(sleep_patch.stop)
 
     @patch('requests.Session.get')
     def test_static_fetch_retry(self, mock_get):
@@ -27,20 +35,255 @@ class TestResilience(unittest.TestCase):
         
         # Test that we are using the session with retry adapter
         self.assertIsNotNone(self.fetcher.session.adapters.get('https://'))
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_static_fetch_retried_by_adapter(self):
+        with patch('urllib3.connectionpool.HTTPConnectionPool._make_request',
+                   side_effect=urllib3.exceptions.ProtocolError("Connection aborted.")) as mock_request:
+            self.assertIsNone(self.fetcher.fetch_static("http://example.com"))
+
+        # The first attempt plus Retry(total=3)
+        self.assertEqual(mock_request.call_count, 4)
+
+    def test_async_static_fetch_retries_then_succeeds(self):
+        attempts = []
+
+        class FakeResponse:
+            async def __aenter__(self):
+                attempts.append(1)
+                if len(attempts) < 3:
+                    raise aiohttp.ClientConnectionError("Connection reset")
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def raise_for_status(self):
+                pass
+
+            async def text(self):
+                return "<html>Recovered</html>"
+
+        session = MagicMock()
+        session.get.side_effect = lambda *args, **kwargs: FakeResponse()
+
+        with patch('scraper.fetcher.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            content = asyncio.run(self.fetcher.fetch_static_async(session, "http://example.com"))
+
+        self.assertEqual(content, "<html>Recovered</html>")
+        self.assertEqual(len(attempts), 3)
+        self.assertEqual([call.args[0] for call in mock_sleep.await_args_list], [1, 2])
 
     def test_user_agent_rotation(self):
         headers1 = self.fetcher._get_headers()
         headers2 = self.fetcher._get_headers()
-        
-        self.assertIn('User-Agent', headers1)
-        self.assertIn('User-Agent', headers2)
-        # It's possible they are the same due to random choice, but unlikely if we check multiple times
-        
-        agents = set()
-        for _ in range(20):
-            agents.add(self.fetcher._get_headers()['User-Agent'])
-            
-        self.assertGreater(len(agents), 1)
+
+        # Agents rotate in a fixed order, so consecutive requests differ
+        self.assertEqual(
+            [headers1['User-Agent'], headers2['User-Agent']],
+            ContentFetcher.USER_AGENTS[:2]
+        )
+
+    @patch('requests.Session.get')
+    def test_auto_static_page_skips_dynamic(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.content = ("<html><body><div id='content'>" + "<p>Static text</p>" * 100 + "</div></body></html>").encode()
+        mock_response.encoding = 'utf-8'
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        with patch.object(self.fetcher, 'fetch_dynamic') as mock_dynamic:
+            soup = self.fetcher.get_soup("http://example.com", strategy=FetchStrategy.AUTO)
+
+        mock_dynamic.assert_not_called()
+        self.assertEqual(len(soup.find_all('p')), 100)
+
+    def test_dynamic_fetches_share_one_event_loop(self):
+        loops = []
+
+        async def fake_fetch_dynamic(url):
+            loops.append(asyncio.get_running_loop())
+            return "<html>Rendered</html>"
+
+        with patch.object(self.fetcher, 'fetch_dynamic', side_effect=fake_fetch_dynamic):
+            self.assertEqual(self.fetcher.fetch("http://example.com/a", FetchStrategy.DYNAMIC), "<html>Rendered</html>")
+            self.assertEqual(self.fetcher.fetch("http://example.com/b", FetchStrategy.DYNAMIC), "<html>Rendered</html>")
+
+        self.assertIs(loops[0], loops[1])
+        self.fetcher.close()
+        self.assertTrue(loops[0].is_closed())
+
+    def test_fetch_dynamic_from_another_loop_uses_fetcher_browser(self):
+        launch_loops = []
+        page = MagicMock()
+        for name in ('goto', 'wait_for_timeout'):
+            setattr(page, name, AsyncMock())
+        page.content = AsyncMock(return_value="<html>Rendered</html>")
+        context = MagicMock(new_page=AsyncMock(return_value=page), route=AsyncMock(), close=AsyncMock())
+        browser = MagicMock(new_context=AsyncMock(return_value=context), close=AsyncMock())
+        browser.is_connected.return_value = True
+
+        async def launch(**kwargs):
+            launch_loops.append(asyncio.get_running_loop())
+            return browser
+
+        playwright = MagicMock(stop=AsyncMock())
+        playwright.chromium.launch = launch
+        starter = MagicMock(start=AsyncMock(return_value=playwright))
+
+        with patch('scraper.fetcher.async_playwright', return_value=starter):
+            content = asyncio.run(self.fetcher.fetch_dynamic("http://example.com"))
+            fetcher_loop = self.fetcher._loop
+            self.fetcher.close()
+
+        self.assertEqual(content, "<html>Rendered</html>")
+        # Launched on the fetcher's loop, not the one asyncio.run made, so
+        # close() could shut it down
+        self.assertEqual(launch_loops, [fetcher_loop])
+        browser.close.assert_awaited_once()
+        playwright.stop.assert_awaited_once()
+
+    def test_fetch_many_keeps_order_within_host_rate(self):
+        started = []
+
+        async def fake_fetch_static_async(session, url):
+            started.append(asyncio.get_running_loop().time())
+            return None if url.endswith('/bad') else f"<html>{url}</html>"
+
+        urls = [f"http://example.com/{i}" for i in range(3)] + ["http://example.com/bad"]
+        with patch.object(self.fetcher, 'fetch_static_async', side_effect=fake_fetch_static_async):
+            pages = self.fetcher.fetch_many(urls, rate=10)
+
+        self.assertEqual(pages, [f"<html>{url}</html>" for url in urls[:3]] + [None])
+        # Paced by the host's rate limiter like every other fetch path
+        self.assertGreaterEqual(max(started) - min(started), 0.29)
+        self.fetcher.close()
+
+    def test_fetch_dynamic_many_overlaps_renders_in_order(self):
+        inflight = []
+        peak = []
+
+        async def fake_fetch_dynamic(url):
+            inflight.append(url)
+            peak.append(len(inflight))
+            await asyncio.sleep(0.05)
+            inflight.remove(url)
+            return f"<html>{url}</html>"
+
+        urls = [f"http://example.com/{i}" for i in range(6)]
+        with patch.object(self.fetcher, 'fetch_dynamic', side_effect=fake_fetch_dynamic):
+            pages = self.fetcher.fetch_dynamic_many(urls, concurrency=3)
+
+        self.assertEqual(pages, [f"<html>{url}</html>" for url in urls])
+        self.assertEqual(max(peak), 3)
+        self.fetcher.close()
+
+    @patch('requests.Session.get')
+    def test_static_fetch_served_from_cache(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.content = b"<html>Cached</html>"
+        mock_response.encoding = 'utf-8'
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            fetcher = ContentFetcher(cache_dir=cache_dir)
+            self.assertEqual(fetcher.fetch_static("http://example.com"), "<html>Cached</html>")
+            self.assertEqual(fetcher.fetch_static("http://example.com"), "<html>Cached</html>")
+            fetcher.close()
+
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_shared_session_left_open(self):
+        session = requests.Session()
+        with patch.object(session, 'close') as mock_close:
+            fetcher = ContentFetcher(session=session)
+            self.assertIs(fetcher.session, session)
+            fetcher.close()
+        mock_close.assert_not_called()
+
+    def test_decode_response_without_declared_encoding(self):
+        response = requests.Response()
+        response._content = "<p>Café Zürich</p>".encode('utf-8')
+        self.assertEqual(ContentFetcher._decode_response(response), "<p>Café Zürich</p>")
+
+        response = requests.Response()
+        response._content = "<p>Café Zürich</p>".encode('cp1252')
+        self.assertEqual(ContentFetcher._decode_response(response), response.text)
+
+    def test_iter_soups_fetches_every_url(self):
+        async def fake_fetch_static_async(session, url):
+            if url.endswith('/bad'):
+                return None
+            return "<html><body>" + f"<p>{url}</p>" * 100 + "</body></html>"
+
+        urls = [f"http://example.com/{i}" for i in range(5)] + ["http://example.com/bad"]
+        with patch.object(self.fetcher, 'fetch_static_async', side_effect=fake_fetch_static_async):
+            pages = dict(self.fetcher.iter_soups(urls, FetchStrategy.STATIC, concurrency=2, rate=100))
+
+        self.assertEqual(set(pages), set(urls))
+        self.assertIsNone(pages["http://example.com/bad"])
+        self.assertEqual(pages["http://example.com/3"].p.get_text(), "http://example.com/3")
+        self.fetcher.close()
+
+    def test_iter_soups_rerenders_dynamic_pages_without_blocking(self):
+        async def fake_fetch_static_async(session, url):
+            if url.endswith('/spa'):
+                return "<html><body><div id='root'></div></body></html>"
+            return "<html><body>" + "<p>Static text</p>" * 100 + "</body></html>"
+
+        async def fake_fetch_dynamic(url):
+            await asyncio.sleep(0.2)
+            return "<html><body><p>Rendered</p></body></html>"
+
+        urls = ["http://example.com/spa"] + [f"http://example.com/{i}" for i in range(3)]
+        with patch.object(self.fetcher, 'fetch_static_async', side_effect=fake_fetch_static_async), \
+                patch.object(self.fetcher, 'fetch_dynamic', side_effect=fake_fetch_dynamic):
+            order = [(url, soup.p.get_text()) for url, soup in self.fetcher.iter_soups(urls, FetchStrategy.AUTO)]
+
+        self.assertEqual(order[-1], ("http://example.com/spa", "Rendered"))
+        self.assertEqual(len(order), 4)
+        self.fetcher.close()
+
+    def test_iter_soups_in_order_prefetches_a_few_pages(self):
+        requested = []
+
+        async def fake_fetch_static_async(session, url):
+            requested.append(url)
+            # Earlier pages finish last, yet are still yielded first
+            await asyncio.sleep(0.05 * (10 - int(url.rsplit('=', 1)[1])))
+            return "<html><body>" + f"<p>{url}</p>" * 100 + "</body></html>"
+
+        urls = [f"http://example.com/?page={i}" for i in range(1, 10)]
+        with patch.object(self.fetcher, 'fetch_static_async', side_effect=fake_fetch_static_async):
+            pages = self.fetcher.iter_soups_in_order(urls, FetchStrategy.STATIC, prefetch=2)
+            first = [next(pages) for _ in range(2)]
+            pages.close()
+
+        self.assertEqual([soup.p.get_text() for _, soup in first], urls[:2])
+        # Nothing past the window ahead of the consumer was requested
+        self.assertLessEqual(len(requested), 4)
+        self.fetcher.close()
+
+    def test_iterators_share_a_rate_limit_per_host(self):
+        started = []
+
+        async def fake_fetch_static_async(session, url):
+            started.append(asyncio.get_running_loop().time())
+            return "<html><body>" + f"<p>{url}</p>" * 100 + "</body></html>"
+
+        detail_urls = [f"http://example.com/people/{i}" for i in range(2)]
+        listing_urls = [f"http://example.com/?page={i}" for i in range(2, 4)]
+        with patch.object(self.fetcher, 'fetch_static_async', side_effect=fake_fetch_static_async):
+            details = self.fetcher.iter_soups(detail_urls, FetchStrategy.STATIC, rate=10)
+            next(details)
+            list(self.fetcher.iter_soups_in_order(listing_urls, FetchStrategy.STATIC, rate=10))
+            list(details)
+
+        # Four requests to one host, 0.1s apart, not two independent pairs
+        self.assertEqual(len(started), 4)
+        self.assertGreaterEqual(max(started) - min(started), 0.29)
+        self.fetcher.close()
 
 if __name__ == '__main__':
     unittest.main()